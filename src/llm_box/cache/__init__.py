@@ -28,6 +28,7 @@ from llm_box.cache.keys import (
     generate_cache_key,
     generate_file_key,
     generate_prompt_key,
+    generate_stat_key,
     parse_cache_key,
 )
 
@@ -42,5 +43,6 @@ __all__ = [
     "generate_cache_key",
     "generate_prompt_key",
     "generate_file_key",
+    "generate_stat_key",
     "parse_cache_key",
 ]
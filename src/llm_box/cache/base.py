@@ -88,6 +88,28 @@ class Cache(ABC):
         """
         pass
 
+    def set_many(self, entries: list[CacheEntry]) -> None:
+        """Store several entries in the cache.
+
+        The default implementation calls set() for each entry; backends
+        that can write in a single transaction should override it.
+
+        Args:
+            entries: The entries to store. Entries without a TTL use the
+                backend's default.
+        """
+        for entry in entries:
+            self.set(
+                key=entry.key,
+                command=entry.command,
+                provider=entry.provider,
+                model=entry.model,
+                response=entry.response,
+                tokens_used=entry.tokens_used,
+                ttl_seconds=entry.ttl_seconds,
+                metadata=entry.metadata or None,
+            )
+
     @abstractmethod
     def delete(self, key: str) -> bool:
         """Delete an entry from the cache.
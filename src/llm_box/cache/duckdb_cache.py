@@ -242,6 +242,52 @@ class DuckDBCache(Cache):
         except Exception as e:
             raise CacheError(f"Failed to set cache entry: {e}") from e
 
+    def set_many(self, entries: list[CacheEntry]) -> None:
+        """Store several entries in a single transaction.
+
+        Args:
+            entries: The entries to store. Entries without a TTL use the
+                default TTL.
+
+        Raises:
+            CacheError: If the cache is read-only or operation fails.
+        """
+        if self._read_only:
+            raise CacheError("Cannot write to read-only cache")
+
+        if not entries:
+            return
+
+        rows = [
+            [
+                entry.key,
+                entry.command,
+                entry.provider,
+                entry.model,
+                entry.response,
+                entry.tokens_used,
+                entry.created_at,
+                entry.ttl_seconds
+                if entry.ttl_seconds is not None
+                else self._default_ttl,
+                json.dumps(entry.metadata) if entry.metadata else None,
+            ]
+            for entry in entries
+        ]
+
+        try:
+            conn = self._ensure_connection()
+            conn.execute("BEGIN TRANSACTION")
+            try:
+                conn.executemany(self._INSERT_OR_REPLACE, rows)
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+
+        except Exception as e:
+            raise CacheError(f"Failed to set cache entries: {e}") from e
+
     def delete(self, key: str) -> bool:
         """Delete an entry from the cache.
 
@@ -148,6 +148,49 @@ def generate_file_key(
     )
 
 
+def generate_stat_key(
+    command: str,
+    provider: str,
+    model: str,
+    file_path: Path,
+    extra_params: dict[str, Any] | None = None,
+) -> str:
+    """Generate a cheap cache key from a file's stat fingerprint.
+
+    The key is built from the resolved path plus ``(st_size, st_mtime_ns,
+    st_ino)``, so it can be computed with a single ``stat()`` call and
+    without reading the file. It is meant as a first-level lookup in
+    front of a content-hash key: any write to the file changes the
+    fingerprint and falls through to the content key.
+
+    Args:
+        command: The command name.
+        provider: The LLM provider name.
+        model: The model name.
+        file_path: Path to the file being processed.
+        extra_params: Additional parameters to include in the key.
+
+    Returns:
+        A unique cache key string.
+
+    Raises:
+        OSError: If the file cannot be stat'ed.
+    """
+    stat = file_path.stat()
+    return generate_cache_key(
+        command=command,
+        provider=provider,
+        model=model,
+        extra_params={
+            "path": str(file_path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "ino": stat.st_ino,
+            **(extra_params or {}),
+        },
+    )
+
+
 def parse_cache_key(key: str) -> dict[str, str]:
     """Parse a cache key into its components.
 
@@ -29,7 +29,6 @@ from llm_box.commands import (  # noqa: F401
     TldrCommand,
     WhyCommand,
 )
-from llm_box.config import get_config
 
 # Create Typer app
 app = typer.Typer(
@@ -82,6 +81,8 @@ def config_cmd(
         console.print(str(get_config_path()))
         return
 
+    from llm_box.config import get_config
+
     config = get_config()
     console.print("[bold]llm-box configuration[/bold]\n")
     console.print(f"Config file: {get_config_path()}")
@@ -494,6 +495,7 @@ def tldr(
             model=model,
             no_cache=no_cache,
             verbose=verbose,
+            batch_cache_writes=True,
         )
 
         cmd = TldrCommand()
@@ -511,6 +513,7 @@ def tldr(
                 lines=lines,
                 format=output_format,
             )
+            ctx.flush_cache()
 
         if result.success:
             if result.cached:
@@ -551,6 +554,7 @@ def why_command(
             model=model,
             no_cache=no_cache,
             verbose=verbose,
+            batch_cache_writes=True,
         )
 
         cmd = WhyCommand()
@@ -568,6 +572,7 @@ def why_command(
                 context=context or "",
                 deep=deep,
             )
+            ctx.flush_cache()
 
         if result.success:
             if result.cached:
@@ -720,6 +725,8 @@ app.add_typer(cache_app, name="cache")
 @cache_app.command("stats")
 def cache_stats() -> None:
     """Show cache statistics."""
+    from llm_box.config import get_config
+
     config = get_config()
     cache = create_cache(config)
 
@@ -744,6 +751,8 @@ def cache_clear(
     force: bool = typer.Option(False, "--force", "-f", help="Skip confirmation."),
 ) -> None:
     """Clear cache entries."""
+    from llm_box.config import get_config
+
     config = get_config()
     cache = create_cache(config)
 
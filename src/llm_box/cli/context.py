@@ -5,19 +5,20 @@ CommandContext from CLI arguments and configuration.
 """
 
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from llm_box.cache import DuckDBCache
 from llm_box.cache.base import Cache, CacheEntry
 from llm_box.cli.options import FormatChoice, get_output_format, get_provider_type
 from llm_box.commands.base import CommandContext
-from llm_box.config import get_config
-from llm_box.config.schema import LLMBoxConfig
 from llm_box.output import get_formatter
 from llm_box.output.base import OutputFormatter
 from llm_box.providers.base import LLMBoxProvider, ProviderType
 from llm_box.providers.registry import ProviderRegistry
 
+if TYPE_CHECKING:
+    from llm_box.config.schema import LLMBoxConfig
+
 
 class NullCache(Cache):
     """A no-op cache implementation for when caching is disabled."""
@@ -73,7 +74,7 @@ class NullCache(Cache):
 def create_provider(
     provider_type: ProviderType,
     model: str | None = None,
-    config: LLMBoxConfig | None = None,
+    config: "LLMBoxConfig | None" = None,
 ) -> LLMBoxProvider:
     """Create an LLM provider from configuration.
 
@@ -86,6 +87,8 @@ def create_provider(
         Configured LLMBoxProvider instance.
     """
     if config is None:
+        from llm_box.config import get_config
+
         config = get_config()
 
     # Get provider-specific config and build kwargs
@@ -114,7 +117,7 @@ def create_provider(
     )
 
 
-def create_cache(config: LLMBoxConfig | None = None, enabled: bool = True) -> Cache:
+def create_cache(config: "LLMBoxConfig | None" = None, enabled: bool = True) -> Cache:
     """Create a cache instance from configuration.
 
     Args:
@@ -125,6 +128,8 @@ def create_cache(config: LLMBoxConfig | None = None, enabled: bool = True) -> Ca
         Cache instance (DuckDBCache or NullCache).
     """
     if config is None:
+        from llm_box.config import get_config
+
         config = get_config()
 
     if not enabled or not config.cache.enabled:
@@ -138,7 +143,7 @@ def create_cache(config: LLMBoxConfig | None = None, enabled: bool = True) -> Ca
 def create_formatter(
     format_choice: FormatChoice | None = None,
     verbose: bool = False,
-    config: LLMBoxConfig | None = None,
+    config: "LLMBoxConfig | None" = None,
 ) -> OutputFormatter:
     """Create an output formatter from configuration.
 
@@ -151,6 +156,8 @@ def create_formatter(
         Configured OutputFormatter instance.
     """
     if config is None:
+        from llm_box.config import get_config
+
         config = get_config()
 
     output_format = get_output_format(format_choice, config.output.default_format)
@@ -165,7 +172,8 @@ def create_context(
     no_cache: bool = False,
     verbose: bool = False,
     working_dir: Path | None = None,
-    config: LLMBoxConfig | None = None,
+    config: "LLMBoxConfig | None" = None,
+    batch_cache_writes: bool = False,
 ) -> CommandContext:
     """Create a CommandContext from CLI options.
 
@@ -180,6 +188,7 @@ def create_context(
         verbose: Whether to enable verbose output.
         working_dir: Working directory for file operations.
         config: Configuration to use. If None, uses global config.
+        batch_cache_writes: Queue cache writes until ctx.flush_cache().
 
     Returns:
         Fully configured CommandContext.
@@ -194,6 +203,8 @@ def create_context(
         result = command.execute(ctx, file="example.py")
     """
     if config is None:
+        from llm_box.config import get_config
+
         config = get_config()
 
     # Determine provider type
@@ -218,4 +229,5 @@ def create_context(
         use_cache=not no_cache,
         verbose=verbose,
         working_dir=working_dir or Path.cwd(),
+        pending_writes=[] if batch_cache_writes else None,
     )
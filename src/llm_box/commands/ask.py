@@ -191,4 +191,4 @@ Provide a clear, helpful answer. Use markdown formatting where appropriate.
 Include code examples if relevant."""
 
         response = ctx.provider.invoke(prompt)
-        return response.content if hasattr(response, "content") else str(response)
+        return response.content
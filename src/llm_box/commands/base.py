@@ -8,13 +8,15 @@ BaseCommand abstract class for command implementations.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from llm_box.cache.base import Cache
-from llm_box.config.schema import LLMBoxConfig
+from llm_box.cache.base import Cache, CacheEntry
 from llm_box.output.base import OutputData, OutputFormatter
 from llm_box.providers.base import LLMBoxProvider
 
+if TYPE_CHECKING:
+    from llm_box.config.schema import LLMBoxConfig
+
 
 @dataclass
 class CommandContext:
@@ -31,15 +33,35 @@ class CommandContext:
         use_cache: Whether to use caching for this invocation.
         verbose: Whether to show verbose output.
         working_dir: The working directory for file operations.
+        pending_writes: Cache entries queued by queue_cache_write(). If
+            None, writes go straight to the cache.
     """
 
     provider: LLMBoxProvider
     cache: Cache
     formatter: OutputFormatter
-    config: LLMBoxConfig
+    config: "LLMBoxConfig"
     use_cache: bool = True
     verbose: bool = False
     working_dir: Path = field(default_factory=Path.cwd)
+    pending_writes: list[CacheEntry] | None = None
+
+    def queue_cache_write(self, entry: CacheEntry) -> None:
+        """Queue a cache entry to be written by flush_cache().
+
+        Writes straight to the cache when this context is not batching
+        (pending_writes is None).
+        """
+        if self.pending_writes is None:
+            self.cache.set_many([entry])
+        else:
+            self.pending_writes.append(entry)
+
+    def flush_cache(self) -> None:
+        """Write all queued cache entries in one batch."""
+        if self.pending_writes:
+            self.cache.set_many(list(self.pending_writes))
+            self.pending_writes.clear()
 
     def with_provider(self, provider: LLMBoxProvider) -> "CommandContext":
         """Create a new context with a different provider."""
@@ -51,6 +73,7 @@ class CommandContext:
             use_cache=self.use_cache,
             verbose=self.verbose,
             working_dir=self.working_dir,
+            pending_writes=self.pending_writes,
         )
 
     def with_cache_disabled(self) -> "CommandContext":
@@ -63,6 +86,7 @@ class CommandContext:
             use_cache=False,
             verbose=self.verbose,
             working_dir=self.working_dir,
+            pending_writes=self.pending_writes,
         )
 
     def with_verbose(self, verbose: bool = True) -> "CommandContext":
@@ -75,6 +99,7 @@ class CommandContext:
             use_cache=self.use_cache,
             verbose=verbose,
             working_dir=self.working_dir,
+            pending_writes=self.pending_writes,
         )
 
 
@@ -250,4 +250,4 @@ Filename: {file_path.name}
 Provide well-structured, professional documentation that accurately describes the code."""
 
         response = ctx.provider.invoke(prompt)
-        return response.content if hasattr(response, "content") else str(response)
+        return response.content
@@ -4,13 +4,51 @@ This command reads a file and uses an LLM to provide a concise
 TL;DR summary of its contents.
 """
 
+import codecs
+import json
+import os
 from pathlib import Path
 from typing import Any
 
-from llm_box.cache import generate_cache_key
+from llm_box.cache import CacheEntry, generate_cache_key, generate_stat_key
 from llm_box.commands.base import BaseCommand, CommandContext, CommandResult
 from llm_box.commands.registry import CommandRegistry
-from llm_box.utils.hashing import hash_content
+from llm_box.utils.files import classify_file
+from llm_box.utils.hashing import read_and_hash, read_bytes
+
+# Maximum number of characters of file content sent to the LLM
+_MAX_PROMPT_CONTENT = 8000
+# Bytes read for the prompt: enough for one character past the limit even
+# if every character takes the 4 bytes UTF-8 allows, so truncation is seen
+_MAX_PROMPT_READ = 4 * (_MAX_PROMPT_CONTENT + 1)
+
+# Static instructions go first so the prompt prefix is identical across
+# calls (providers with automatic prompt caching can reuse it); the file
+# details follow at the end.
+_TLDR_INSTRUCTIONS = """TL;DR - Summarize the file below.
+
+Focus on:
+- The main purpose and functionality
+- Key components or features
+- Important patterns or techniques
+
+Be concise and direct. No preamble or explanation of the task."""
+
+# Prompts are assembled with a single str.join over these fragments
+_TLDR_PROMPT_HEAD = _TLDR_INSTRUCTIONS + "\n\n"
+_TRUNCATION_MARKER = "\n\n[... content truncated ...]"
+
+_TLDR_FORMAT_INSTRUCTIONS = {
+    "oneline": "Provide a single sentence summary.",
+    "paragraph": "Provide a concise paragraph (about {lines} sentences) summarizing the key points.",
+    "bullets": "Provide {lines} bullet points summarizing the key aspects.",
+}
+
+# Asks for every format at once (used when tldr.eager_formats is enabled)
+_TLDR_MULTI_INSTRUCTIONS = """Respond with only a JSON object with these keys:
+- "oneline": a single sentence summary.
+- "paragraph": a concise paragraph (about {lines} sentences) summarizing the key points.
+- "bullets": {lines} bullet points summarizing the key aspects, one per line."""
 
 
 @CommandRegistry.register
@@ -59,13 +97,46 @@ class TldrCommand(BaseCommand):
         except Exception as e:
             return CommandResult.fail(f"Invalid path: {e}")
 
-        # Read file contents
+        provider_name = ctx.provider.provider_type.value
+        model_name = ctx.provider.model_name
+        params = {"lines": lines, "format": output_format}
+
+        # Check the stat-fingerprint key first so unchanged files skip the
+        # full read + hash on a cache hit
+        fast_key = None
+        if ctx.use_cache:
+            try:
+                fast_key = generate_stat_key(
+                    "tldr", provider_name, model_name, file_path, params
+                )
+            except OSError:
+                fast_key = None
+            cached = ctx.cache.get(fast_key) if fast_key else None
+            if cached:
+                return CommandResult.ok(
+                    data=cached.response,
+                    cached=True,
+                    file=str(file_path),
+                    file_type=self._get_file_type(file_path),
+                    content_hash=cached.metadata.get("content_hash"),
+                    lines=lines,
+                    format=output_format,
+                )
+
+        # Read only the prefix the LLM will see (plus one character so
+        # truncation can still be detected). The content hash therefore
+        # covers that prefix: files differing only past it share a cache
+        # entry, which matches what the model is shown. The hash only feeds
+        # the cache key, so it is skipped entirely when caching is disabled.
         try:
-            content = self._read_file(file_path)
-            if content is None:
+            read = self._read_and_hash(
+                file_path, max_read=_MAX_PROMPT_READ, with_hash=ctx.use_cache
+            )
+            if read is None:
                 return CommandResult.fail(
                     f"Cannot read file (binary or too large): {file_str}"
                 )
+            content, content_hash = read
         except PermissionError:
             return CommandResult.fail(f"Permission denied: {file_str}")
         except Exception as e:
@@ -73,43 +144,64 @@ class TldrCommand(BaseCommand):
 
         # Get file metadata
         file_type = self._get_file_type(file_path)
-        content_hash = hash_content(content)
 
         # Check cache
-        cache_key = generate_cache_key(
-            command="tldr",
-            provider=ctx.provider.provider_type.value,
-            model=ctx.provider.model_name,
-            extra_params={
-                "file_hash": content_hash,
-                "lines": lines,
-                "format": output_format,
-            },
-        )
-
         cached = None
-        if ctx.use_cache:
-            cached = ctx.cache.get(cache_key)
+        if content_hash is not None:
+            cached = ctx.cache.get(
+                self._summary_cache_key(
+                    provider_name, model_name, content_hash, lines, output_format
+                )
+            )
 
         if cached:
             summary = cached.response
             from_cache = True
         else:
-            # Generate summary via LLM
-            summary = self._generate_summary(
-                ctx, file_path, content, file_type, lines, output_format
-            )
+            # Generate summary via LLM. With eager_formats, a single call
+            # produces every format so a later run with a different --format
+            # is a cache hit.
+            summaries: dict[str, str] = {}
+            if ctx.use_cache and ctx.config.tldr.eager_formats:
+                summaries = self._generate_summary_multi(
+                    ctx, file_path, content, file_type, lines
+                )
+            if not summaries.get(output_format):
+                summaries[output_format] = self._generate_summary(
+                    ctx, file_path, content, file_type, lines, output_format
+                )
+            summary = summaries[output_format]
             from_cache = False
 
-            # Cache the summary
-            if ctx.use_cache and summary:
-                ctx.cache.set(
-                    key=cache_key,
+            # Cache the summaries
+            if content_hash is not None:
+                for fmt, text in summaries.items():
+                    if not text:
+                        continue
+                    ctx.queue_cache_write(
+                        CacheEntry(
+                            key=self._summary_cache_key(
+                                provider_name, model_name, content_hash, lines, fmt
+                            ),
+                            command="tldr",
+                            provider=provider_name,
+                            model=model_name,
+                            response=text,
+                        )
+                    )
+
+        # Point the stat-fingerprint key at the same response
+        if fast_key and summary:
+            ctx.queue_cache_write(
+                CacheEntry(
+                    key=fast_key,
                     command="tldr",
-                    provider=ctx.provider.provider_type.value,
-                    model=ctx.provider.model_name,
+                    provider=provider_name,
+                    model=model_name,
                     response=summary,
+                    metadata={"content_hash": content_hash},
                 )
+            )
 
         return CommandResult.ok(
             data=summary,
@@ -121,77 +213,99 @@ class TldrCommand(BaseCommand):
             format=output_format,
         )
 
-    def _read_file(self, file_path: Path, max_size: int = 100_000) -> str | None:
-        """Read file contents, returning None for binary or oversized files."""
+    def _read_file(
+        self,
+        file_path: Path,
+        max_size: int = 100_000,
+        max_read: int | None = None,
+    ) -> str | None:
+        """Read file contents, returning None for binary or oversized files.
+
+        If ``max_read`` is given, only that many bytes are read and decoded
+        from the start of the file.
+        """
+        result = self._read_and_hash(file_path, max_size, max_read, with_hash=False)
+        return None if result is None else result[0]
+
+    def _read_and_hash(
+        self,
+        file_path: Path,
+        max_size: int = 100_000,
+        max_read: int | None = None,
+        with_hash: bool = True,
+    ) -> tuple[str, str | None] | None:
+        """Read file contents and hash the bytes read in the same pass.
+
+        Returns:
+            Tuple of (decoded content, content hash), or None for binary or
+            oversized files. The hash is None when ``with_hash`` is False.
+        """
         try:
-            size = file_path.stat().st_size
+            size = os.stat(file_path).st_size
             if size > max_size:
                 return None
         except OSError:
             return None
 
-        binary_extensions = {
-            ".exe", ".dll", ".so", ".dylib", ".bin", ".dat",
-            ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp",
-            ".mp3", ".wav", ".ogg", ".flac", ".aac",
-            ".mp4", ".avi", ".mkv", ".mov", ".webm",
-            ".zip", ".tar", ".gz", ".bz2", ".xz", ".7z", ".rar",
-            ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-            ".pyc", ".pyo", ".class", ".o", ".a",
-        }
-
-        if file_path.suffix.lower() in binary_extensions:
+        if classify_file(file_path)[1]:
             return None
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            try:
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    return f.read()
-            except Exception:
-                return None
+        # Read the bytes once and decode leniently instead of retrying the
+        # whole read on a UnicodeDecodeError
+        content_hash = None
+        if with_hash:
+            data, content_hash = read_and_hash(file_path, max_read)
+        else:
+            data = read_bytes(file_path, max_read)
+        if max_read is not None and len(data) == max_read:
+            # Drop a multi-byte character split by the read limit
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            return decoder.decode(data, final=False), content_hash
+        return data.decode("utf-8", errors="replace"), content_hash
 
     def _get_file_type(self, file_path: Path) -> str:
         """Determine file type from extension."""
-        ext_map = {
-            ".py": "Python",
-            ".js": "JavaScript",
-            ".ts": "TypeScript",
-            ".jsx": "React JSX",
-            ".tsx": "React TSX",
-            ".java": "Java",
-            ".c": "C",
-            ".cpp": "C++",
-            ".cc": "C++",
-            ".h": "C header",
-            ".hpp": "C++ header",
-            ".go": "Go",
-            ".rs": "Rust",
-            ".rb": "Ruby",
-            ".php": "PHP",
-            ".swift": "Swift",
-            ".kt": "Kotlin",
-            ".scala": "Scala",
-            ".sh": "Shell script",
-            ".bash": "Bash script",
-            ".zsh": "Zsh script",
-            ".sql": "SQL",
-            ".html": "HTML",
-            ".css": "CSS",
-            ".scss": "SCSS",
-            ".less": "Less",
-            ".json": "JSON",
-            ".yaml": "YAML",
-            ".yml": "YAML",
-            ".toml": "TOML",
-            ".xml": "XML",
-            ".md": "Markdown",
-            ".rst": "reStructuredText",
-            ".txt": "text",
-        }
-        return ext_map.get(file_path.suffix.lower(), "text")
+        return classify_file(file_path)[0] or "text"
+
+    @staticmethod
+    def _summary_cache_key(
+        provider: str, model: str, content_hash: str, lines: int, output_format: str
+    ) -> str:
+        """Build the content-hash cache key for one summary format."""
+        return generate_cache_key(
+            command="tldr",
+            provider=provider,
+            model=model,
+            extra_params={
+                "file_hash": content_hash,
+                "lines": lines,
+                "format": output_format,
+            },
+        )
+
+    def _build_prompt(
+        self, file_path: Path, content: str, file_type: str, instruction: str
+    ) -> str:
+        """Build a summary prompt with the static instructions first."""
+        # Truncate content if too long
+        truncated = len(content) > _MAX_PROMPT_CONTENT
+        if truncated:
+            content = content[:_MAX_PROMPT_CONTENT]
+
+        return "".join(
+            [
+                _TLDR_PROMPT_HEAD,
+                instruction,
+                "\n\nFile type: ",
+                file_type,
+                "\nFilename: ",
+                file_path.name,
+                "\n\n```\n",
+                content,
+                _TRUNCATION_MARKER if truncated else "",
+                "\n```",
+            ]
+        )
 
     def _generate_summary(
         self,
@@ -203,35 +317,52 @@ class TldrCommand(BaseCommand):
         output_format: str,
     ) -> str:
         """Generate summary using LLM."""
-        # Truncate content if too long
-        max_content = 8000
-        if len(content) > max_content:
-            content = content[:max_content] + "\n\n[... content truncated ...]"
-
         # Build format instructions
-        if output_format == "oneline":
-            format_instruction = "Provide a single sentence summary."
-        elif output_format == "paragraph":
-            format_instruction = f"Provide a concise paragraph (about {lines} sentences) summarizing the key points."
-        else:  # bullets
-            format_instruction = f"Provide {lines} bullet points summarizing the key aspects."
-
-        prompt = f"""TL;DR - Summarize this {file_type} file.
-
-Filename: {file_path.name}
-
-```
-{content}
-```
+        format_instruction = _TLDR_FORMAT_INSTRUCTIONS.get(
+            output_format, _TLDR_FORMAT_INSTRUCTIONS["bullets"]
+        ).format(lines=lines)
 
-{format_instruction}
-
-Focus on:
-- The main purpose and functionality
-- Key components or features
-- Important patterns or techniques
+        prompt = self._build_prompt(file_path, content, file_type, format_instruction)
+        response = ctx.provider.invoke(prompt)
+        return response.content
 
-Be concise and direct. No preamble or explanation of the task."""
+    def _generate_summary_multi(
+        self,
+        ctx: CommandContext,
+        file_path: Path,
+        content: str,
+        file_type: str,
+        lines: int,
+    ) -> dict[str, str]:
+        """Generate every summary format with a single LLM call.
 
+        Returns:
+            Mapping of format name to summary. Formats missing from the
+            response (or all of them, if it is not valid JSON) are omitted.
+        """
+        instruction = _TLDR_MULTI_INSTRUCTIONS.format(lines=lines)
+        prompt = self._build_prompt(file_path, content, file_type, instruction)
         response = ctx.provider.invoke(prompt)
-        return response.content if hasattr(response, "content") else str(response)
+        return _parse_multi_summary(response.content)
+
+
+def _parse_multi_summary(text: str) -> dict[str, str]:
+    """Extract per-format summaries from a JSON object in an LLM response."""
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end < start:
+        return {}
+    try:
+        data = json.loads(text[start : end + 1])
+    except ValueError:
+        return {}
+    if not isinstance(data, dict):
+        return {}
+
+    summaries = {}
+    for fmt in _TLDR_FORMAT_INSTRUCTIONS:
+        value = data.get(fmt)
+        if isinstance(value, list):
+            value = "\n".join(f"- {item}" for item in value)
+        if isinstance(value, str) and value.strip():
+            summaries[fmt] = value.strip()
+    return summaries
@@ -4,14 +4,77 @@ This command uses an LLM to analyze a file or directory and explain
 its purpose within the context of the project.
 """
 
+import codecs
 import contextlib
+import heapq
+import os
 from pathlib import Path
 from typing import Any
 
-from llm_box.cache import generate_cache_key
+from llm_box.cache import CacheEntry, generate_cache_key, generate_stat_key
 from llm_box.commands.base import BaseCommand, CommandContext, CommandResult
 from llm_box.commands.registry import CommandRegistry
-from llm_box.utils.hashing import hash_content
+from llm_box.utils.files import classify_file
+from llm_box.utils.hashing import hash_content, read_bytes
+
+# Maximum number of characters of file content included in the prompt
+_MAX_PREVIEW_CHARS = 3000
+# Bytes read for the preview: enough for the full character budget even if
+# every character takes the 4 bytes UTF-8 allows
+_MAX_PREVIEW_READ = 4 * _MAX_PREVIEW_CHARS
+
+# Maximum number of README characters included in directory context
+_README_PREVIEW_CHARS = 500
+
+# README variants, in order of preference
+_README_NAMES = ("README.md", "README.rst", "README.txt", "README")
+
+# Files that identify a project's build or package system
+_PACKAGE_FILES = (
+    "pyproject.toml",
+    "setup.py",
+    "package.json",
+    "Cargo.toml",
+    "go.mod",
+    "pom.xml",
+    "build.gradle",
+    "Makefile",
+)
+
+_PROJECT_FILE_NAMES = frozenset(_README_NAMES + _PACKAGE_FILES)
+
+# Static instructions go first so the prompt prefix is identical across
+# calls (providers with automatic prompt caching can reuse it); the
+# gathered context follows at the end.
+_WHY_INSTRUCTIONS = """Explain why this {path_type} exists and what purpose it serves.
+
+Answer the question: "Why does this {path_type} exist?"
+
+Focus on:
+1. The purpose and role of this {path_type}
+2. How it fits into the project structure
+3. What problem it solves or what functionality it provides"""
+
+_WHY_DEEP_INSTRUCTIONS = """
+4. How it interacts with other parts of the project
+5. Common patterns or conventions it follows
+6. Any architectural or design decisions it reflects"""
+
+_WHY_STYLE = "Be concise but informative. Use markdown formatting."
+
+# Static prompt heads keyed by (is_directory, deep), built once at import
+_WHY_PROMPT_HEADS = {
+    (is_directory, deep): "".join(
+        [
+            _WHY_INSTRUCTIONS.format(path_type="directory" if is_directory else "file"),
+            _WHY_DEEP_INSTRUCTIONS if deep else "",
+            "\n\n",
+            _WHY_STYLE,
+        ]
+    )
+    for is_directory in (False, True)
+    for deep in (False, True)
+}
 
 
 @CommandRegistry.register
@@ -59,6 +122,37 @@ class WhyCommand(BaseCommand):
             return CommandResult.fail(f"Invalid path: {e}")
 
         is_directory = target_path.is_dir()
+        provider_name = ctx.provider.provider_type.value
+        model_name = ctx.provider.model_name
+        params = {"deep": deep, "context": project_context}
+
+        # For files, check the stat-fingerprint key first so unchanged files
+        # skip the read + hash on a cache hit. The parent's mtime is part of
+        # the fingerprint because the sibling listing goes into the prompt.
+        fast_key = None
+        if ctx.use_cache and not is_directory:
+            try:
+                fast_key = generate_stat_key(
+                    "why",
+                    provider_name,
+                    model_name,
+                    target_path,
+                    {
+                        "parent_mtime_ns": target_path.parent.stat().st_mtime_ns,
+                        **params,
+                    },
+                )
+            except OSError:
+                fast_key = None
+            cached = ctx.cache.get(fast_key) if fast_key else None
+            if cached:
+                return CommandResult.ok(
+                    data=cached.response,
+                    cached=True,
+                    path=str(target_path),
+                    is_directory=False,
+                    **cached.metadata,
+                )
 
         # Gather context
         if is_directory:
@@ -69,20 +163,19 @@ class WhyCommand(BaseCommand):
         if context_info is None:
             return CommandResult.fail(f"Cannot analyze path: {path_str}")
 
-        # Generate cache key
-        cache_key = generate_cache_key(
-            command="why",
-            provider=ctx.provider.provider_type.value,
-            model=ctx.provider.model_name,
-            extra_params={
-                "path_hash": hash_content(context_info["content_summary"]),
-                "deep": deep,
-                "context": project_context,
-            },
-        )
-
+        # Generate cache key (skipped, with its hash, when caching is off)
+        cache_key = None
         cached = None
         if ctx.use_cache:
+            cache_key = generate_cache_key(
+                command="why",
+                provider=provider_name,
+                model=model_name,
+                extra_params={
+                    "path_hash": hash_content(context_info["content_summary"]),
+                    **params,
+                },
+            )
             cached = ctx.cache.get(cache_key)
 
         if cached:
@@ -96,14 +189,29 @@ class WhyCommand(BaseCommand):
             from_cache = False
 
             # Cache the explanation
-            if ctx.use_cache and explanation:
-                ctx.cache.set(
-                    key=cache_key,
+            if cache_key and explanation:
+                ctx.queue_cache_write(
+                    CacheEntry(
+                        key=cache_key,
+                        command="why",
+                        provider=provider_name,
+                        model=model_name,
+                        response=explanation,
+                    )
+                )
+
+        # Point the stat-fingerprint key at the same response
+        if fast_key and explanation:
+            ctx.queue_cache_write(
+                CacheEntry(
+                    key=fast_key,
                     command="why",
-                    provider=ctx.provider.provider_type.value,
-                    model=ctx.provider.model_name,
+                    provider=provider_name,
+                    model=model_name,
                     response=explanation,
+                    metadata=context_info.get("metadata", {}),
                 )
+            )
 
         return CommandResult.ok(
             data=explanation,
@@ -116,39 +224,44 @@ class WhyCommand(BaseCommand):
     def _gather_directory_context(self, dir_path: Path) -> dict[str, Any] | None:
         """Gather context about a directory."""
         try:
-            # List files in the directory
+            # List files in the directory. DirEntry caches the file type from
+            # the directory read, so this avoids a stat() per entry. README
+            # and package files are picked out of the same pass.
             files = []
             dirs = []
-            for item in dir_path.iterdir():
-                if item.name.startswith("."):
-                    continue
-                if item.is_dir():
-                    dirs.append(item.name)
-                else:
-                    files.append(item.name)
-
-            # Look for common project files
+            found_names = set()
+            with os.scandir(dir_path) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith("."):
+                        continue
+                    if name in _PROJECT_FILE_NAMES:
+                        found_names.add(name)
+                    if entry.is_dir():
+                        dirs.append(name)
+                    else:
+                        files.append(name)
+
+            # Use the first README variant present, in preference order
             readme = None
-            for readme_name in ["README.md", "README.rst", "README.txt", "README"]:
-                readme_path = dir_path / readme_name
-                if readme_path.exists():
-                    with contextlib.suppress(Exception):
-                        readme = readme_path.read_text(encoding="utf-8")[:2000]
+            for readme_name in _README_NAMES:
+                if readme_name in found_names:
+                    with (
+                        contextlib.suppress(Exception),
+                        open(dir_path / readme_name, encoding="utf-8") as f,
+                    ):
+                        readme = f.read(_README_PREVIEW_CHARS)
                     break
 
-            # Look for package files
-            package_files = []
-            for pkg_file in ["pyproject.toml", "setup.py", "package.json", "Cargo.toml",
-                            "go.mod", "pom.xml", "build.gradle", "Makefile"]:
-                if (dir_path / pkg_file).exists():
-                    package_files.append(pkg_file)
+            # Package files, in the order they are listed
+            package_files = [name for name in _PACKAGE_FILES if name in found_names]
 
             content_summary = f"""
 Directory: {dir_path.name}
-Files: {', '.join(sorted(files)[:20])}
-Subdirectories: {', '.join(sorted(dirs)[:10])}
-Package files: {', '.join(package_files)}
-README preview: {readme[:500] if readme else 'None'}
+Files: {", ".join(heapq.nsmallest(20, files))}
+Subdirectories: {", ".join(heapq.nsmallest(10, dirs))}
+Package files: {", ".join(package_files)}
+README preview: {readme if readme else "None"}
 """
             return {
                 "content_summary": content_summary,
@@ -165,30 +278,39 @@ README preview: {readme[:500] if readme else 'None'}
     def _gather_file_context(self, file_path: Path) -> dict[str, Any] | None:
         """Gather context about a file."""
         try:
-            # Read file content
-            content = self._read_file(file_path)
+            # Read only the preview that goes into the prompt
+            content = self._read_file(file_path, max_read=_MAX_PREVIEW_READ)
             if content is None:
                 # For binary files, just use metadata
                 content = "[Binary file - content not readable]"
+            else:
+                content = content[:_MAX_PREVIEW_CHARS]
 
             # Get parent directory context
             parent = file_path.parent
-            siblings = [f.name for f in parent.iterdir()
-                       if f.is_file() and not f.name.startswith(".")][:10]
+            extension = file_path.suffix
+            siblings: list[str] = []
+            with os.scandir(parent) as entries:
+                for entry in entries:
+                    if entry.name.startswith(".") or not entry.is_file():
+                        continue
+                    siblings.append(entry.name)
+                    if len(siblings) == 10:
+                        break
 
             content_summary = f"""
 File: {file_path.name}
-Extension: {file_path.suffix}
+Extension: {extension}
 Parent directory: {parent.name}
-Sibling files: {', '.join(siblings)}
+Sibling files: {", ".join(siblings)}
 
 File content preview:
-{content[:3000]}
+{content}
 """
             return {
                 "content_summary": content_summary,
                 "metadata": {
-                    "extension": file_path.suffix,
+                    "extension": extension,
                     "parent": parent.name,
                     "sibling_count": len(siblings),
                 },
@@ -196,37 +318,35 @@ File content preview:
         except Exception:
             return None
 
-    def _read_file(self, file_path: Path, max_size: int = 50_000) -> str | None:
-        """Read file contents."""
+    def _read_file(
+        self,
+        file_path: Path,
+        max_size: int = 50_000,
+        max_read: int | None = None,
+    ) -> str | None:
+        """Read file contents.
+
+        If ``max_read`` is given, only that many bytes are read and decoded
+        from the start of the file.
+        """
         try:
-            size = file_path.stat().st_size
+            size = os.stat(file_path).st_size
             if size > max_size:
                 return None
         except OSError:
             return None
 
-        binary_extensions = {
-            ".exe", ".dll", ".so", ".dylib", ".bin", ".dat",
-            ".png", ".jpg", ".jpeg", ".gif", ".bmp", ".ico", ".webp",
-            ".mp3", ".wav", ".ogg", ".flac", ".aac",
-            ".mp4", ".avi", ".mkv", ".mov", ".webm",
-            ".zip", ".tar", ".gz", ".bz2", ".xz", ".7z", ".rar",
-            ".pdf", ".doc", ".docx", ".xls", ".xlsx", ".ppt", ".pptx",
-            ".pyc", ".pyo", ".class", ".o", ".a",
-        }
-
-        if file_path.suffix.lower() in binary_extensions:
+        if classify_file(file_path)[1]:
             return None
 
-        try:
-            with open(file_path, encoding="utf-8") as f:
-                return f.read()
-        except UnicodeDecodeError:
-            try:
-                with open(file_path, encoding="utf-8", errors="ignore") as f:
-                    return f.read()
-            except Exception:
-                return None
+        # Read the bytes once and decode leniently instead of retrying the
+        # whole read on a UnicodeDecodeError
+        data = read_bytes(file_path, max_read)
+        if max_read is not None and len(data) == max_read:
+            # Drop a multi-byte character split by the read limit
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            return decoder.decode(data, final=False)
+        return data.decode("utf-8", errors="replace")
 
     def _generate_explanation(
         self,
@@ -238,28 +358,11 @@ File content preview:
         project_context: str,
     ) -> str:
         """Generate explanation using LLM."""
-        path_type = "directory" if is_directory else "file"
-
-        base_prompt = f"""Explain why this {path_type} exists and what purpose it serves.
-
-{context_info['content_summary']}
-
-{"Additional project context: " + project_context if project_context else ""}
-
-Answer the question: "Why does this {path_type} exist?"
-
-Focus on:
-1. The purpose and role of this {path_type}
-2. How it fits into the project structure
-3. What problem it solves or what functionality it provides"""
-
-        if deep:
-            base_prompt += """
-4. How it interacts with other parts of the project
-5. Common patterns or conventions it follows
-6. Any architectural or design decisions it reflects"""
-
-        base_prompt += "\n\nBe concise but informative. Use markdown formatting."
+        parts = [_WHY_PROMPT_HEADS[is_directory, deep], "\n\n"]
+        if project_context:
+            parts += ["Additional project context: ", project_context]
+        parts += ["\n\n", context_info["content_summary"]]
+        base_prompt = "".join(parts)
 
         response = ctx.provider.invoke(base_prompt)
-        return response.content if hasattr(response, "content") else str(response)
+        return response.content
@@ -1,6 +1,33 @@
-"""Configuration management."""
+"""Configuration management.
 
-from llm_box.config.loader import get_config, load_config, reset_config
-from llm_box.config.schema import LLMBoxConfig
+The loader and Pydantic schema are imported on first attribute access, so
+importing this package (e.g. for ``--help`` or ``--version``) does not
+build the config models.
+"""
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from llm_box.config.loader import get_config, load_config, reset_config
+    from llm_box.config.schema import LLMBoxConfig
 
 __all__ = ["LLMBoxConfig", "get_config", "load_config", "reset_config"]
+
+# Public name -> module that defines it
+_LAZY_ATTRS = {
+    "LLMBoxConfig": "llm_box.config.schema",
+    "get_config": "llm_box.config.loader",
+    "load_config": "llm_box.config.loader",
+    "reset_config": "llm_box.config.loader",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import configuration objects on first access."""
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
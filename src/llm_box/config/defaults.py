@@ -1,5 +1,6 @@
 """Default configuration values and paths."""
 
+import os
 from pathlib import Path
 from typing import Final
 
@@ -13,6 +14,7 @@ DEFAULT_CONFIG_FILE: Final[Path] = DEFAULT_CONFIG_DIR / "config.toml"
 DEFAULT_CACHE_DB: Final[Path] = DEFAULT_CACHE_DIR / "cache.duckdb"
 DEFAULT_LOG_FILE: Final[Path] = DEFAULT_CACHE_DIR / "llm-box.log"
 DEFAULT_TELEMETRY_FILE: Final[Path] = DEFAULT_CACHE_DIR / "telemetry.jsonl"
+DEFAULT_CONFIG_CACHE: Final[Path] = DEFAULT_CACHE_DIR / "config.cache.pkl"
 
 # Environment variable names
 ENV_CONFIG_PATH: Final[str] = "LLMBOX_CONFIG"
@@ -21,6 +23,7 @@ ENV_LOG_LEVEL: Final[str] = "LLMBOX_LOG_LEVEL"
 ENV_DEFAULT_PROVIDER: Final[str] = "LLMBOX_PROVIDER"
 ENV_DEFAULT_MODEL: Final[str] = "LLMBOX_MODEL"
 ENV_NO_CACHE: Final[str] = "LLMBOX_NO_CACHE"
+ENV_MOCK_NO_HISTORY: Final[str] = "LLMBOX_MOCK_NO_HISTORY"
 
 # Provider environment variables
 ENV_OPENAI_API_KEY: Final[str] = "OPENAI_API_KEY"
@@ -66,6 +69,9 @@ semantic_weight = 0.6
 fuzzy_weight = 0.4
 default_top_k = 10
 
+[tldr]
+eager_formats = false  # One LLM call caches bullets, paragraph and oneline
+
 [output]
 default_format = "rich"
 show_cached_indicator = true
@@ -94,8 +100,6 @@ def ensure_directories() -> None:
 
 def get_config_path() -> Path:
     """Get the configuration file path."""
-    import os
-
     env_path = os.environ.get(ENV_CONFIG_PATH)
     if env_path:
         return Path(env_path)
@@ -104,8 +108,6 @@ def get_config_path() -> Path:
 
 def get_cache_path() -> Path:
     """Get the cache database path."""
-    import os
-
     env_path = os.environ.get(ENV_CACHE_PATH)
     if env_path:
         return Path(env_path)
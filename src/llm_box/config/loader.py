@@ -2,9 +2,15 @@
 
 import contextlib
 import os
+import pickle
+import tempfile
 from pathlib import Path
+from typing import Any
 
+from llm_box import __version__
+from llm_box.config import schema
 from llm_box.config.defaults import (
+    DEFAULT_CONFIG_CACHE,
     DEFAULT_CONFIG_TOML,
     ENV_ANTHROPIC_API_KEY,
     ENV_DEFAULT_MODEL,
@@ -19,9 +25,21 @@ from llm_box.config.defaults import (
 from llm_box.config.schema import LLMBoxConfig, ProviderType
 from llm_box.exceptions import ConfigError, ConfigValidationError
 
+# Use Python 3.11+ tomllib or fallback
+try:
+    import tomllib
+except ImportError:
+    try:
+        import tomli as tomllib
+    except ImportError:
+        tomllib = None
+
 # Global config instance (singleton)
 _config: LLMBoxConfig | None = None
 
+# Bump when the pickled config cache format changes
+_CONFIG_CACHE_VERSION = 1
+
 
 def load_config(
     config_path: Path | None = None,
@@ -41,16 +59,8 @@ def load_config(
         ConfigError: If configuration cannot be loaded.
         ConfigValidationError: If configuration is invalid.
     """
-    # Use Python 3.11+ tomllib or fallback
-    try:
-        import tomllib
-    except ImportError:
-        try:
-            import tomli as tomllib
-        except ImportError as err:
-            raise ConfigError(
-                "tomllib not available. Install 'tomli' for Python < 3.11"
-            ) from err
+    if tomllib is None:
+        raise ConfigError("tomllib not available. Install 'tomli' for Python < 3.11")
 
     path = config_path or get_config_path()
 
@@ -63,6 +73,16 @@ def load_config(
             # Return default config without file
             return _apply_env_overrides(LLMBoxConfig())
 
+    # Reuse the parsed config from a previous run if the file is unchanged.
+    # Explicit paths (mainly tests) always take the slow path.
+    cache_key = None
+    if config_path is None:
+        with contextlib.suppress(OSError):
+            cache_key = _config_cache_key(path)
+        cached = _load_cached_config(cache_key) if cache_key else None
+        if cached is not None:
+            return _apply_env_overrides(cached)
+
     # Load TOML file
     try:
         with open(path, "rb") as f:
@@ -76,12 +96,62 @@ def load_config(
     except Exception as e:
         raise ConfigValidationError(f"Invalid configuration: {e}") from e
 
+    # Cache before env overrides, which mutate the config in place
+    if cache_key:
+        _store_cached_config(cache_key, config)
+
     # Apply environment variable overrides
     config = _apply_env_overrides(config)
 
     return config
 
 
+def _config_cache_key(path: Path) -> tuple[Any, ...]:
+    """Build the key identifying a cached parse of the config file.
+
+    Covers the file's identity and mtime as well as the package version and
+    the schema module's mtime, so edits to either invalidate the cache.
+    """
+    stat = path.stat()
+    return (
+        _CONFIG_CACHE_VERSION,
+        __version__,
+        Path(schema.__file__).stat().st_mtime_ns,
+        str(path),
+        stat.st_size,
+        stat.st_mtime_ns,
+    )
+
+
+def _load_cached_config(cache_key: tuple[Any, ...]) -> LLMBoxConfig | None:
+    """Load a previously parsed config, or None if missing or stale."""
+    try:
+        with open(DEFAULT_CONFIG_CACHE, "rb") as f:
+            stored_key, config = pickle.load(f)
+    except Exception:
+        return None
+    if stored_key != cache_key or not isinstance(config, LLMBoxConfig):
+        return None
+    return config
+
+
+def _store_cached_config(cache_key: tuple[Any, ...], config: LLMBoxConfig) -> None:
+    """Atomically write the parsed config cache, ignoring any failure."""
+    tmp_path = None
+    try:
+        DEFAULT_CONFIG_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=DEFAULT_CONFIG_CACHE.parent, prefix=".config.cache."
+        )
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump((cache_key, config), f)
+        os.replace(tmp_path, DEFAULT_CONFIG_CACHE)
+    except Exception:
+        if tmp_path:
+            with contextlib.suppress(OSError):
+                os.unlink(tmp_path)
+
+
 def _apply_env_overrides(config: LLMBoxConfig) -> LLMBoxConfig:
     """Apply environment variable overrides to configuration."""
     # Provider override
@@ -89,6 +89,12 @@ class SearchConfig(BaseModel):
     chunk_overlap: int = 50
 
 
+class TldrConfig(BaseModel):
+    """tldr command configuration."""
+
+    eager_formats: bool = False  # One LLM call caches every summary format
+
+
 class OutputConfig(BaseModel):
     """Output configuration."""
 
@@ -128,6 +134,7 @@ class LLMBoxConfig(BaseModel):
     cache: CacheConfig = Field(default_factory=CacheConfig)
     cache_ttl: CacheCommandTTL = Field(default_factory=CacheCommandTTL)
     search: SearchConfig = Field(default_factory=SearchConfig)
+    tldr: TldrConfig = Field(default_factory=TldrConfig)
     output: OutputConfig = Field(default_factory=OutputConfig)
     telemetry: TelemetryConfig = Field(default_factory=TelemetryConfig)
     plugins: PluginsConfig = Field(default_factory=PluginsConfig)
@@ -1,5 +1,9 @@
 """Exception hierarchy for llm-box."""
 
+import builtins
+from collections.abc import Sequence
+from typing import Any
+
 
 class LLMBoxError(Exception):
     """Base exception for all llm-box errors."""
@@ -17,6 +21,12 @@ class LLMBoxError(Exception):
         if user_message:
             self.user_message = user_message
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Reject subclasses that would shadow a builtin name."""
+        super().__init_subclass__(**kwargs)
+        if hasattr(builtins, cls.__name__):
+            raise TypeError(f"{cls.__name__} shadows a builtin; choose another name")
+
 
 # Provider Errors
 class ProviderError(LLMBoxError):
@@ -25,6 +35,17 @@ class ProviderError(LLMBoxError):
     exit_code = 2
     user_message = "LLM provider error"
 
+    def __init__(
+        self,
+        message: str | None = None,
+        *,
+        user_message: str | None = None,
+        causes: Sequence[tuple[str, BaseException]] = (),
+    ) -> None:
+        super().__init__(message, user_message=user_message)
+        # (provider name, error) pairs when several providers were tried
+        self.causes = list(causes)
+
 
 class ProviderNotAvailableError(ProviderError):
     """Provider is not reachable or not configured."""
@@ -128,7 +149,7 @@ class CommandError(LLMBoxError):
     user_message = "Command error"
 
 
-class FileNotFoundError(CommandError):
+class FileOrDirNotFoundError(CommandError):
     """File or directory not found."""
 
     exit_code = 41
@@ -18,12 +18,14 @@ Usage:
     print(formatter.format_table([{"name": "Alice", "age": 30}]))
 """
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from llm_box.output.base import OutputData, OutputFormat, OutputFormatter
 from llm_box.output.json_fmt import JSONFormatter, JSONLinesFormatter
 from llm_box.output.plain import PlainFormatter
-from llm_box.output.rich_fmt import RichFormatter
+
+if TYPE_CHECKING:
+    from llm_box.output.rich_fmt import RichFormatter
 
 __all__ = [
     # Base classes
@@ -37,6 +39,23 @@ __all__ = [
     "RichFormatter",
 ]
 
+# Formatter classes keyed by OutputFormat value. RichFormatter is imported
+# on first use so plain and JSON output never load rich.
+_FORMATTERS: dict[str, type[OutputFormatter]] = {
+    OutputFormat.PLAIN.value: PlainFormatter,
+    OutputFormat.JSON.value: JSONFormatter,
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import RichFormatter on first access."""
+    if name == "RichFormatter":
+        from llm_box.output.rich_fmt import RichFormatter
+
+        globals()[name] = RichFormatter
+        return RichFormatter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 def get_formatter(
     format_type: OutputFormat | str,
@@ -56,16 +75,12 @@ def get_formatter(
     Raises:
         ValueError: If format_type is not recognized.
     """
-    if isinstance(format_type, str):
-        format_type = OutputFormat(format_type.lower())
-
-    formatters: dict[OutputFormat, type[OutputFormatter]] = {
-        OutputFormat.PLAIN: PlainFormatter,
-        OutputFormat.JSON: JSONFormatter,
-        OutputFormat.RICH: RichFormatter,
-    }
-
-    formatter_class = formatters.get(format_type)
+    # OutputFormat is a str enum, so members hash and compare equal to their
+    # values and can be looked up directly without coercion
+    key = format_type if isinstance(format_type, OutputFormat) else format_type.lower()
+    formatter_class = _FORMATTERS.get(key)
+    if formatter_class is None and key == OutputFormat.RICH:
+        formatter_class = __getattr__("RichFormatter")
     if formatter_class is None:
         raise ValueError(f"Unknown format type: {format_type}")
 
@@ -4,7 +4,7 @@ import sys
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, TextIO
+from typing import Any, ClassVar, TextIO
 
 
 class OutputFormat(str, Enum):
@@ -15,7 +15,7 @@ class OutputFormat(str, Enum):
     RICH = "rich"
 
 
-@dataclass
+@dataclass(slots=True)
 class OutputData:
     """Container for output data to be formatted.
 
@@ -70,6 +70,9 @@ class OutputFormatter(ABC):
     in different formats (plain text, JSON, rich formatted).
     """
 
+    # Format type of this formatter, set as a class attribute by subclasses
+    format_type: ClassVar[OutputFormat]
+
     def __init__(
         self,
         stream: TextIO | None = None,
@@ -102,12 +105,6 @@ class OutputFormatter(ABC):
         """Whether verbose output is enabled."""
         return self._verbose
 
-    @property
-    @abstractmethod
-    def format_type(self) -> OutputFormat:
-        """Get the format type of this formatter."""
-        pass
-
     @abstractmethod
     def format(self, data: OutputData) -> str:
         """Format output data as a string.
@@ -5,6 +5,25 @@ from typing import Any, TextIO
 
 from llm_box.output.base import OutputData, OutputFormat, OutputFormatter
 
+# orjson is optional; JSON Lines output uses it when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
+# Metadata keys included in JSON output even when not verbose
+_IMPORTANT_METADATA_KEYS = frozenset(
+    {"tokens_used", "model", "provider", "duration_ms"}
+)
+
+
+def _all_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    return metadata
+
+
+def _important_metadata(metadata: dict[str, Any]) -> dict[str, Any]:
+    return {k: v for k, v in metadata.items() if k in _IMPORTANT_METADATA_KEYS}
+
 
 class JSONFormatter(OutputFormatter):
     """JSON output formatter.
@@ -13,6 +32,8 @@ class JSONFormatter(OutputFormatter):
     consumption and integration with other tools.
     """
 
+    format_type = OutputFormat.JSON
+
     def __init__(
         self,
         stream: TextIO | None = None,
@@ -33,19 +54,19 @@ class JSONFormatter(OutputFormatter):
         super().__init__(stream, error_stream, verbose)
         self._indent = indent
         self._ensure_ascii = ensure_ascii
-
-    @property
-    def format_type(self) -> OutputFormat:
-        return OutputFormat.JSON
+        # Reused for every call; json.dumps would build a new encoder each
+        # time since the options differ from its defaults
+        self._encoder = json.JSONEncoder(
+            indent=indent,
+            ensure_ascii=ensure_ascii,
+            default=str,  # Handle non-serializable types
+        )
+        # verbose is fixed per formatter, so pick the metadata filter once
+        self._metadata_filter = _all_metadata if verbose else _important_metadata
 
     def _to_json(self, data: Any) -> str:
         """Convert data to JSON string."""
-        return json.dumps(
-            data,
-            indent=self._indent,
-            ensure_ascii=self._ensure_ascii,
-            default=str,  # Handle non-serializable types
-        )
+        return self._encoder.encode(data)
 
     def format(self, data: OutputData) -> str:
         """Format output data as JSON."""
@@ -63,15 +84,11 @@ class JSONFormatter(OutputFormatter):
         else:
             output["error"] = data.error
 
-        # Include metadata if verbose or if there's metadata
-        if self._verbose and data.metadata:
-            output["metadata"] = data.metadata
-        elif data.metadata:
-            # Always include certain important metadata
-            important_keys = ["tokens_used", "model", "provider", "duration_ms"]
-            filtered = {k: v for k, v in data.metadata.items() if k in important_keys}
-            if filtered:
-                output["metadata"] = filtered
+        # Include all metadata if verbose, otherwise only the important keys
+        if data.metadata:
+            metadata = self._metadata_filter(data.metadata)
+            if metadata:
+                output["metadata"] = metadata
 
         return self._to_json(output)
 
@@ -145,15 +162,25 @@ class JSONLinesFormatter(JSONFormatter):
         # JSONL uses compact JSON (no indentation)
         super().__init__(stream, error_stream, verbose, indent=None)
 
+    def _to_json(self, data: Any) -> str:
+        """Convert data to a JSON line, using orjson when available."""
+        if orjson is not None:
+            try:
+                return orjson.dumps(
+                    data, default=str, option=orjson.OPT_NON_STR_KEYS
+                ).decode()
+            except orjson.JSONEncodeError:
+                # e.g. integers beyond 64 bits; the stdlib encoder handles them
+                pass
+        return super()._to_json(data)
+
     def format_list(self, items: list[str], title: str | None = None) -> str:
         """Format each list item as a separate JSON line."""
-        lines = []
-        for item in items:
-            line_data = {"item": item}
-            if title:
-                line_data["title"] = title
-            lines.append(self._to_json(line_data))
-        return "\n".join(lines)
+        if not title:
+            return "\n".join(self._to_json({"item": item}) for item in items)
+        return "\n".join(
+            self._to_json({"item": item, "title": title}) for item in items
+        )
 
     def format_table(
         self,
@@ -162,10 +189,7 @@ class JSONLinesFormatter(JSONFormatter):
         title: str | None = None,
     ) -> str:
         """Format each table row as a separate JSON line."""
-        lines = []
-        for row in rows:
-            line_data = dict(row)
-            if title:
-                line_data["_title"] = title
-            lines.append(self._to_json(line_data))
-        return "\n".join(lines)
+        # Rows are only copied when a title has to be added
+        if not title:
+            return "\n".join(self._to_json(row) for row in rows)
+        return "\n".join(self._to_json({**row, "_title": title}) for row in rows)
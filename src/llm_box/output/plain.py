@@ -1,10 +1,40 @@
 """Plain text output formatter."""
 
+import io
+from collections.abc import Callable
+from functools import lru_cache
 from typing import Any, TextIO
 
 from llm_box.output.base import OutputData, OutputFormat, OutputFormatter
 
 
+@lru_cache(maxsize=64)
+def _sep(width: int) -> str:
+    """Return a dash separator of the given width (shared across calls)."""
+    return "-" * width
+
+
+def _write_str(buf: io.StringIO, content: str) -> None:
+    buf.write(content)
+    buf.write("\n")
+
+
+def _write_list(buf: io.StringIO, content: list[Any]) -> None:
+    buf.writelines(f"{item}\n" for item in content)
+
+
+def _write_dict(buf: io.StringIO, content: dict[str, Any]) -> None:
+    buf.writelines(f"{key}: {value}\n" for key, value in content.items())
+
+
+# Content writers keyed by exact type, so the common case is one dict lookup
+_CONTENT_WRITERS: dict[type, Callable[[io.StringIO, Any], None]] = {
+    str: _write_str,
+    list: _write_list,
+    dict: _write_dict,
+}
+
+
 class PlainFormatter(OutputFormatter):
     """Plain text output formatter.
 
@@ -12,6 +42,8 @@ class PlainFormatter(OutputFormatter):
     piping to other commands or basic terminal display.
     """
 
+    format_type = OutputFormat.PLAIN
+
     def __init__(
         self,
         stream: TextIO | None = None,
@@ -30,61 +62,72 @@ class PlainFormatter(OutputFormatter):
         super().__init__(stream, error_stream, verbose)
         self._show_metadata = show_metadata
 
-    @property
-    def format_type(self) -> OutputFormat:
-        return OutputFormat.PLAIN
-
     def format(self, data: OutputData) -> str:
         """Format output data as plain text."""
-        lines: list[str] = []
+        # Every line is written with a trailing newline; the last one is
+        # dropped on return
+        buf = io.StringIO()
 
         # Add title if present
         if data.title:
-            lines.append(data.title)
-            lines.append("-" * len(data.title))
-            lines.append("")
+            buf.write(f"{data.title}\n{_sep(len(data.title))}\n\n")
 
         # Handle error case
         if not data.success and data.error:
-            lines.append(f"Error: {data.error}")
-            return "\n".join(lines)
+            buf.write(f"Error: {data.error}\n")
+            return buf.getvalue()[:-1]
 
         # Format content based on type
-        if isinstance(data.content, str):
-            lines.append(data.content)
-        elif isinstance(data.content, list):
-            for item in data.content:
-                lines.append(str(item))
-        elif isinstance(data.content, dict):
-            for key, value in data.content.items():
-                lines.append(f"{key}: {value}")
+        writer = _CONTENT_WRITERS.get(type(data.content))
+        if writer is None:
+            # Subclasses of str/list/dict miss the exact-type lookup
+            writer = next(
+                (w for t, w in _CONTENT_WRITERS.items() if isinstance(data.content, t)),
+                None,
+            )
+        if writer is not None:
+            writer(buf, data.content)
 
         # Add metadata if verbose or show_metadata is enabled
         if (self._verbose or self._show_metadata) and data.metadata:
-            lines.append("")
-            lines.append("---")
-            for key, value in data.metadata.items():
-                lines.append(f"{key}: {value}")
+            buf.write("\n---\n")
+            buf.writelines(f"{key}: {value}\n" for key, value in data.metadata.items())
 
         # Add cached indicator if verbose
         if self._verbose and data.cached:
-            lines.append("(cached)")
+            buf.write("(cached)\n")
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
+
+    def print(self, data: OutputData) -> None:
+        """Format and print output data.
+
+        Bare string content (no title, metadata or verbose extras) is
+        written straight to the stream, since format() would return it
+        unchanged.
+        """
+        if (
+            data.success
+            and not data.title
+            and isinstance(data.content, str)
+            and not self._verbose
+            and not (self._show_metadata and data.metadata)
+        ):
+            self._stream.write(data.content)
+            self._stream.write("\n")
+            return
+        super().print(data)
 
     def format_list(self, items: list[str], title: str | None = None) -> str:
         """Format a list of items as plain text."""
-        lines: list[str] = []
+        buf = io.StringIO()
 
         if title:
-            lines.append(title)
-            lines.append("-" * len(title))
-            lines.append("")
+            buf.write(f"{title}\n{_sep(len(title))}\n\n")
 
-        for item in items:
-            lines.append(f"  {item}")
+        buf.writelines(f"  {item}\n" for item in items)
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
 
     def format_table(
         self,
@@ -100,34 +143,30 @@ class PlainFormatter(OutputFormatter):
         if columns is None:
             columns = list(rows[0].keys())
 
-        # Calculate column widths
-        widths: dict[str, int] = {}
-        for col in columns:
-            widths[col] = len(col)
-            for row in rows:
-                value = str(row.get(col, ""))
-                widths[col] = max(widths[col], len(value))
+        # Stringify every cell once, then size columns from those strings
+        str_rows = [tuple(str(row.get(col, "")) for col in columns) for row in rows]
+        widths = [
+            max(len(col), *(len(str_row[i]) for str_row in str_rows))
+            for i, col in enumerate(columns)
+        ]
+        # printf-style formatting renders a whole row in one C-level call
+        row_format = "  ".join(f"%-{width}s" for width in widths) + "\n"
 
-        lines: list[str] = []
+        buf = io.StringIO()
 
         # Add title
         if title:
-            lines.append(title)
-            lines.append("")
+            buf.write(f"{title}\n\n")
 
         # Header row
-        header = "  ".join(col.ljust(widths[col]) for col in columns)
-        lines.append(header)
-        lines.append("  ".join("-" * widths[col] for col in columns))
+        buf.write(row_format % tuple(columns))
+        buf.write("  ".join(_sep(width) for width in widths))
+        buf.write("\n")
 
         # Data rows
-        for row in rows:
-            row_str = "  ".join(
-                str(row.get(col, "")).ljust(widths[col]) for col in columns
-            )
-            lines.append(row_str)
+        buf.writelines(row_format % str_row for str_row in str_rows)
 
-        return "\n".join(lines)
+        return buf.getvalue()[:-1]
 
     def format_code(
         self,
@@ -136,17 +175,15 @@ class PlainFormatter(OutputFormatter):
         title: str | None = None,
     ) -> str:
         """Format code as plain text (no highlighting)."""
-        lines: list[str] = []
+        buf = io.StringIO()
 
         if title:
-            lines.append(title)
-            lines.append("-" * len(title))
-            lines.append("")
+            buf.write(f"{title}\n{_sep(len(title))}\n\n")
 
         # Add language hint if provided
         if language and self._verbose:
-            lines.append(f"[{language}]")
+            buf.write(f"[{language}]\n")
 
-        lines.append(code)
+        buf.write(code)
 
-        return "\n".join(lines)
+        return buf.getvalue()
@@ -1,9 +1,64 @@
 """Rich terminal output formatter."""
 
+from functools import lru_cache
+from io import StringIO
+from operator import itemgetter
 from typing import Any, TextIO
 
 from llm_box.output.base import OutputData, OutputFormat, OutputFormatter
 
+# Core Rich components are imported once here. Markdown and Syntax pull in
+# markdown-it and pygments, so they are still imported where they are used.
+try:
+    from rich.console import Console, Group
+    from rich.panel import Panel
+    from rich.table import Table
+    from rich.text import Text
+except ImportError:
+    _RICH_AVAILABLE = False
+else:
+    _RICH_AVAILABLE = True
+
+# Markdown markers that may appear anywhere: code fences, bold and links
+_MARKDOWN_INLINE = ("```", "**", "__", "[")
+# Markers that only mean markdown at the start of a line: headers,
+# list/quote markers and numbered lists
+_MARKDOWN_LINE_PREFIXES = (
+    *("#" * level + " " for level in range(1, 7)),
+    "- ",
+    "* ",
+    "> ",
+    "1. ",
+)
+# Only the first lines are checked for line markers
+_MARKDOWN_SCAN_LINES = 32
+# Texts shorter than this have their markdown check memoized
+_MARKDOWN_CACHE_MAX_LEN = 4096
+
+
+def _scan_markdown(text: str) -> bool:
+    """Check text for inline markdown markers or markdown line prefixes."""
+    if any(marker in text for marker in _MARKDOWN_INLINE):
+        return True
+    lines = text.split("\n", _MARKDOWN_SCAN_LINES)[:_MARKDOWN_SCAN_LINES]
+    return any(line.startswith(_MARKDOWN_LINE_PREFIXES) for line in lines)
+
+
+# Re-rendering the same payload (format then print, repeated progress
+# updates) then costs a dict lookup on the string's cached hash
+_scan_markdown_cached = lru_cache(maxsize=256)(_scan_markdown)
+
+
+def _renders_verbatim(text: str, width: int) -> bool:
+    """Check whether Rich would render text unchanged (apart from rstrip).
+
+    Printable ASCII lines that fit the console width are neither wrapped
+    nor altered by Text rendering.
+    """
+    return text.isascii() and all(
+        len(line) <= width and line.isprintable() for line in text.split("\n")
+    )
+
 
 class RichFormatter(OutputFormatter):
     """Rich terminal output formatter.
@@ -12,6 +67,8 @@ class RichFormatter(OutputFormatter):
     with syntax highlighting, tables, panels, and more.
     """
 
+    format_type = OutputFormat.RICH
+
     def __init__(
         self,
         stream: TextIO | None = None,
@@ -36,72 +93,81 @@ class RichFormatter(OutputFormatter):
         # Lazy initialization of Rich components
         self._console: Any = None
         self._error_console: Any = None
+        self._render_console: Any = None
+        self._render_buffer = StringIO()
 
     def _get_console(self) -> Any:
         """Lazily initialize and return the Rich console."""
         if self._console is None:
-            try:
-                from rich.console import Console
-
-                self._console = Console(
-                    file=self._stream,
-                    width=self._width,
-                    force_terminal=True,
-                )
-            except ImportError:
+            if not _RICH_AVAILABLE:
                 # Fallback: return None, will use plain text
                 return None
+            self._console = Console(
+                file=self._stream,
+                width=self._width,
+                force_terminal=True,
+            )
         return self._console
 
     def _get_error_console(self) -> Any:
         """Lazily initialize and return the error console."""
         if self._error_console is None:
-            try:
-                from rich.console import Console
-
-                self._error_console = Console(
-                    file=self._error_stream,
-                    width=self._width,
-                    stderr=True,
-                    force_terminal=True,
-                )
-            except ImportError:
+            if not _RICH_AVAILABLE:
                 return None
+            self._error_console = Console(
+                file=self._error_stream,
+                width=self._width,
+                stderr=True,
+                force_terminal=True,
+            )
         return self._error_console
 
-    @property
-    def format_type(self) -> OutputFormat:
-        return OutputFormat.RICH
+    def _get_render_console(self) -> Any:
+        """Return the console used to render to a string, buffer cleared.
+
+        One console and buffer are reused for every format call instead of
+        building a new Console (and its terminal detection) each time.
+        """
+        if self._render_console is None:
+            self._render_console = Console(
+                file=self._render_buffer, width=self._width, force_terminal=False
+            )
+        self._render_buffer.seek(0)
+        self._render_buffer.truncate()
+        return self._render_console
 
     def format(self, data: OutputData) -> str:
         """Format output data with Rich formatting."""
-        console = self._get_console()
-
         # If Rich is not available, fall back to plain text
-        if console is None:
+        if not _RICH_AVAILABLE:
             return self._format_plain(data)
 
-        from io import StringIO
-
-        from rich.console import Console
-        from rich.markdown import Markdown
-        from rich.panel import Panel
-        from rich.text import Text
-
         # Capture output to string
-        string_io = StringIO()
-        temp_console = Console(file=string_io, width=self._width, force_terminal=False)
-
+        temp_console = self._get_render_console()
+
+        # Bare plain text renders as itself, so skip the Rich pipeline
+        if (
+            data.success
+            and not data.title
+            and not self._verbose
+            and isinstance(data.content, str)
+            and not self._looks_like_markdown(data.content)
+            and _renders_verbatim(data.content, temp_console.width)
+        ):
+            return data.content.rstrip()
+
+        # One Group renders every piece in a single print/layout pass
+        temp_console.print(Group(*self._build_renderables(data)))
+        return self._render_buffer.getvalue().rstrip()
+
+    def _build_renderables(self, data: OutputData) -> list[Any]:
+        """Build the Rich renderables for output data, in print order."""
         # Handle error case
         if not data.success and data.error:
             error_text = Text(f"Error: {data.error}", style="bold red")
             if data.title:
-                temp_console.print(
-                    Panel(error_text, title=data.title, border_style="red")
-                )
-            else:
-                temp_console.print(error_text)
-            return string_io.getvalue().rstrip()
+                return [Panel(error_text, title=data.title, border_style="red")]
+            return [error_text]
 
         # Format content based on type
         content_renderable: Any
@@ -109,13 +175,13 @@ class RichFormatter(OutputFormatter):
         if isinstance(data.content, str):
             # Check if content looks like markdown
             if self._looks_like_markdown(data.content):
+                from rich.markdown import Markdown
+
                 content_renderable = Markdown(data.content)
             else:
                 content_renderable = Text(data.content)
         elif isinstance(data.content, list):
             # Format as a list
-            from rich.table import Table
-
             table = Table(show_header=False, box=None)
             table.add_column("Item")
             for item in data.content:
@@ -123,8 +189,6 @@ class RichFormatter(OutputFormatter):
             content_renderable = table
         elif isinstance(data.content, dict):
             # Format as key-value pairs
-            from rich.table import Table
-
             table = Table(show_header=False, box=None, padding=(0, 1))
             table.add_column("Key", style="bold cyan")
             table.add_column("Value")
@@ -134,32 +198,33 @@ class RichFormatter(OutputFormatter):
         else:
             content_renderable = Text(str(data.content))
 
+        renderables: list[Any] = []
+
         # Wrap in panel if there's a title
         if data.title:
             subtitle = None
             if data.cached:
                 subtitle = "[dim](cached)[/dim]"
-            temp_console.print(
+            renderables.append(
                 Panel(content_renderable, title=data.title, subtitle=subtitle)
             )
         else:
-            temp_console.print(content_renderable)
+            renderables.append(content_renderable)
             if data.cached and self._verbose:
-                temp_console.print("[dim](cached)[/dim]")
+                renderables.append("[dim](cached)[/dim]")
 
         # Add metadata if verbose
         if self._verbose and data.metadata:
-            temp_console.print()
-            from rich.table import Table
+            renderables.append("")
 
             meta_table = Table(title="Metadata", show_header=False, box=None)
             meta_table.add_column("Key", style="dim")
             meta_table.add_column("Value", style="dim")
             for key, value in data.metadata.items():
                 meta_table.add_row(str(key), str(value))
-            temp_console.print(meta_table)
+            renderables.append(meta_table)
 
-        return string_io.getvalue().rstrip()
+        return renderables
 
     def _format_plain(self, data: OutputData) -> str:
         """Fallback plain text formatting when Rich is unavailable."""
@@ -187,26 +252,13 @@ class RichFormatter(OutputFormatter):
 
     def _looks_like_markdown(self, text: str) -> bool:
         """Check if text appears to be markdown."""
-        markdown_indicators = [
-            "# ",  # Headers
-            "## ",
-            "### ",
-            "```",  # Code blocks
-            "- ",  # Lists
-            "* ",
-            "1. ",  # Numbered lists
-            "**",  # Bold
-            "__",
-            "[",  # Links
-            "> ",  # Blockquotes
-        ]
-        return any(indicator in text for indicator in markdown_indicators)
+        if len(text) < _MARKDOWN_CACHE_MAX_LEN:
+            return _scan_markdown_cached(text)
+        return _scan_markdown(text)
 
     def format_list(self, items: list[str], title: str | None = None) -> str:
         """Format a list with Rich formatting."""
-        console = self._get_console()
-
-        if console is None:
+        if not _RICH_AVAILABLE:
             lines = []
             if title:
                 lines.append(title)
@@ -216,14 +268,7 @@ class RichFormatter(OutputFormatter):
                 lines.append(f"  • {item}")
             return "\n".join(lines)
 
-        from io import StringIO
-
-        from rich.console import Console
-        from rich.panel import Panel
-        from rich.table import Table
-
-        string_io = StringIO()
-        temp_console = Console(file=string_io, width=self._width, force_terminal=False)
+        temp_console = self._get_render_console()
 
         table = Table(show_header=False, box=None)
         table.add_column("Item")
@@ -235,7 +280,7 @@ class RichFormatter(OutputFormatter):
         else:
             temp_console.print(table)
 
-        return string_io.getvalue().rstrip()
+        return self._render_buffer.getvalue().rstrip()
 
     def format_table(
         self,
@@ -247,33 +292,28 @@ class RichFormatter(OutputFormatter):
         if not rows:
             return ""
 
-        console = self._get_console()
-
         # Determine columns
         if columns is None:
             columns = list(rows[0].keys())
 
-        if console is None:
+        if not _RICH_AVAILABLE:
             # Fallback to plain text table
             lines: list[str] = []
             if title:
                 lines.append(title)
                 lines.append("")
-            header = "  ".join(col.ljust(15) for col in columns)
+            # One printf-style format renders a whole row
+            row_format = "  ".join(["%-15s"] * len(columns))
+            header = row_format % tuple(columns)
             lines.append(header)
             lines.append("-" * len(header))
-            for row in rows:
-                row_str = "  ".join(str(row.get(col, "")).ljust(15) for col in columns)
-                lines.append(row_str)
+            lines.extend(
+                row_format % tuple(str(row.get(col, "")) for col in columns)
+                for row in rows
+            )
             return "\n".join(lines)
 
-        from io import StringIO
-
-        from rich.console import Console
-        from rich.table import Table
-
-        string_io = StringIO()
-        temp_console = Console(file=string_io, width=self._width, force_terminal=False)
+        temp_console = self._get_render_console()
 
         table = Table(title=title)
 
@@ -281,12 +321,19 @@ class RichFormatter(OutputFormatter):
         for col in columns:
             table.add_column(col, style="cyan")
 
-        # Add rows
-        for row in rows:
-            table.add_row(*[str(row.get(col, "")) for col in columns])
+        # Add rows. When every row has every column, one C-level itemgetter
+        # call fetches a whole row instead of a dict.get per cell.
+        column_set = set(columns)
+        if len(columns) > 1 and all(column_set <= row.keys() for row in rows):
+            get_cells = itemgetter(*columns)
+            for row in rows:
+                table.add_row(*map(str, get_cells(row)))
+        else:
+            for row in rows:
+                table.add_row(*[str(row.get(col, "")) for col in columns])
 
         temp_console.print(table)
-        return string_io.getvalue().rstrip()
+        return self._render_buffer.getvalue().rstrip()
 
     def format_code(
         self,
@@ -295,9 +342,7 @@ class RichFormatter(OutputFormatter):
         title: str | None = None,
     ) -> str:
         """Format code with Rich syntax highlighting."""
-        console = self._get_console()
-
-        if console is None:
+        if not _RICH_AVAILABLE:
             lines = []
             if title:
                 lines.append(title)
@@ -310,14 +355,9 @@ class RichFormatter(OutputFormatter):
                 lines.append("```")
             return "\n".join(lines)
 
-        from io import StringIO
-
-        from rich.console import Console
-        from rich.panel import Panel
         from rich.syntax import Syntax
 
-        string_io = StringIO()
-        temp_console = Console(file=string_io, width=self._width, force_terminal=False)
+        temp_console = self._get_render_console()
 
         syntax = Syntax(
             code,
@@ -332,7 +372,7 @@ class RichFormatter(OutputFormatter):
         else:
             temp_console.print(syntax)
 
-        return string_io.getvalue().rstrip()
+        return self._render_buffer.getvalue().rstrip()
 
     def print(self, data: OutputData) -> None:
         """Print output using Rich console directly."""
@@ -343,6 +383,7 @@ class RichFormatter(OutputFormatter):
             super().print(data)
             return
 
-        # For Rich, we format and then print directly
-        formatted = self.format(data)
-        console.print(formatted, highlight=False)
+        # Render straight to the real console, keeping its colors, rather
+        # than rendering to a string and printing that again. Printing one
+        # Group sends every piece to the stream in a single write and flush.
+        console.print(Group(*self._build_renderables(data)), highlight=False)
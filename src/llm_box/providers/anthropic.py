@@ -2,6 +2,7 @@
 
 import os
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from llm_box.exceptions import (
@@ -19,6 +20,32 @@ from llm_box.providers.base import (
 from llm_box.providers.registry import ProviderRegistry
 
 
+@lru_cache(maxsize=16)
+def _build_chat_model(
+    model: str,
+    api_key: str,
+    max_tokens: int,
+    timeout: float,
+    extra_items: tuple[tuple[str, Any], ...],
+) -> Any:
+    """Create a ChatAnthropic client, memoized on its configuration."""
+    try:
+        from langchain_anthropic import ChatAnthropic
+    except ImportError as e:
+        raise ProviderError(
+            "langchain-anthropic not installed. "
+            "Install with: pip install llm-box[anthropic]"
+        ) from e
+
+    return ChatAnthropic(
+        model=model,
+        api_key=api_key,
+        max_tokens=max_tokens,
+        timeout=timeout,
+        **dict(extra_items),
+    )
+
+
 class AnthropicProvider(LLMBoxProvider):
     """Anthropic (Claude) provider using LangChain integration.
 
@@ -65,23 +92,26 @@ class AnthropicProvider(LLMBoxProvider):
         self._chat_model = None
 
     def _get_chat_model(self) -> Any:
-        """Lazily initialize and return the chat model."""
+        """Lazily initialize and return the chat model.
+
+        Providers with the same configuration share one ChatAnthropic
+        client (and its HTTP connection pool).
+        """
         if self._chat_model is None:
-            try:
-                from langchain_anthropic import ChatAnthropic
-            except ImportError as e:
-                raise ProviderError(
-                    "langchain-anthropic not installed. "
-                    "Install with: pip install llm-box[anthropic]"
-                ) from e
-
-            self._chat_model = ChatAnthropic(
-                model=self.model_name,
-                api_key=self._api_key,
-                max_tokens=self._max_tokens,
-                timeout=self._timeout,
-                **self._extra_kwargs,
+            args = (
+                self.model_name,
+                self._api_key,
+                self._max_tokens,
+                self._timeout,
+                tuple(sorted(self._extra_kwargs.items())),
             )
+            try:
+                hash(args)
+            except TypeError:
+                # Unhashable extra options cannot be memoized
+                self._chat_model = _build_chat_model.__wrapped__(*args)
+            else:
+                self._chat_model = _build_chat_model(*args)
         return self._chat_model
 
     @property
@@ -124,18 +154,15 @@ class AnthropicProvider(LLMBoxProvider):
             chat = self._get_chat_model()
             response = chat.invoke(prompt, **kwargs)
 
-            tokens_used = None
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                tokens_used = response.usage_metadata.get("total_tokens")
+            usage = getattr(response, "usage_metadata", None) or {}
+            response_metadata = getattr(response, "response_metadata", None) or {}
 
             return LLMResponse(
                 content=response.content,
                 model=self.model_name,
                 provider=self.provider_type,
-                tokens_used=tokens_used,
-                finish_reason=getattr(response, "response_metadata", {}).get(
-                    "stop_reason"
-                ),
+                tokens_used=usage.get("total_tokens"),
+                finish_reason=response_metadata.get("stop_reason"),
             )
         except Exception as e:
             self._handle_error(e)
@@ -147,18 +174,15 @@ class AnthropicProvider(LLMBoxProvider):
             chat = self._get_chat_model()
             response = await chat.ainvoke(prompt, **kwargs)
 
-            tokens_used = None
-            if hasattr(response, "usage_metadata") and response.usage_metadata:
-                tokens_used = response.usage_metadata.get("total_tokens")
+            usage = getattr(response, "usage_metadata", None) or {}
+            response_metadata = getattr(response, "response_metadata", None) or {}
 
             return LLMResponse(
                 content=response.content,
                 model=self.model_name,
                 provider=self.provider_type,
-                tokens_used=tokens_used,
-                finish_reason=getattr(response, "response_metadata", {}).get(
-                    "stop_reason"
-                ),
+                tokens_used=usage.get("total_tokens"),
+                finish_reason=response_metadata.get("stop_reason"),
             )
         except Exception as e:
             self._handle_error(e)
@@ -169,12 +193,28 @@ class AnthropicProvider(LLMBoxProvider):
         try:
             chat = self._get_chat_model()
             async for chunk in chat.astream(prompt, **kwargs):
-                if chunk.content:
-                    yield chunk.content
+                if content := chunk.content:
+                    yield content
         except Exception as e:
             self._handle_error(e)
             raise
 
+    def _health_check_impl(self) -> None:
+        """Check credentials by listing one model instead of a billed prompt."""
+        client = getattr(self._get_chat_model(), "_client", None)
+        if client is None:
+            super()._health_check_impl()
+            return
+        client.models.list(limit=1)
+
+    async def _ahealth_check_impl(self) -> None:
+        """Async version of _health_check_impl."""
+        client = getattr(self._get_chat_model(), "_async_client", None)
+        if client is None:
+            await super()._ahealth_check_impl()
+            return
+        await client.models.list(limit=1)
+
     def _embed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
         """Generate embeddings using fallback provider.
 
@@ -189,6 +229,16 @@ class AnthropicProvider(LLMBoxProvider):
 
         return self._embeddings_fallback.embed(texts, **kwargs)
 
+    async def _aembed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+        """Generate embeddings asynchronously using the fallback provider."""
+        if self._embeddings_fallback is None:
+            raise NotImplementedError(
+                "Anthropic does not support embeddings. "
+                "Configure an embeddings_fallback provider (e.g., OpenAI)."
+            )
+
+        return await self._embeddings_fallback.aembed(texts, **kwargs)
+
 
 @ProviderRegistry.register(ProviderType.ANTHROPIC)
 def create_anthropic_provider(
@@ -1,11 +1,18 @@
 """Base provider class and types for LLM abstraction."""
 
+import asyncio
 from abc import ABC, abstractmethod
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any
 
+# Piece size used by the default (non-native) astream implementation
+_STREAM_CHUNK_CHARS = 512
+# Most embedding batch requests in flight at once for a single embed call
+_EMBED_MAX_CONCURRENCY = 8
+
 
 class ProviderType(str, Enum):
     """Supported LLM provider types."""
@@ -16,7 +23,7 @@ class ProviderType(str, Enum):
     MOCK = "mock"
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class LLMResponse:
     """Standardized response from any LLM provider."""
 
@@ -28,7 +35,7 @@ class LLMResponse:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, eq=False)
 class EmbeddingResponse:
     """Response containing vector embeddings."""
 
@@ -39,6 +46,64 @@ class EmbeddingResponse:
     tokens_used: int | None = None
 
 
+def _split_batches(texts: list[str], batch_size: int) -> list[list[str]]:
+    return [texts[i : i + batch_size] for i in range(0, len(texts), batch_size)]
+
+
+def embed_documents_in_batches(
+    embed_documents: Callable[[list[str]], list[list[float]]],
+    texts: list[str],
+    batch_size: int,
+) -> list[list[float]]:
+    """Embed texts in fixed-size batches, sending the batches concurrently.
+
+    Args:
+        embed_documents: Function embedding one batch of texts.
+        texts: Texts to embed.
+        batch_size: Maximum number of texts per request.
+
+    Returns:
+        One vector per text, in input order.
+    """
+    batches = _split_batches(texts, batch_size)
+    if len(batches) <= 1:
+        return embed_documents(texts)
+
+    workers = min(_EMBED_MAX_CONCURRENCY, len(batches))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        results = list(executor.map(embed_documents, batches))
+    return [vector for batch in results for vector in batch]
+
+
+async def aembed_documents_in_batches(
+    aembed_documents: Callable[[list[str]], Awaitable[list[list[float]]]],
+    texts: list[str],
+    batch_size: int,
+) -> list[list[float]]:
+    """Async version of embed_documents_in_batches.
+
+    Args:
+        aembed_documents: Coroutine function embedding one batch of texts.
+        texts: Texts to embed.
+        batch_size: Maximum number of texts per request.
+
+    Returns:
+        One vector per text, in input order.
+    """
+    batches = _split_batches(texts, batch_size)
+    if len(batches) <= 1:
+        return await aembed_documents(texts)
+
+    semaphore = asyncio.Semaphore(_EMBED_MAX_CONCURRENCY)
+
+    async def embed_batch(batch: list[str]) -> list[list[float]]:
+        async with semaphore:
+            return await aembed_documents(batch)
+
+    results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+    return [vector for batch in results for vector in batch]
+
+
 class LLMBoxProvider(ABC):
     """Abstract base class for LLM providers.
 
@@ -132,9 +197,13 @@ class LLMBoxProvider(ABC):
             raise NotImplementedError(
                 f"Provider {self.provider_type} does not support streaming"
             )
-        # Default implementation - subclasses should override for true streaming
+        # Default implementation - subclasses should override for true streaming.
+        # The full response is yielded in fixed-size pieces so consumers can
+        # start writing before handling the whole string.
         response = await self.ainvoke(prompt, **kwargs)
-        yield response.content
+        content = response.content
+        for start in range(0, len(content), _STREAM_CHUNK_CHARS):
+            yield content[start : start + _STREAM_CHUNK_CHARS]
 
     def embed(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
         """Generate embeddings for texts.
@@ -163,6 +232,35 @@ class LLMBoxProvider(ABC):
         """
         raise NotImplementedError("Subclass must implement _embed_impl")
 
+    async def aembed(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+        """Generate embeddings for texts asynchronously.
+
+        Args:
+            texts: List of texts to embed.
+            **kwargs: Additional provider-specific arguments.
+
+        Returns:
+            EmbeddingResponse with the embeddings.
+
+        Raises:
+            ProviderError: If embedding fails.
+            NotImplementedError: If provider doesn't support embeddings.
+        """
+        if not self.supports_embeddings:
+            raise NotImplementedError(
+                f"Provider {self.provider_type} does not support embeddings"
+            )
+        return await self._aembed_impl(texts, **kwargs)
+
+    async def _aembed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+        """Async implementation of embedding generation.
+
+        By default the blocking _embed_impl runs in a worker thread so the
+        event loop stays free. Subclasses with a native async API may
+        override this method.
+        """
+        return await asyncio.to_thread(self._embed_impl, texts, **kwargs)
+
     def health_check(self) -> bool:
         """Check if the provider is available and responding.
 
@@ -170,7 +268,7 @@ class LLMBoxProvider(ABC):
             True if provider is healthy, False otherwise.
         """
         try:
-            self.invoke("Hello")
+            self._health_check_impl()
             return True
         except Exception:
             return False
@@ -182,10 +280,22 @@ class LLMBoxProvider(ABC):
             True if provider is healthy, False otherwise.
         """
         try:
-            await self.ainvoke("Hello")
+            await self._ahealth_check_impl()
             return True
         except Exception:
             return False
 
+    def _health_check_impl(self) -> None:
+        """Probe the provider, raising if it is unavailable.
+
+        The default sends a short prompt. Subclasses with a cheaper
+        endpoint (e.g. listing models) should override this method.
+        """
+        self.invoke("Hello")
+
+    async def _ahealth_check_impl(self) -> None:
+        """Async version of _health_check_impl."""
+        await self.ainvoke("Hello")
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(provider={self.provider_type.value}, model={self.model_name})"
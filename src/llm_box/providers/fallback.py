@@ -1,14 +1,99 @@
 """Multi-provider fallback logic."""
 
-from typing import Any
-
-from llm_box.exceptions import ProviderError
+import asyncio
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Literal
+
+from llm_box.exceptions import (
+    ProviderAuthError,
+    ProviderError,
+    ProviderNotAvailableError,
+    ProviderRateLimitError,
+)
 from llm_box.providers.base import EmbeddingResponse, LLMBoxProvider, LLMResponse
 
+# Consecutive failures before a provider's circuit opens
+_CIRCUIT_FAILURE_THRESHOLD = 5
+# Seconds an open circuit skips its provider before allowing a probe call
+_CIRCUIT_COOLDOWN_SECONDS = 60.0
+# Auth and rate-limit errors won't clear quickly, so they open the circuit
+# at once and for longer
+_CIRCUIT_HARD_COOLDOWN_SECONDS = 300.0
+# Recorded, as a new ProviderNotAvailableError each time, for providers
+# that are skipped rather than called
+_CIRCUIT_OPEN = "circuit open"
+_NO_EMBEDDINGS = "Does not support embeddings"
+
+
+@dataclass
+class _CircuitState:
+    """Circuit breaker state for one provider in a fallback chain."""
+
+    failures: int = 0
+    opened_at: float = 0.0
+    cooldown: float = _CIRCUIT_COOLDOWN_SECONDS
+    state: Literal["closed", "open", "half_open"] = "closed"
+    # Callers may share a circuit across threads (e.g. embedding workers)
+    lock: threading.Lock = field(
+        default_factory=threading.Lock, repr=False, compare=False
+    )
+
+    def allow(self) -> bool:
+        """Whether the provider may be called now.
+
+        An open circuit turns half-open once its cooldown has elapsed,
+        letting one call through as a probe. Other calls are refused until
+        the probe's result is recorded, or until another cooldown passes
+        in case the probe never reports back.
+        """
+        with self.lock:
+            if self.state == "closed":
+                return True
+            if time.monotonic() - self.opened_at < self.cooldown:
+                return False
+            self.state = "half_open"
+            # Time the probe from now, refusing other calls meanwhile
+            self.opened_at = time.monotonic()
+            return True
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful call."""
+        with self.lock:
+            self.failures = 0
+            self.state = "closed"
+
+    def record_failure(self, error: Exception) -> None:
+        """Count a failed call, opening the circuit when it should trip."""
+        with self.lock:
+            self.failures += 1
+            if isinstance(error, (ProviderAuthError, ProviderRateLimitError)):
+                self._open(_CIRCUIT_HARD_COOLDOWN_SECONDS)
+            elif (
+                self.state == "half_open" or self.failures >= _CIRCUIT_FAILURE_THRESHOLD
+            ):
+                self._open(_CIRCUIT_COOLDOWN_SECONDS)
+
+    def _open(self, cooldown: float) -> None:
+        self.state = "open"
+        self.opened_at = time.monotonic()
+        self.cooldown = cooldown
+
+
+def _all_failed(what: str, errors: list[tuple[str, Exception]]) -> ProviderError:
+    """Build the error raised when every provider in a chain failed.
+
+    Failures are kept as exception objects and only formatted here.
+    """
+    error_details = "; ".join(f"{p}: {e}" for p, e in errors)
+    return ProviderError(f"{what}: {error_details}", causes=errors)
+
 
 def invoke_with_fallback(
     providers: list[LLMBoxProvider],
     prompt: str,
+    circuits: dict[int, _CircuitState] | None = None,
     **kwargs: Any,
 ) -> LLMResponse:
     """Try providers in order until one succeeds.
@@ -16,6 +101,8 @@ def invoke_with_fallback(
     Args:
         providers: List of providers to try, in order of preference.
         prompt: The prompt to send to the LLM.
+        circuits: Optional circuit breaker state keyed by provider id().
+            Providers whose circuit is open are skipped.
         **kwargs: Additional arguments passed to invoke.
 
     Returns:
@@ -28,33 +115,57 @@ def invoke_with_fallback(
     if not providers:
         raise ValueError("At least one provider must be specified")
 
-    errors: list[tuple[str, str]] = []
+    errors: list[tuple[str, Exception]] = []
 
     for provider in providers:
-        try:
-            return provider.invoke(prompt, **kwargs)
-        except ProviderError as e:
-            errors.append((provider.provider_type.value, str(e)))
+        circuit = circuits.get(id(provider)) if circuits else None
+        if circuit is not None and not circuit.allow():
+            errors.append(
+                (provider.provider_type.value, ProviderNotAvailableError(_CIRCUIT_OPEN))
+            )
             continue
+
+        try:
+            response = provider.invoke(prompt, **kwargs)
         except Exception as e:
-            errors.append((provider.provider_type.value, str(e)))
+            errors.append((provider.provider_type.value, e))
+            if circuit is not None:
+                circuit.record_failure(e)
             continue
 
+        if circuit is not None:
+            circuit.record_success()
+        return response
+
     # All providers failed
-    error_details = "; ".join(f"{p}: {e}" for p, e in errors)
-    raise ProviderError(f"All providers failed: {error_details}")
+    raise _all_failed("All providers failed", errors)
 
 
 async def ainvoke_with_fallback(
     providers: list[LLMBoxProvider],
     prompt: str,
+    circuits: dict[int, _CircuitState] | None = None,
+    hedge_delay: float | None = None,
     **kwargs: Any,
 ) -> LLMResponse:
     """Try providers in order until one succeeds (async version).
 
+    A provider that fails hands over to the next one immediately. With a
+    hedge_delay set, one that is still running after that many seconds
+    stays in flight while the next provider is started alongside it, and
+    the first successful response wins; the remaining calls are cancelled.
+    Hedging trades cost for latency: every hedge is an extra billed request
+    that may count against the backup's rate limit, so the delay should sit
+    above the primary's usual response time.
+
     Args:
         providers: List of providers to try, in order of preference.
         prompt: The prompt to send to the LLM.
+        circuits: Optional circuit breaker state keyed by provider id().
+            Providers whose circuit is open are skipped.
+        hedge_delay: Seconds to wait on in-flight providers before starting
+            the next one, or None (the default) to try providers strictly
+            one at a time.
         **kwargs: Additional arguments passed to ainvoke.
 
     Returns:
@@ -67,26 +178,67 @@ async def ainvoke_with_fallback(
     if not providers:
         raise ValueError("At least one provider must be specified")
 
-    errors: list[tuple[str, str]] = []
-
-    for provider in providers:
-        try:
-            return await provider.ainvoke(prompt, **kwargs)
-        except ProviderError as e:
-            errors.append((provider.provider_type.value, str(e)))
-            continue
-        except Exception as e:
-            errors.append((provider.provider_type.value, str(e)))
-            continue
+    errors: list[tuple[str, Exception]] = []
+    in_flight: dict[asyncio.Task[LLMResponse], LLMBoxProvider] = {}
+    remaining = iter(providers)
+
+    def start_next() -> None:
+        for provider in remaining:
+            circuit = circuits.get(id(provider)) if circuits else None
+            if circuit is not None and not circuit.allow():
+                errors.append(
+                    (
+                        provider.provider_type.value,
+                        ProviderNotAvailableError(_CIRCUIT_OPEN),
+                    )
+                )
+                continue
+            task = asyncio.create_task(provider.ainvoke(prompt, **kwargs))
+            in_flight[task] = provider
+            return
+
+    start_next()
+    try:
+        while in_flight:
+            done, _ = await asyncio.wait(
+                in_flight, timeout=hedge_delay, return_when=asyncio.FIRST_COMPLETED
+            )
+            if not done:
+                # Every running provider is slow: hedge with the next one
+                start_next()
+                continue
+
+            for task in done:
+                provider = in_flight.pop(task)
+                circuit = circuits.get(id(provider)) if circuits else None
+                error = task.exception()
+                if error is None:
+                    if circuit is not None:
+                        circuit.record_success()
+                    return task.result()
+                if not isinstance(error, Exception):
+                    raise error
+                errors.append((provider.provider_type.value, error))
+                if circuit is not None:
+                    circuit.record_failure(error)
+
+            # A provider failed: move on without waiting out the delay
+            start_next()
+    finally:
+        # Losing hedges are cancelled and awaited so none outlive the call
+        for task in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
 
     # All providers failed
-    error_details = "; ".join(f"{p}: {e}" for p, e in errors)
-    raise ProviderError(f"All providers failed: {error_details}")
+    raise _all_failed("All providers failed", errors)
 
 
 def embed_with_fallback(
     providers: list[LLMBoxProvider],
     texts: list[str],
+    circuits: dict[int, _CircuitState] | None = None,
     **kwargs: Any,
 ) -> EmbeddingResponse:
     """Try providers in order until one succeeds for embeddings.
@@ -94,6 +246,8 @@ def embed_with_fallback(
     Args:
         providers: List of providers to try, in order of preference.
         texts: List of texts to embed.
+        circuits: Optional circuit breaker state keyed by provider id().
+            Providers whose circuit is open are skipped.
         **kwargs: Additional arguments passed to embed.
 
     Returns:
@@ -106,25 +260,39 @@ def embed_with_fallback(
     if not providers:
         raise ValueError("At least one provider must be specified")
 
-    errors: list[tuple[str, str]] = []
+    errors: list[tuple[str, Exception]] = []
 
     for provider in providers:
         if not provider.supports_embeddings:
-            errors.append((provider.provider_type.value, "Does not support embeddings"))
+            errors.append(
+                (
+                    provider.provider_type.value,
+                    ProviderNotAvailableError(_NO_EMBEDDINGS),
+                )
+            )
             continue
 
-        try:
-            return provider.embed(texts, **kwargs)
-        except ProviderError as e:
-            errors.append((provider.provider_type.value, str(e)))
+        circuit = circuits.get(id(provider)) if circuits else None
+        if circuit is not None and not circuit.allow():
+            errors.append(
+                (provider.provider_type.value, ProviderNotAvailableError(_CIRCUIT_OPEN))
+            )
             continue
+
+        try:
+            response = provider.embed(texts, **kwargs)
         except Exception as e:
-            errors.append((provider.provider_type.value, str(e)))
+            errors.append((provider.provider_type.value, e))
+            if circuit is not None:
+                circuit.record_failure(e)
             continue
 
+        if circuit is not None:
+            circuit.record_success()
+        return response
+
     # All providers failed
-    error_details = "; ".join(f"{p}: {e}" for p, e in errors)
-    raise ProviderError(f"All providers failed for embeddings: {error_details}")
+    raise _all_failed("All providers failed for embeddings", errors)
 
 
 class FallbackProvider(LLMBoxProvider):
@@ -137,12 +305,16 @@ class FallbackProvider(LLMBoxProvider):
         self,
         providers: list[LLMBoxProvider],
         name: str = "fallback",
+        hedge_delay: float | None = None,
     ) -> None:
         """Initialize fallback provider.
 
         Args:
             providers: List of providers in order of preference.
             name: Name for this fallback provider.
+            hedge_delay: Seconds ainvoke waits on a slow provider before
+                also starting the next one. Defaults to None, which disables
+                hedging; see ainvoke_with_fallback for the cost trade-off.
 
         Raises:
             ValueError: If providers list is empty.
@@ -156,6 +328,11 @@ class FallbackProvider(LLMBoxProvider):
         super().__init__(ProviderType.MOCK, name)  # Use MOCK as placeholder type
         self._providers = providers
         self._name = name
+        # The provider list is fixed, so embedding support is resolved once
+        self._embedding_providers = [p for p in providers if p.supports_embeddings]
+        # Per-provider circuit breakers, so known-bad providers are skipped
+        self._circuits = {id(p): _CircuitState() for p in providers}
+        self._hedge_delay = hedge_delay
 
     @property
     def supports_streaming(self) -> bool:
@@ -164,7 +341,7 @@ class FallbackProvider(LLMBoxProvider):
 
     @property
     def supports_embeddings(self) -> bool:
-        return any(p.supports_embeddings for p in self._providers)
+        return bool(self._embedding_providers)
 
     @property
     def primary_provider(self) -> LLMBoxProvider:
@@ -173,15 +350,19 @@ class FallbackProvider(LLMBoxProvider):
 
     def invoke(self, prompt: str, **kwargs: Any) -> LLMResponse:
         """Invoke with fallback logic."""
-        return invoke_with_fallback(self._providers, prompt, **kwargs)
+        return invoke_with_fallback(self._providers, prompt, self._circuits, **kwargs)
 
     async def ainvoke(self, prompt: str, **kwargs: Any) -> LLMResponse:
         """Async invoke with fallback logic."""
-        return await ainvoke_with_fallback(self._providers, prompt, **kwargs)
+        return await ainvoke_with_fallback(
+            self._providers, prompt, self._circuits, self._hedge_delay, **kwargs
+        )
 
     def _embed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
-        """Embed with fallback logic."""
-        return embed_with_fallback(self._providers, texts, **kwargs)
+        """Embed with fallback logic, trying only embedding-capable providers."""
+        return embed_with_fallback(
+            self._embedding_providers, texts, self._circuits, **kwargs
+        )
 
     def __repr__(self) -> str:
         provider_names = [p.provider_type.value for p in self._providers]
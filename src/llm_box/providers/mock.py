@@ -2,9 +2,12 @@
 
 import asyncio
 import hashlib
+import os
+from collections import OrderedDict
 from collections.abc import AsyncIterator
 from typing import Any
 
+from llm_box.config.defaults import ENV_MOCK_NO_HISTORY
 from llm_box.providers.base import (
     EmbeddingResponse,
     LLMBoxProvider,
@@ -13,6 +16,14 @@ from llm_box.providers.base import (
 )
 from llm_box.providers.registry import ProviderRegistry
 
+# Embedding value for each possible hash byte, normalized to [-1, 1]. Lookups
+# run in C via map() and share these float objects instead of allocating one
+# per lane.
+_BYTE_TO_UNIT = tuple((b - 128) / 128.0 for b in range(256))
+
+# Generated responses kept per provider, so replayed prompts skip the scan
+_RESPONSE_CACHE_SIZE = 4096
+
 
 class MockProvider(LLMBoxProvider):
     """Mock LLM provider for testing.
@@ -27,6 +38,7 @@ class MockProvider(LLMBoxProvider):
         responses: dict[str, str] | None = None,
         embedding_dimensions: int = 128,
         latency_ms: int = 0,
+        record_calls: bool = True,
     ) -> None:
         """Initialize mock provider.
 
@@ -35,12 +47,18 @@ class MockProvider(LLMBoxProvider):
             responses: Dict mapping prompt substrings to responses.
             embedding_dimensions: Dimension of fake embeddings.
             latency_ms: Simulated latency in milliseconds.
+            record_calls: Whether to keep a call history (disable for
+                benchmarks and stress tests that never inspect it).
         """
         super().__init__(ProviderType.MOCK, model)
         self._responses = responses or {}
+        # Lowercased keys, computed once rather than on every prompt
+        self._responses_lower = [(k.lower(), v) for k, v in self._responses.items()]
         self._embedding_dimensions = embedding_dimensions
         self._latency_ms = latency_ms
+        self._record_calls = record_calls
         self._call_history: list[dict[str, Any]] = []
+        self._response_cache: OrderedDict[str, tuple[str, int]] = OrderedDict()
 
     @property
     def supports_streaming(self) -> bool:
@@ -64,11 +82,43 @@ class MockProvider(LLMBoxProvider):
         """Clear call history."""
         self._call_history.clear()
 
+    def set_responses(self, responses: dict[str, str]) -> None:
+        """Replace the configured responses.
+
+        Args:
+            responses: Dict mapping prompt substrings to responses.
+        """
+        self._responses = responses
+        self._responses_lower = [(k.lower(), v) for k, v in responses.items()]
+        self._response_cache.clear()
+
     def _generate_response(self, prompt: str) -> str:
         """Generate a deterministic response based on the prompt."""
+        return self._response_with_tokens(prompt)[0]
+
+    def _response_with_tokens(self, prompt: str) -> tuple[str, int]:
+        """Return the response for a prompt and its word-count token usage.
+
+        Both are cached together, so replayed prompts skip the
+        whitespace splits as well as the response scan.
+        """
+        cached = self._response_cache.get(prompt)
+        if cached is not None:
+            return cached
+
+        response = self._match_response(prompt)
+        result = (response, len(prompt.split()) + len(response.split()))
+        self._response_cache[prompt] = result
+        if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+            self._response_cache.popitem(last=False)
+        return result
+
+    def _match_response(self, prompt: str) -> str:
+        """Pick the configured or hash-based response for a prompt."""
         # Check for configured responses
-        for key, response in self._responses.items():
-            if key.lower() in prompt.lower():
+        prompt_lower = prompt.lower()
+        for key_lower, response in self._responses_lower:
+            if key_lower in prompt_lower:
                 return response
 
         # Default: generate deterministic response from prompt hash
@@ -77,6 +127,8 @@ class MockProvider(LLMBoxProvider):
 
     def _record_call(self, method: str, prompt: str, **kwargs: Any) -> None:
         """Record a call to the provider."""
+        if not self._record_calls:
+            return
         self._call_history.append(
             {
                 "method": method,
@@ -95,13 +147,13 @@ class MockProvider(LLMBoxProvider):
 
             time.sleep(self._latency_ms / 1000)
 
-        content = self._generate_response(prompt)
+        content, tokens_used = self._response_with_tokens(prompt)
 
         return LLMResponse(
             content=content,
             model=self.model_name,
             provider=self.provider_type,
-            tokens_used=len(prompt.split()) + len(content.split()),
+            tokens_used=tokens_used,
             finish_reason="stop",
         )
 
@@ -113,13 +165,13 @@ class MockProvider(LLMBoxProvider):
         if self._latency_ms > 0:
             await asyncio.sleep(self._latency_ms / 1000)
 
-        content = self._generate_response(prompt)
+        content, tokens_used = self._response_with_tokens(prompt)
 
         return LLMResponse(
             content=content,
             model=self.model_name,
             provider=self.provider_type,
-            tokens_used=len(prompt.split()) + len(content.split()),
+            tokens_used=tokens_used,
             finish_reason="stop",
         )
 
@@ -145,17 +197,18 @@ class MockProvider(LLMBoxProvider):
         """Generate deterministic fake embeddings."""
         self._record_call("embed", str(texts), **kwargs)
 
+        dimensions = self._embedding_dimensions
+        repeats = dimensions // 32 + 1
+        to_unit = _BYTE_TO_UNIT.__getitem__
+
         embeddings = []
         for text in texts:
             # Generate deterministic embedding from text hash
             hash_bytes = hashlib.sha256(text.encode()).digest()
             # Extend hash to reach desired dimensions
-            extended = hash_bytes * (self._embedding_dimensions // 32 + 1)
+            extended = (hash_bytes * repeats)[:dimensions]
             # Convert to floats normalized to [-1, 1]
-            embedding = [
-                (b - 128) / 128.0 for b in extended[: self._embedding_dimensions]
-            ]
-            embeddings.append(embedding)
+            embeddings.append(list(map(to_unit, extended)))
 
         return EmbeddingResponse(
             embeddings=embeddings,
@@ -172,6 +225,7 @@ def create_mock_provider(
     responses: dict[str, str] | None = None,
     embedding_dimensions: int = 128,
     latency_ms: int = 0,
+    record_calls: bool | None = None,
     **kwargs: Any,
 ) -> MockProvider:
     """Factory function to create a mock provider.
@@ -181,14 +235,20 @@ def create_mock_provider(
         responses: Dict mapping prompt substrings to responses.
         embedding_dimensions: Dimension of fake embeddings.
         latency_ms: Simulated latency in milliseconds.
+        record_calls: Whether to keep a call history. Defaults to True
+            unless LLMBOX_MOCK_NO_HISTORY is set to 1/true/yes.
         **kwargs: Additional arguments (ignored).
 
     Returns:
         MockProvider instance.
     """
+    if record_calls is None:
+        no_history = os.environ.get(ENV_MOCK_NO_HISTORY, "")
+        record_calls = no_history.lower() not in ("1", "true", "yes")
     return MockProvider(
         model=model,
         responses=responses,
         embedding_dimensions=embedding_dimensions,
         latency_ms=latency_ms,
+        record_calls=record_calls,
     )
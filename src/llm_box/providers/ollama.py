@@ -1,6 +1,7 @@
 """Ollama provider implementation using LangChain."""
 
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from llm_box.exceptions import (
@@ -13,10 +14,32 @@ from llm_box.providers.base import (
     LLMBoxProvider,
     LLMResponse,
     ProviderType,
+    aembed_documents_in_batches,
+    embed_documents_in_batches,
 )
 from llm_box.providers.registry import ProviderRegistry
 
 
+@lru_cache(maxsize=1)
+def _resolve_langchain_ollama() -> tuple[Any, ImportError | None]:
+    """Import langchain_ollama once, caching the module or the ImportError."""
+    try:
+        import langchain_ollama
+    except ImportError as e:
+        return None, e
+    return langchain_ollama, None
+
+
+def _langchain_ollama() -> Any:
+    """Return langchain_ollama, raising ProviderError if it is missing."""
+    module, error = _resolve_langchain_ollama()
+    if error is not None:
+        raise ProviderError(
+            "langchain-ollama not installed. Install with: pip install llm-box[ollama]"
+        ) from error
+    return module
+
+
 class OllamaProvider(LLMBoxProvider):
     """Ollama provider using LangChain integration.
 
@@ -29,6 +52,7 @@ class OllamaProvider(LLMBoxProvider):
         model: str = "llama3",
         base_url: str = "http://localhost:11434",
         timeout: float = 120.0,
+        embed_batch_size: int = 96,
         **kwargs: Any,
     ) -> None:
         """Initialize Ollama provider.
@@ -37,11 +61,14 @@ class OllamaProvider(LLMBoxProvider):
             model: Model name (e.g., "llama3", "mistral", "codellama").
             base_url: Ollama server URL.
             timeout: Request timeout in seconds.
+            embed_batch_size: Texts per embedding request; larger inputs are
+                split and the requests sent concurrently.
             **kwargs: Additional arguments passed to ChatOllama.
         """
         super().__init__(ProviderType.OLLAMA, model)
         self._base_url = base_url
         self._timeout = timeout
+        self._embed_batch_size = embed_batch_size
         self._extra_kwargs = kwargs
 
         # Lazy initialization of LangChain models
@@ -51,15 +78,7 @@ class OllamaProvider(LLMBoxProvider):
     def _get_chat_model(self) -> Any:
         """Lazily initialize and return the chat model."""
         if self._chat_model is None:
-            try:
-                from langchain_ollama import ChatOllama
-            except ImportError as e:
-                raise ProviderError(
-                    "langchain-ollama not installed. "
-                    "Install with: pip install llm-box[ollama]"
-                ) from e
-
-            self._chat_model = ChatOllama(
+            self._chat_model = _langchain_ollama().ChatOllama(
                 model=self.model_name,
                 base_url=self._base_url,
                 **self._extra_kwargs,
@@ -69,15 +88,7 @@ class OllamaProvider(LLMBoxProvider):
     def _get_embeddings_model(self) -> Any:
         """Lazily initialize and return the embeddings model."""
         if self._embeddings_model is None:
-            try:
-                from langchain_ollama import OllamaEmbeddings
-            except ImportError as e:
-                raise ProviderError(
-                    "langchain-ollama not installed. "
-                    "Install with: pip install llm-box[ollama]"
-                ) from e
-
-            self._embeddings_model = OllamaEmbeddings(
+            self._embeddings_model = _langchain_ollama().OllamaEmbeddings(
                 model=self.model_name,
                 base_url=self._base_url,
             )
@@ -160,8 +171,8 @@ class OllamaProvider(LLMBoxProvider):
         try:
             chat = self._get_chat_model()
             async for chunk in chat.astream(prompt, **kwargs):
-                if chunk.content:
-                    yield chunk.content
+                if content := chunk.content:
+                    yield content
         except Exception as e:
             self._handle_error(e)
             raise
@@ -170,7 +181,28 @@ class OllamaProvider(LLMBoxProvider):
         """Generate embeddings using Ollama."""
         try:
             embeddings_model = self._get_embeddings_model()
-            vectors = embeddings_model.embed_documents(texts)
+            vectors = embed_documents_in_batches(
+                embeddings_model.embed_documents, texts, self._embed_batch_size
+            )
+
+            return EmbeddingResponse(
+                embeddings=vectors,
+                model=self.model_name,
+                provider=self.provider_type,
+                dimensions=len(vectors[0]) if vectors else 0,
+                tokens_used=None,  # Ollama doesn't report token usage for embeddings
+            )
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def _aembed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+        """Generate embeddings using Ollama asynchronously."""
+        try:
+            embeddings_model = self._get_embeddings_model()
+            vectors = await aembed_documents_in_batches(
+                embeddings_model.aembed_documents, texts, self._embed_batch_size
+            )
 
             return EmbeddingResponse(
                 embeddings=vectors,
@@ -2,6 +2,7 @@
 
 import os
 from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Any
 
 from llm_box.exceptions import (
@@ -15,10 +16,32 @@ from llm_box.providers.base import (
     LLMBoxProvider,
     LLMResponse,
     ProviderType,
+    aembed_documents_in_batches,
+    embed_documents_in_batches,
 )
 from llm_box.providers.registry import ProviderRegistry
 
 
+@lru_cache(maxsize=1)
+def _resolve_langchain_openai() -> tuple[Any, ImportError | None]:
+    """Import langchain_openai once, caching the module or the ImportError."""
+    try:
+        import langchain_openai
+    except ImportError as e:
+        return None, e
+    return langchain_openai, None
+
+
+def _langchain_openai() -> Any:
+    """Return langchain_openai, raising ProviderError if it is missing."""
+    module, error = _resolve_langchain_openai()
+    if error is not None:
+        raise ProviderError(
+            "langchain-openai not installed. Install with: pip install llm-box[openai]"
+        ) from error
+    return module
+
+
 class OpenAIProvider(LLMBoxProvider):
     """OpenAI provider using LangChain integration.
 
@@ -32,6 +55,7 @@ class OpenAIProvider(LLMBoxProvider):
         api_key: str | None = None,
         embedding_model: str = "text-embedding-3-small",
         timeout: float = 60.0,
+        embed_batch_size: int = 96,
         **kwargs: Any,
     ) -> None:
         """Initialize OpenAI provider.
@@ -41,12 +65,15 @@ class OpenAIProvider(LLMBoxProvider):
             api_key: OpenAI API key (uses OPENAI_API_KEY env var if None).
             embedding_model: Embedding model name.
             timeout: Request timeout in seconds.
+            embed_batch_size: Texts per embedding request; larger inputs are
+                split and the requests sent concurrently.
             **kwargs: Additional arguments passed to ChatOpenAI.
         """
         super().__init__(ProviderType.OPENAI, model)
         self._api_key = api_key or os.environ.get("OPENAI_API_KEY")
         self._embedding_model = embedding_model
         self._timeout = timeout
+        self._embed_batch_size = embed_batch_size
         self._extra_kwargs = kwargs
 
         if not self._api_key:
@@ -62,15 +89,7 @@ class OpenAIProvider(LLMBoxProvider):
     def _get_chat_model(self) -> Any:
         """Lazily initialize and return the chat model."""
         if self._chat_model is None:
-            try:
-                from langchain_openai import ChatOpenAI
-            except ImportError as e:
-                raise ProviderError(
-                    "langchain-openai not installed. "
-                    "Install with: pip install llm-box[openai]"
-                ) from e
-
-            self._chat_model = ChatOpenAI(
+            self._chat_model = _langchain_openai().ChatOpenAI(
                 model=self.model_name,
                 api_key=self._api_key,
                 timeout=self._timeout,
@@ -81,15 +100,7 @@ class OpenAIProvider(LLMBoxProvider):
     def _get_embeddings_model(self) -> Any:
         """Lazily initialize and return the embeddings model."""
         if self._embeddings_model is None:
-            try:
-                from langchain_openai import OpenAIEmbeddings
-            except ImportError as e:
-                raise ProviderError(
-                    "langchain-openai not installed. "
-                    "Install with: pip install llm-box[openai]"
-                ) from e
-
-            self._embeddings_model = OpenAIEmbeddings(
+            self._embeddings_model = _langchain_openai().OpenAIEmbeddings(
                 model=self._embedding_model,
                 api_key=self._api_key,
             )
@@ -175,8 +186,8 @@ class OpenAIProvider(LLMBoxProvider):
         try:
             chat = self._get_chat_model()
             async for chunk in chat.astream(prompt, **kwargs):
-                if chunk.content:
-                    yield chunk.content
+                if content := chunk.content:
+                    yield content
         except Exception as e:
             self._handle_error(e)
             raise
@@ -185,7 +196,28 @@ class OpenAIProvider(LLMBoxProvider):
         """Generate embeddings using OpenAI."""
         try:
             embeddings_model = self._get_embeddings_model()
-            vectors = embeddings_model.embed_documents(texts)
+            vectors = embed_documents_in_batches(
+                embeddings_model.embed_documents, texts, self._embed_batch_size
+            )
+
+            return EmbeddingResponse(
+                embeddings=vectors,
+                model=self._embedding_model,
+                provider=self.provider_type,
+                dimensions=len(vectors[0]) if vectors else 0,
+                tokens_used=None,
+            )
+        except Exception as e:
+            self._handle_error(e)
+            raise
+
+    async def _aembed_impl(self, texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+        """Generate embeddings using OpenAI asynchronously."""
+        try:
+            embeddings_model = self._get_embeddings_model()
+            vectors = await aembed_documents_in_batches(
+                embeddings_model.aembed_documents, texts, self._embed_batch_size
+            )
 
             return EmbeddingResponse(
                 embeddings=vectors,
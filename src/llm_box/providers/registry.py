@@ -1,5 +1,6 @@
 """Provider registry for creating and caching provider instances."""
 
+from collections import OrderedDict
 from collections.abc import Callable
 from typing import Any, TypeVar
 
@@ -10,12 +11,26 @@ from llm_box.providers.base import LLMBoxProvider, ProviderType
 ProviderFactory = Callable[..., LLMBoxProvider]
 T = TypeVar("T", bound=LLMBoxProvider)
 
+# Provider instances kept for reuse; the least recently used is dropped
+_MAX_CACHED_INSTANCES = 32
+
+
+def _is_hashable(value: Any) -> bool:
+    """Check whether a value can be part of a dict key."""
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
 
 class ProviderRegistry:
     """Factory for creating and caching provider instances.
 
     This registry manages provider factories and caches instances
     to avoid creating multiple instances for the same configuration.
+    At most _MAX_CACHED_INSTANCES instances are kept, so long-running
+    processes that create many configurations don't hold them all.
 
     Usage:
         # Register a provider factory
@@ -28,7 +43,7 @@ class ProviderRegistry:
     """
 
     _factories: dict[ProviderType, ProviderFactory] = {}
-    _instances: dict[str, LLMBoxProvider] = {}
+    _instances: OrderedDict[tuple[Any, ...], LLMBoxProvider] = OrderedDict()
 
     @classmethod
     def register(
@@ -91,8 +106,11 @@ class ProviderRegistry:
         cache_key = cls._build_cache_key(provider_type, model, **kwargs)
 
         # Check cache
-        if use_cache and cache_key in cls._instances:
-            return cls._instances[cache_key]
+        if use_cache:
+            cached = cls._instances.get(cache_key)
+            if cached is not None:
+                cls._instances.move_to_end(cache_key)
+                return cached
 
         # Create new instance
         try:
@@ -108,6 +126,8 @@ class ProviderRegistry:
         # Cache instance
         if use_cache:
             cls._instances[cache_key] = instance
+            if len(cls._instances) > _MAX_CACHED_INSTANCES:
+                cls._instances.popitem(last=False)
 
         return instance
 
@@ -117,12 +137,28 @@ class ProviderRegistry:
         provider_type: ProviderType,
         model: str | None,
         **kwargs: Any,
-    ) -> str:
-        """Build a cache key for provider instances."""
+    ) -> tuple[Any, ...]:
+        """Build a cache key for provider instances.
+
+        The key is a tuple that the cache dict hashes directly, rather than
+        a formatted string. Unhashable argument values are keyed by repr.
+        """
         # Sort kwargs for deterministic key
-        sorted_kwargs = sorted(kwargs.items())
-        kwargs_str = ",".join(f"{k}={v}" for k, v in sorted_kwargs)
-        return f"{provider_type.value}:{model or 'default'}:{kwargs_str}"
+        items = tuple(sorted(kwargs.items())) if kwargs else ()
+        key: tuple[Any, ...] = (provider_type, model, items)
+        try:
+            hash(key)
+        except TypeError:
+            # Three-item entries cannot collide with hashable (name, value) pairs
+            key = (
+                provider_type,
+                model,
+                tuple(
+                    (k, v) if _is_hashable(v) else (k, type(v), repr(v))
+                    for k, v in items
+                ),
+            )
+        return key
 
     @classmethod
     def list_available(cls) -> list[ProviderType]:
@@ -4,6 +4,12 @@ This module provides a unified search interface that combines
 fuzzy and semantic search with result ranking and fusion.
 """
 
+import contextlib
+import heapq
+import os
+from array import array
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
@@ -14,12 +20,23 @@ import duckdb
 
 from llm_box.providers.base import LLMBoxProvider
 from llm_box.search.fuzzy import FuzzySearch
-from llm_box.search.indexer import FileIndexer, FileInfo, IndexStats
+from llm_box.search.indexer import FileIndexer, FileInfo, IndexStats, TextChunk
 from llm_box.search.schema import (
     ALL_INDEXES,
     ALL_TABLES,
 )
-from llm_box.search.semantic import SemanticSearch
+from llm_box.search.semantic import SemanticSearch, unit_vector
+
+# Chunks collected across files before one embedding call is made
+_EMBED_BATCH_SIZE = 256
+# Files written per index_directory transaction
+_WRITE_BATCH_SIZE = 500
+# Embedding batches requested concurrently while indexing continues
+_EMBED_MAX_IN_FLIGHT = 4
+# File listings kept per (path, extensions) filter between index changes
+_FILES_CACHE_SIZE = 32
+# Rows converted at a time when loading embeddings into the chunk cache
+_CHUNK_FETCH_SIZE = 256
 
 
 class SearchMode(str, Enum):
@@ -45,6 +62,14 @@ class SearchResult:
     semantic_score: float | None = None
 
 
+@dataclass
+class _EmbeddingBatch:
+    """Chunks whose embeddings are being generated on a worker thread."""
+
+    future: Future[list[list[float]]]
+    pending: list[tuple[int, TextChunk]]
+
+
 @dataclass
 class SearchResponse:
     """Response from a search operation."""
@@ -93,6 +118,20 @@ class SearchEngine:
         self._conn: duckdb.DuckDBPyConnection | None = None
         self._init_database()
 
+        # Every embedded chunk with its embedding scaled to unit length,
+        # loaded on the first semantic search and dropped when embeddings
+        # change. Embeddings are kept as float32 arrays, the precision the
+        # embeddings column stores, at a fraction of a float list's size.
+        self._chunk_cache: list[dict[str, Any]] | None = None
+        # Indexed file listings by (resolved path, extensions) filter, so
+        # repeated searches over an unchanged index skip the query
+        self._files_cache: dict[
+            tuple[str | None, tuple[str, ...]], list[dict[str, Any]]
+        ] = {}
+        # Resolved search paths by (working directory, path), so searches
+        # skip the filesystem calls Path.resolve makes
+        self._resolved_paths: dict[tuple[str, str], str] = {}
+
     def _init_database(self) -> None:
         """Initialize the database schema."""
         conn = self._get_connection()
@@ -155,30 +194,235 @@ class SearchEngine:
         path = Path(path).resolve()
         stats = IndexStats()
         conn = self._get_connection()
+        embed = generate_embeddings and self.provider is not None
+
+        # Writes are committed in batches, one transaction per batch rather
+        # than per statement. Chunks from the batch's files are embedded
+        # together, one provider call per batch rather than per file.
+        written: list[tuple[FileInfo, str]] = []
+        pending: list[tuple[int, TextChunk]] = []
+        # Embedding calls run on worker threads while the crawl continues;
+        # their results are stored from this thread, which owns the
+        # connection
+        in_flight: deque[_EmbeddingBatch] = deque()
+        # Loaded in one query, so unchanged files need no lookup of their own
+        indexed, known = self._get_indexed_hashes(conn)
+
+        with ThreadPoolExecutor(max_workers=_EMBED_MAX_IN_FLIGHT) as executor:
+            conn.begin()
+            try:
+                # Crawl and index files
+                for file_info in self.indexer.crawl_directory(
+                    path,
+                    extensions=extensions,
+                    ignore_hidden=True,
+                    known=None if force_reindex else known,
+                ):
+                    try:
+                        result, file_id = self._index_file(
+                            conn, file_info, force_reindex, indexed
+                        )
+                    except Exception as e:
+                        stats.errors += 1
+                        stats.error_details.append((file_info.file_path, str(e)))
+                        # A failed statement aborts the transaction, so the
+                        # batch's earlier files are written again
+                        pending = self._replay_batch(
+                            conn, stats, written, force_reindex, indexed, embed
+                        )
+                        if pending:
+                            in_flight.append(self._submit_embeddings(executor, pending))
+                        written, pending = [], []
+                        conn.begin()
+                        continue
+
+                    if result == "unchanged":
+                        stats.files_unchanged += 1
+                    elif result == "skipped":
+                        stats.files_skipped += 1
+                    if file_id is None:
+                        continue
+
+                    written.append((file_info, result))
+                    if embed:
+                        # A file's chunks always land in the same batch
+                        pending.extend(
+                            (file_id, chunk) for chunk in self._chunk_file(file_info)
+                        )
+                    if (
+                        len(pending) >= _EMBED_BATCH_SIZE
+                        or len(written) >= _WRITE_BATCH_SIZE
+                    ):
+                        pending = self._commit_batch(
+                            conn, stats, written, pending, force_reindex, indexed, embed
+                        )
+                        if pending:
+                            in_flight.append(self._submit_embeddings(executor, pending))
+                        written, pending = [], []
+                        # Store finished embeddings, waiting only when too
+                        # many batches are outstanding
+                        while in_flight and (
+                            in_flight[0].future.done()
+                            or len(in_flight) >= _EMBED_MAX_IN_FLIGHT
+                        ):
+                            self._store_batch(conn, stats, in_flight.popleft())
+                        conn.begin()
+            except BaseException:
+                # Between batches, while stored embeddings are awaited, no
+                # transaction may be open
+                with contextlib.suppress(duckdb.TransactionException):
+                    conn.rollback()
+                for batch in in_flight:
+                    batch.future.cancel()
+                raise
+
+            pending = self._commit_batch(
+                conn, stats, written, pending, force_reindex, indexed, embed
+            )
+            if pending:
+                in_flight.append(self._submit_embeddings(executor, pending))
+            while in_flight:
+                self._store_batch(conn, stats, in_flight.popleft())
+
+        return stats
+
+    def _commit_batch(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        stats: IndexStats,
+        written: list[tuple[FileInfo, str]],
+        pending: list[tuple[int, TextChunk]],
+        force_reindex: bool,
+        indexed: dict[str, tuple[int, str]],
+        embed: bool,
+    ) -> list[tuple[int, TextChunk]]:
+        """Commit a batch's file writes and count its files.
 
-        # Crawl and index files
-        for file_info in self.indexer.crawl_directory(
-            path,
-            extensions=extensions,
-            ignore_hidden=True,
-        ):
+        If the commit fails, the batch's files are written again one at a
+        time.
+
+        Returns:
+            Chunks to embed for the batch's committed files.
+        """
+        try:
+            conn.commit()
+        except Exception:
+            return self._replay_batch(
+                conn, stats, written, force_reindex, indexed, embed
+            )
+
+        for _, result in written:
+            if result == "indexed":
+                stats.files_indexed += 1
+            else:
+                stats.files_updated += 1
+        return pending
+
+    def _replay_batch(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        stats: IndexStats,
+        written: list[tuple[FileInfo, str]],
+        force_reindex: bool,
+        indexed: dict[str, tuple[int, str]],
+        embed: bool,
+    ) -> list[tuple[int, TextChunk]]:
+        """Roll back a failed batch and write its files again.
+
+        Each file is written outside a transaction, so one that fails again
+        is the only one reported as an error.
+
+        Returns:
+            Chunks to embed for the files written again.
+        """
+        conn.rollback()
+        self._index_changed()
+
+        pending: list[tuple[int, TextChunk]] = []
+        for file_info, _ in written:
             try:
-                result = self._index_file(
-                    conn, file_info, force_reindex, generate_embeddings
+                result, file_id = self._index_file(
+                    conn, file_info, force_reindex, indexed
                 )
-                if result == "indexed":
-                    stats.files_indexed += 1
-                elif result == "updated":
-                    stats.files_updated += 1
-                elif result == "unchanged":
-                    stats.files_unchanged += 1
-                elif result == "skipped":
-                    stats.files_skipped += 1
             except Exception as e:
                 stats.errors += 1
                 stats.error_details.append((file_info.file_path, str(e)))
+                continue
+            if file_id is None:
+                continue
 
-        return stats
+            if result == "indexed":
+                stats.files_indexed += 1
+            else:
+                stats.files_updated += 1
+            if embed:
+                pending.extend(
+                    (file_id, chunk) for chunk in self._chunk_file(file_info)
+                )
+        return pending
+
+    def _submit_embeddings(
+        self,
+        executor: ThreadPoolExecutor,
+        pending: list[tuple[int, TextChunk]],
+    ) -> _EmbeddingBatch:
+        """Start embedding a batch's chunks on a worker thread."""
+        texts = [chunk.text for _, chunk in pending]
+        return _EmbeddingBatch(
+            executor.submit(self.semantic.embed_texts, texts), pending
+        )
+
+    def _store_batch(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        stats: IndexStats,
+        batch: _EmbeddingBatch,
+    ) -> None:
+        """Wait for a batch's embeddings and store them in one transaction.
+
+        If embedding or storing fails, the batch's files are reported as
+        errors and their hashes are cleared, so the next run indexes them
+        again.
+        """
+        embeddings = batch.future.result()
+        if len(embeddings) != len(batch.pending):
+            # embed_texts returns no embeddings when the provider fails
+            self._fail_batch(conn, stats, batch.pending, "embedding failed")
+            return
+
+        conn.begin()
+        try:
+            stats.total_chunks += self._write_embeddings(
+                conn, batch.pending, embeddings
+            )
+            conn.commit()
+        except Exception as e:
+            conn.rollback()
+            self._fail_batch(conn, stats, batch.pending, str(e))
+
+    def _fail_batch(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        stats: IndexStats,
+        pending: list[tuple[int, TextChunk]],
+        error: str,
+    ) -> None:
+        """Report the files of a batch left without embeddings as errors.
+
+        Their hashes are cleared, so the next run indexes them again.
+        """
+        self._index_changed()
+        paths = dict.fromkeys(chunk.file_path for _, chunk in pending)
+        stats.errors += len(paths)
+        stats.error_details.extend((file_path, error) for file_path in paths)
+
+        file_ids = list(dict.fromkeys(file_id for file_id, _ in pending))
+        placeholders = ",".join("?" for _ in file_ids)
+        with contextlib.suppress(Exception):
+            conn.execute(
+                f"UPDATE file_index SET file_hash = '' WHERE id IN ({placeholders})",
+                file_ids,
+            )
 
     def index_file(
         self,
@@ -204,7 +448,12 @@ class SearchEngine:
         if not file_info or file_info.is_binary:
             return False
 
-        result = self._index_file(conn, file_info, force_reindex, generate_embeddings)
+        result, file_id = self._index_file(conn, file_info, force_reindex)
+
+        # Generate and store embeddings
+        if generate_embeddings and self.provider and file_id is not None:
+            self._generate_embeddings(conn, file_id, file_info)
+
         return result in ("indexed", "updated")
 
     def _index_file(
@@ -212,24 +461,40 @@ class SearchEngine:
         conn: duckdb.DuckDBPyConnection,
         file_info: FileInfo,
         force_reindex: bool,
-        generate_embeddings: bool,
-    ) -> str:
+        indexed: dict[str, tuple[int, str]] | None = None,
+    ) -> tuple[str, int | None]:
         """Internal method to index a file.
 
+        Embeddings are left to the caller, so they can be batched.
+
+        Args:
+            conn: Database connection.
+            file_info: File to index.
+            force_reindex: Re-index even if unchanged.
+            indexed: Row id and hash of every indexed file by path, the
+                first map _get_indexed_hashes returns. Looked up instead of
+                querying the file's row when given.
+
         Returns:
-            'indexed', 'updated', 'unchanged', or 'skipped'
+            'indexed', 'updated', 'unchanged', or 'skipped', and the file's
+            row id when it was written.
         """
-        if file_info.is_binary or not file_info.content:
-            return "skipped"
+        if file_info.is_binary:
+            return "skipped", None
 
         # Check if file exists and is unchanged
-        existing = conn.execute(
-            "SELECT id, file_hash FROM file_index WHERE file_path = ?",
-            [file_info.file_path],
-        ).fetchone()
+        if indexed is not None:
+            existing = indexed.get(file_info.file_path)
+        else:
+            existing = conn.execute(
+                "SELECT id, file_hash FROM file_index WHERE file_path = ?",
+                [file_info.file_path],
+            ).fetchone()
 
         if existing and not force_reindex and existing[1] == file_info.file_hash:
-            return "unchanged"
+            return "unchanged", None
+        if not file_info.content:
+            return "skipped", None
 
         # Insert or update file index
         if existing:
@@ -260,13 +525,14 @@ class SearchEngine:
             )
             result = "updated"
         else:
-            conn.execute(
+            row = conn.execute(
                 """
                 INSERT INTO file_index
                 (file_path, filename, extension, file_hash, size_bytes,
                  modified_at, indexed_at, content_preview, is_hidden,
                  is_binary, language, line_count)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                RETURNING id
             """,
                 [
                     file_info.file_path,
@@ -282,18 +548,59 @@ class SearchEngine:
                     file_info.language,
                     file_info.line_count,
                 ],
-            )
-            row = conn.execute(
-                "SELECT id FROM file_index WHERE file_path = ?", [file_info.file_path]
             ).fetchone()
             file_id = row[0] if row else 0
             result = "indexed"
 
-        # Generate and store embeddings
-        if generate_embeddings and self.provider and file_info.content:
-            self._generate_embeddings(conn, file_id, file_info)
+        self._index_changed()
+        return result, file_id
 
-        return result
+    def _get_indexed_hashes(
+        self, conn: duckdb.DuckDBPyConnection
+    ) -> tuple[dict[str, tuple[int, str]], dict[str, tuple[int, datetime, str]]]:
+        """Get what is recorded about every indexed file, keyed by path.
+
+        Returns:
+            Each file's row id and hash, and the size, modification time
+            and hash of files whose embeddings are complete, for the
+            crawler to skip unchanged files by.
+        """
+        rows = conn.execute(
+            "SELECT file_path, id, file_hash, size_bytes, modified_at FROM file_index"
+        ).fetchall()
+        indexed = {
+            path: (file_id, file_hash) for path, file_id, file_hash, _, _ in rows
+        }
+        # A cleared hash marks a file to index again, so it is left out
+        known = {
+            path: (size, modified_at, file_hash)
+            for path, _, file_hash, size, modified_at in rows
+            if file_hash
+        }
+        return indexed, known
+
+    def _index_changed(self) -> None:
+        """Drop the cached file listings and chunks after an index write."""
+        self._files_cache.clear()
+        self._chunk_cache = None
+        self._resolved_paths.clear()
+
+    def _resolve_search_path(self, path: Path | str) -> str:
+        """Resolve a search path filter, caching the result."""
+        key = (os.getcwd(), str(path))
+        resolved = self._resolved_paths.get(key)
+        if resolved is None:
+            resolved = str(Path(path).resolve())
+            if len(self._resolved_paths) >= _FILES_CACHE_SIZE:
+                self._resolved_paths.clear()
+            self._resolved_paths[key] = resolved
+        return resolved
+
+    def _chunk_file(self, file_info: FileInfo) -> list[TextChunk]:
+        """Split a file's content into chunks for embedding."""
+        if not file_info.content:
+            return []
+        return self.indexer.chunk_content(file_info.content, file_info.file_path)
 
     def _generate_embeddings(
         self,
@@ -306,46 +613,74 @@ class SearchEngine:
         Returns:
             Number of chunks embedded.
         """
-        if not file_info.content:
-            return 0
+        chunks = self._chunk_file(file_info)
+        return self._store_embeddings(conn, [(file_id, chunk) for chunk in chunks])
 
-        # Chunk the content
-        chunks = self.indexer.chunk_content(
-            file_info.content,
-            file_info.file_path,
-        )
+    def _store_embeddings(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        pending: list[tuple[int, TextChunk]],
+    ) -> int:
+        """Embed chunks from one or more files in a single call and store them.
 
-        if not chunks:
+        Each file's previous embeddings are replaced, so all of a file's
+        chunks must be in the same call.
+
+        Returns:
+            Number of chunks embedded.
+        """
+        if not pending:
             return 0
 
         # Generate embeddings
-        texts = [chunk.text for chunk in chunks]
+        texts = [chunk.text for _, chunk in pending]
         embeddings = self.semantic.embed_texts(texts)
+        return self._write_embeddings(conn, pending, embeddings)
 
-        if not embeddings or len(embeddings) != len(chunks):
+    def _write_embeddings(
+        self,
+        conn: duckdb.DuckDBPyConnection,
+        pending: list[tuple[int, TextChunk]],
+        embeddings: list[list[float]],
+    ) -> int:
+        """Replace the stored embeddings of the files in pending.
+
+        Returns:
+            Number of chunks stored.
+        """
+        if not embeddings or len(embeddings) != len(pending):
             return 0
 
+        self._index_changed()
+
         # Delete old embeddings
-        conn.execute("DELETE FROM embeddings WHERE file_id = ?", [file_id])
+        file_ids = list(dict.fromkeys(file_id for file_id, _ in pending))
+        placeholders = ",".join("?" for _ in file_ids)
+        conn.execute(
+            f"DELETE FROM embeddings WHERE file_id IN ({placeholders})", file_ids
+        )
 
-        # Insert new embeddings
-        for chunk, embedding in zip(chunks, embeddings, strict=True):
-            conn.execute(
-                """
-                INSERT INTO embeddings
-                (file_id, chunk_index, chunk_text, embedding, model)
-                VALUES (?, ?, ?, ?, ?)
-            """,
-                [
-                    file_id,
-                    chunk.chunk_index,
-                    chunk.text[:2000],
-                    embedding,
-                    self.provider.model_name if self.provider else "unknown",
-                ],
-            )
+        # Insert new embeddings in one statement. Vectors are passed as
+        # text and cast by DuckDB: binding them as Python float lists costs
+        # far more than the insert itself.
+        model = self.provider.model_name if self.provider else "unknown"
+        conn.execute(
+            """
+            INSERT INTO embeddings
+            (file_id, chunk_index, chunk_text, embedding, model)
+            SELECT unnest(?::INTEGER[]), unnest(?::INTEGER[]),
+                   unnest(?::VARCHAR[]), unnest(?::FLOAT[][]), ?
+        """,
+            [
+                [file_id for file_id, _ in pending],
+                [chunk.chunk_index for _, chunk in pending],
+                [chunk.text[:2000] for _, chunk in pending],
+                str(embeddings),
+                model,
+            ],
+        )
 
-        return len(chunks)
+        return len(pending)
 
     # -------------------------------------------------------------------------
     # Search Operations
@@ -411,9 +746,17 @@ class SearchEngine:
     ) -> list[dict[str, Any]]:
         """Get indexed files from database.
 
+        Listings are cached per filter until the index changes.
+
         Returns:
             List of file records.
         """
+        path_str = self._resolve_search_path(path) if path else None
+        key = (path_str, tuple(extensions or ()))
+        files = self._files_cache.get(key)
+        if files is not None:
+            return files
+
         query = """
             SELECT file_path, filename, extension, content_preview,
                    language, line_count
@@ -422,8 +765,7 @@ class SearchEngine:
         """
         params: list[Any] = []
 
-        if path:
-            path_str = str(Path(path).resolve())
+        if path_str:
             query += " AND file_path LIKE ?"
             params.append(f"{path_str}%")
 
@@ -434,7 +776,7 @@ class SearchEngine:
 
         rows = conn.execute(query, params).fetchall()
 
-        return [
+        files = [
             {
                 "file_path": row[0],
                 "filename": row[1],
@@ -446,6 +788,12 @@ class SearchEngine:
             for row in rows
         ]
 
+        if len(self._files_cache) >= _FILES_CACHE_SIZE:
+            # Evict the oldest listing
+            del self._files_cache[next(iter(self._files_cache))]
+        self._files_cache[key] = files
+        return files
+
     def _search_fuzzy(
         self,
         query: str,
@@ -458,11 +806,12 @@ class SearchEngine:
             List of SearchResult objects.
         """
         fuzzy_results = self.fuzzy.search_combined(query, files)
+        files_by_path = {f["file_path"]: f for f in files}
 
         results = []
         for fr in fuzzy_results[:top_k]:
             # Find file info
-            file_info = next((f for f in files if f["file_path"] == fr.file_path), {})
+            file_info = files_by_path.get(fr.file_path, {})
 
             results.append(
                 SearchResult(
@@ -499,7 +848,7 @@ class SearchEngine:
         if not chunks:
             return []
 
-        semantic_results = self.semantic.search_files(query, chunks)
+        semantic_results = self.semantic.search_files(query, chunks, normalized=True)
 
         results = []
         for sr in semantic_results[:top_k]:
@@ -537,66 +886,75 @@ class SearchEngine:
             query, conn, path, extensions, top_k * 2
         )
 
-        # Build score map by file
-        scores: dict[str, dict[str, Any]] = {}
+        # Per-file fields in parallel lists, indexed by each file's
+        # position in first-seen order
+        index: dict[str, int] = {}
+        paths: list[str] = []
+        filenames: list[str] = []
+        languages: list[str | None] = []
+        previews: list[str] = []
+        line_numbers: list[int | None] = []
+        fuzzy_scores: list[float] = []
+        semantic_scores: list[float] = []
+
+        def slot(file_path: str, filename: str, language: str | None) -> int:
+            i = index.get(file_path)
+            if i is None:
+                i = index[file_path] = len(paths)
+                paths.append(file_path)
+                filenames.append(filename)
+                languages.append(language)
+                previews.append("")
+                line_numbers.append(None)
+                fuzzy_scores.append(0.0)
+                semantic_scores.append(0.0)
+            return i
 
         for fr in fuzzy_results:
-            path_key = fr.file_path
-            if path_key not in scores:
-                scores[path_key] = {
-                    "filename": fr.filename,
-                    "fuzzy": 0.0,
-                    "semantic": 0.0,
-                    "preview": "",
-                    "language": fr.language,
-                    "line_number": None,
-                }
-            scores[path_key]["fuzzy"] = max(scores[path_key]["fuzzy"], fr.score)
-            if not scores[path_key]["preview"]:
-                scores[path_key]["preview"] = fr.preview
+            i = slot(fr.file_path, fr.filename, fr.language)
+            if fr.score > fuzzy_scores[i]:
+                fuzzy_scores[i] = fr.score
+            if not previews[i]:
+                previews[i] = fr.preview
 
         for sr in semantic_results:
-            path_key = sr.file_path
-            if path_key not in scores:
-                scores[path_key] = {
-                    "filename": sr.filename,
-                    "fuzzy": 0.0,
-                    "semantic": 0.0,
-                    "preview": "",
-                    "language": None,
-                    "line_number": None,
-                }
-            scores[path_key]["semantic"] = max(scores[path_key]["semantic"], sr.score)
-            if not scores[path_key]["preview"]:
-                scores[path_key]["preview"] = sr.preview
+            i = slot(sr.file_path, sr.filename, None)
+            if sr.score > semantic_scores[i]:
+                semantic_scores[i] = sr.score
+            if not previews[i]:
+                previews[i] = sr.preview
             if sr.line_number:
-                scores[path_key]["line_number"] = sr.line_number
+                line_numbers[i] = sr.line_number
 
         # Compute combined scores
-        results = []
-        for path_key, data in scores.items():
-            combined_score = (
-                data["fuzzy"] * self.fuzzy_weight
-                + data["semantic"] * self.semantic_weight
-            )
+        fuzzy_weight = self.fuzzy_weight
+        semantic_weight = self.semantic_weight
+        combined = [
+            f * fuzzy_weight + s * semantic_weight
+            for f, s in zip(fuzzy_scores, semantic_scores, strict=True)
+        ]
 
+        # Select the best files, building results only for those
+        top = heapq.nlargest(top_k, range(len(paths)), key=combined.__getitem__)
+        results = []
+        for i in top:
+            fuzzy_score = fuzzy_scores[i]
+            semantic_score = semantic_scores[i]
             results.append(
                 SearchResult(
-                    file_path=path_key,
-                    filename=data["filename"],
-                    score=combined_score,
+                    file_path=paths[i],
+                    filename=filenames[i],
+                    score=combined[i],
                     match_type="combined",
-                    preview=data["preview"],
-                    language=data["language"],
-                    line_number=data["line_number"],
-                    fuzzy_score=data["fuzzy"] if data["fuzzy"] > 0 else None,
-                    semantic_score=data["semantic"] if data["semantic"] > 0 else None,
+                    preview=previews[i],
+                    language=languages[i],
+                    line_number=line_numbers[i],
+                    fuzzy_score=fuzzy_score if fuzzy_score > 0 else None,
+                    semantic_score=semantic_score if semantic_score > 0 else None,
                 )
             )
 
-        # Sort by combined score
-        results.sort(key=lambda r: r.score, reverse=True)
-        return results[:top_k]
+        return results
 
     def _get_indexed_chunks(
         self,
@@ -604,43 +962,63 @@ class SearchEngine:
         path: Path | str | None = None,
         extensions: list[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get indexed chunks with embeddings from database.
+        """Get indexed chunks with embeddings.
+
+        Chunks are served from an in-memory copy of the embeddings table,
+        with each embedding already scaled to unit length, so repeated
+        searches neither reload nor renormalize them.
 
         Returns:
             List of chunk records.
         """
-        query = """
-            SELECT f.file_path, f.filename, e.chunk_index, e.chunk_text,
-                   e.embedding, f.language
-            FROM embeddings e
-            JOIN file_index f ON e.file_id = f.id
-            WHERE e.embedding IS NOT NULL
-        """
-        params: list[Any] = []
+        if self._chunk_cache is None:
+            self._chunk_cache = self._load_chunks(conn)
+        chunks = self._chunk_cache
 
         if path:
-            path_str = str(Path(path).resolve())
-            query += " AND f.file_path LIKE ?"
-            params.append(f"{path_str}%")
+            path_str = self._resolve_search_path(path)
+            chunks = [c for c in chunks if c["file_path"].startswith(path_str)]
 
         if extensions:
-            placeholders = ",".join("?" for _ in extensions)
-            query += f" AND f.extension IN ({placeholders})"
-            params.extend(extensions)
+            wanted = set(extensions)
+            chunks = [c for c in chunks if c["extension"] in wanted]
 
-        rows = conn.execute(query, params).fetchall()
+        return chunks
 
-        return [
-            {
-                "file_path": row[0],
-                "filename": row[1],
-                "chunk_index": row[2],
-                "chunk_text": row[3],
-                "embedding": row[4],
-                "language": row[5],
-            }
-            for row in rows
-        ]
+    def _load_chunks(self, conn: duckdb.DuckDBPyConnection) -> list[dict[str, Any]]:
+        """Load every embedded chunk, normalizing its embedding.
+
+        Returns:
+            List of chunk records.
+        """
+        result = conn.execute("""
+            SELECT f.file_path, f.filename, f.extension, e.chunk_index,
+                   e.chunk_text, e.embedding, f.language
+            FROM embeddings e
+            JOIN file_index f ON e.file_id = f.id
+            WHERE e.embedding IS NOT NULL
+        """)
+
+        # Rows are fetched in batches and their embeddings packed as they
+        # arrive, so only one batch of float lists is alive at a time
+        chunks = []
+        while rows := result.fetchmany(_CHUNK_FETCH_SIZE):
+            for row in rows:
+                embedding = unit_vector(row[5])
+                if embedding is None:
+                    continue
+                chunks.append(
+                    {
+                        "file_path": row[0],
+                        "filename": row[1],
+                        "extension": row[2],
+                        "chunk_index": row[3],
+                        "chunk_text": row[4],
+                        "embedding": array("f", embedding),
+                        "language": row[6],
+                    }
+                )
+        return chunks
 
     def _record_search(
         self,
@@ -650,8 +1028,6 @@ class SearchEngine:
         result_count: int,
     ) -> None:
         """Record search in history."""
-        import contextlib
-
         with contextlib.suppress(Exception):
             conn.execute(
                 """
@@ -708,6 +1084,7 @@ class SearchEngine:
 
         conn.execute("DELETE FROM embeddings")
         conn.execute("DELETE FROM file_index")
+        self._index_changed()
         conn.execute("DELETE FROM search_history")
 
         return count
@@ -4,7 +4,7 @@ This module provides functionality to crawl directories and index files
 for searching, including content extraction and chunking for embeddings.
 """
 
-from collections.abc import Iterator
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -221,6 +221,7 @@ class FileIndexer:
         extensions: list[str] | None = None,
         ignore_hidden: bool = True,
         ignore_patterns: list[str] | None = None,
+        known: Mapping[str, tuple[int, datetime, str]] | None = None,
     ) -> Iterator[FileInfo]:
         """Crawl a directory and yield file information.
 
@@ -230,6 +231,10 @@ class FileIndexer:
                        If None, includes all non-binary files.
             ignore_hidden: Whether to ignore hidden files/directories.
             ignore_patterns: Additional patterns to ignore.
+            known: Size, modification time and hash of previously indexed
+                files by path. Files whose size and modification time still
+                match are not read; they are yielded with the known hash
+                and no content.
 
         Yields:
             FileInfo objects for each discovered file.
@@ -267,17 +272,23 @@ class FileIndexer:
 
             # Get file info
             try:
-                file_info = self._get_file_info(item)
+                file_info = self._get_file_info(item, known)
                 if file_info:
                     yield file_info
             except (OSError, PermissionError):
                 continue
 
-    def _get_file_info(self, file_path: Path) -> FileInfo | None:
+    def _get_file_info(
+        self,
+        file_path: Path,
+        known: Mapping[str, tuple[int, datetime, str]] | None = None,
+    ) -> FileInfo | None:
         """Extract information from a file.
 
         Args:
             file_path: Path to the file.
+            known: Size, modification time and hash of previously indexed
+                files by path, as for crawl_directory.
 
         Returns:
             FileInfo object or None if file cannot be processed.
@@ -285,6 +296,26 @@ class FileIndexer:
         try:
             stat = file_path.stat()
             size = stat.st_size
+            modified_at = datetime.fromtimestamp(stat.st_mtime)
+
+            # Unchanged since it was indexed: skip reading and hashing
+            if known:
+                entry = known.get(str(file_path))
+                if entry and entry[0] == size and entry[1] == modified_at:
+                    return FileInfo(
+                        file_path=str(file_path),
+                        filename=file_path.name,
+                        extension=file_path.suffix.lower(),
+                        file_hash=entry[2],
+                        size_bytes=size,
+                        modified_at=modified_at,
+                        content_preview=None,
+                        is_hidden=file_path.name.startswith("."),
+                        is_binary=False,
+                        language=LANGUAGE_MAP.get(file_path.suffix.lower()),
+                        line_count=None,
+                        content=None,
+                    )
 
             # Skip files that are too large
             if size > self.max_file_size:
@@ -294,7 +325,7 @@ class FileIndexer:
                     extension=file_path.suffix.lower(),
                     file_hash="",
                     size_bytes=size,
-                    modified_at=datetime.fromtimestamp(stat.st_mtime),
+                    modified_at=modified_at,
                     content_preview=None,
                     is_hidden=file_path.name.startswith("."),
                     is_binary=True,  # Treat as binary (too large)
@@ -312,7 +343,7 @@ class FileIndexer:
                     extension=file_path.suffix.lower(),
                     file_hash="",
                     size_bytes=size,
-                    modified_at=datetime.fromtimestamp(stat.st_mtime),
+                    modified_at=modified_at,
                     content_preview=None,
                     is_hidden=file_path.name.startswith("."),
                     is_binary=True,
@@ -333,7 +364,7 @@ class FileIndexer:
                 extension=file_path.suffix.lower(),
                 file_hash=file_hash,
                 size_bytes=size,
-                modified_at=datetime.fromtimestamp(stat.st_mtime),
+                modified_at=modified_at,
                 content_preview=preview,
                 is_hidden=file_path.name.startswith("."),
                 is_binary=False,
@@ -5,11 +5,33 @@ for natural language queries against indexed file content.
 """
 
 import math
+from collections import OrderedDict
+from collections.abc import Callable
 from dataclasses import dataclass
+from operator import mul
 from typing import Any
 
 from llm_box.providers.base import LLMBoxProvider
 
+# Query embeddings kept per SemanticSearch, so repeated queries skip the
+# provider call
+_QUERY_CACHE_SIZE = 512
+
+
+def unit_vector(vec: list[float]) -> list[float] | None:
+    """Scale a vector to unit length.
+
+    Args:
+        vec: Vector to normalize.
+
+    Returns:
+        The normalized vector, or None for an empty or zero vector.
+    """
+    norm = math.sqrt(sum(map(mul, vec, vec)))
+    if norm == 0:
+        return None
+    return [x / norm for x in vec]
+
 
 @dataclass
 class SemanticResult:
@@ -47,6 +69,7 @@ class SemanticSearch:
         self.provider = provider
         self.min_score = min_score
         self.max_results = max_results
+        self._query_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
 
     def set_provider(self, provider: LLMBoxProvider) -> None:
         """Set the LLM provider.
@@ -55,10 +78,14 @@ class SemanticSearch:
             provider: LLM provider with embedding support.
         """
         self.provider = provider
+        self._query_cache.clear()
 
     def embed_query(self, query: str) -> list[float] | None:
         """Generate embedding for a search query.
 
+        Embeddings are cached per model and query, so callers must not
+        modify the returned vector.
+
         Args:
             query: Search query text.
 
@@ -68,14 +95,24 @@ class SemanticSearch:
         if not self.provider:
             return None
 
+        key = (self.provider.model_name, query)
+        cached = self._query_cache.get(key)
+        if cached is not None:
+            self._query_cache.move_to_end(key)
+            return cached
+
         try:
             response = self.provider.embed([query])
-            if response.embeddings:
-                return response.embeddings[0]
         except Exception:
-            pass
+            return None
+        if not response.embeddings:
+            return None
 
-        return None
+        embedding = response.embeddings[0]
+        self._query_cache[key] = embedding
+        if len(self._query_cache) > _QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return embedding
 
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """Generate embeddings for multiple texts.
@@ -125,6 +162,7 @@ class SemanticSearch:
         self,
         query: str,
         indexed_chunks: list[dict[str, Any]],
+        normalized: bool = False,
     ) -> list[SemanticResult]:
         """Search indexed chunks using semantic similarity.
 
@@ -133,6 +171,7 @@ class SemanticSearch:
             indexed_chunks: List of chunk records with embeddings.
                 Expected keys: file_path, filename, chunk_index,
                 chunk_text, embedding, start_line, end_line
+            normalized: Whether the chunk embeddings are already unit length.
 
         Returns:
             List of SemanticResult objects sorted by similarity.
@@ -142,31 +181,53 @@ class SemanticSearch:
         if not query_embedding:
             return []
 
-        return self.search_with_embedding(query_embedding, indexed_chunks)
+        return self.search_with_embedding(query_embedding, indexed_chunks, normalized)
 
     def search_with_embedding(
         self,
         query_embedding: list[float],
         indexed_chunks: list[dict[str, Any]],
+        normalized: bool = False,
     ) -> list[SemanticResult]:
         """Search using a pre-computed query embedding.
 
         Args:
             query_embedding: Pre-computed embedding vector.
             indexed_chunks: List of chunk records with embeddings.
+            normalized: Whether the chunk embeddings are already unit length.
+                The query is then normalized once and each chunk costs a
+                single dot product instead of a full cosine similarity.
 
         Returns:
             List of SemanticResult objects sorted by similarity.
         """
         results: list[SemanticResult] = []
 
+        similarity_to: Callable[[list[float]], float]
+        if normalized:
+            unit_query = unit_vector(query_embedding)
+            if unit_query is None:
+                return []
+            dimensions = len(unit_query)
+
+            def similarity_to(embedding: list[float]) -> float:
+                if len(embedding) != dimensions:
+                    return 0.0
+                dot: float = sum(map(mul, unit_query, embedding))
+                return dot
+
+        else:
+
+            def similarity_to(embedding: list[float]) -> float:
+                return self.cosine_similarity(query_embedding, embedding)
+
         for chunk in indexed_chunks:
             chunk_embedding = chunk.get("embedding")
             if not chunk_embedding:
                 continue
 
             # Calculate similarity
-            similarity = self.cosine_similarity(query_embedding, chunk_embedding)
+            similarity = similarity_to(chunk_embedding)
 
             if similarity >= self.min_score:
                 results.append(
@@ -189,6 +250,7 @@ class SemanticSearch:
         self,
         query: str,
         indexed_chunks: list[dict[str, Any]],
+        normalized: bool = False,
     ) -> list[SemanticResult]:
         """Search and group results by file.
 
@@ -197,11 +259,12 @@ class SemanticSearch:
         Args:
             query: Natural language search query.
             indexed_chunks: List of chunk records with embeddings.
+            normalized: Whether the chunk embeddings are already unit length.
 
         Returns:
             List of SemanticResult objects, one per file.
         """
-        all_results = self.search(query, indexed_chunks)
+        all_results = self.search(query, indexed_chunks, normalized)
 
         # Group by file, keeping best score per file
         file_results: dict[str, SemanticResult] = {}
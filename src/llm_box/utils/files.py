@@ -1,6 +1,7 @@
 """File operations utilities."""
 
 from collections.abc import Iterator
+from functools import lru_cache
 from pathlib import Path
 
 # Binary file extensions to skip
@@ -54,6 +55,54 @@ BINARY_EXTENSIONS = frozenset(
     }
 )
 
+# Extensions whose contents are never sent to an LLM (tldr, why)
+UNREADABLE_EXTENSIONS = frozenset(
+    {
+        ".exe",
+        ".dll",
+        ".so",
+        ".dylib",
+        ".bin",
+        ".dat",
+        ".png",
+        ".jpg",
+        ".jpeg",
+        ".gif",
+        ".bmp",
+        ".ico",
+        ".webp",
+        ".mp3",
+        ".wav",
+        ".ogg",
+        ".flac",
+        ".aac",
+        ".mp4",
+        ".avi",
+        ".mkv",
+        ".mov",
+        ".webm",
+        ".zip",
+        ".tar",
+        ".gz",
+        ".bz2",
+        ".xz",
+        ".7z",
+        ".rar",
+        ".pdf",
+        ".doc",
+        ".docx",
+        ".xls",
+        ".xlsx",
+        ".ppt",
+        ".pptx",
+        ".pyc",
+        ".pyo",
+        ".class",
+        ".o",
+        ".a",
+    }
+)
+
 # Common hidden/ignored directories
 IGNORED_DIRS = frozenset(
     {
@@ -134,6 +183,55 @@ LANGUAGE_MAP = {
 }
 
 
+# Human-readable file type names used in prompts. Compound extensions
+# (e.g. ".d.ts") take precedence over their last component.
+FILE_TYPE_NAMES = {
+    ".d.ts": "TypeScript declaration",
+    ".min.js": "minified JavaScript",
+    ".min.css": "minified CSS",
+    ".py": "Python",
+    ".js": "JavaScript",
+    ".ts": "TypeScript",
+    ".jsx": "React JSX",
+    ".tsx": "React TSX",
+    ".java": "Java",
+    ".c": "C",
+    ".cpp": "C++",
+    ".cc": "C++",
+    ".h": "C header",
+    ".hpp": "C++ header",
+    ".go": "Go",
+    ".rs": "Rust",
+    ".rb": "Ruby",
+    ".php": "PHP",
+    ".swift": "Swift",
+    ".kt": "Kotlin",
+    ".scala": "Scala",
+    ".sh": "Shell script",
+    ".bash": "Bash script",
+    ".zsh": "Zsh script",
+    ".sql": "SQL",
+    ".html": "HTML",
+    ".css": "CSS",
+    ".scss": "SCSS",
+    ".less": "Less",
+    ".json": "JSON",
+    ".yaml": "YAML",
+    ".yml": "YAML",
+    ".toml": "TOML",
+    ".xml": "XML",
+    ".md": "Markdown",
+    ".rst": "reStructuredText",
+    ".txt": "text",
+}
+
+# Extension -> (file type name, unreadable) for classify_file()
+_EXTENSION_CLASSES: dict[str, tuple[str | None, bool]] = {
+    **{ext: (name, False) for ext, name in FILE_TYPE_NAMES.items()},
+    **dict.fromkeys(UNREADABLE_EXTENSIONS, (None, True)),
+}
+
+
 def is_binary_file(path: Path) -> bool:
     """Check if a file is likely binary based on extension.
 
@@ -146,6 +244,43 @@ def is_binary_file(path: Path) -> bool:
     return path.suffix.lower() in BINARY_EXTENSIONS
 
 
+def classify_file(path: Path) -> tuple[str | None, bool]:
+    """Classify a file by its extension, including compound extensions.
+
+    Candidate extensions are tried longest first, so ``x.d.ts`` matches
+    ``.d.ts`` before ``.ts`` and ``x.tar.gz`` falls back to ``.gz``. As with
+    ``Path.suffix``, a leading dot (hidden file) does not start an extension.
+
+    Args:
+        path: Path to file.
+
+    Returns:
+        Tuple of (file type name from FILE_TYPE_NAMES or None if unknown,
+        whether the extension is in UNREADABLE_EXTENSIONS).
+    """
+    name = path.name.lower()
+    start = name.find(".", 1)
+    if start == -1:
+        return None, False
+    return _classify_suffixes(name[start:])
+
+
+@lru_cache(maxsize=128)
+def _classify_suffixes(suffixes: str) -> tuple[str | None, bool]:
+    """Classify the lowercased ``suffixes`` part of a file name.
+
+    Memoized because tree walks look up the same few extensions over and
+    over.
+    """
+    start = 0
+    while start != -1:
+        match = _EXTENSION_CLASSES.get(suffixes[start:])
+        if match is not None:
+            return match
+        start = suffixes.find(".", start + 1)
+    return None, False
+
+
 def is_hidden(path: Path) -> bool:
     """Check if a file or directory is hidden.
 
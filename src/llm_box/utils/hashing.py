@@ -1,8 +1,26 @@
 """Content and file hashing utilities."""
 
+import contextlib
 import hashlib
+import os
 from pathlib import Path
 
+# Chunk size for reads that hash as they go
+_READ_CHUNK_SIZE = 64 * 1024
+
+# posix_fadvise is only available on some platforms (not Windows or macOS)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
+
+def _advise(fd: int, advice: int) -> None:
+    """Pass page-cache advice for a whole file, ignoring refusals.
+
+    Callers check _HAS_FADVISE first, since the advice constants are
+    missing where posix_fadvise is.
+    """
+    with contextlib.suppress(OSError):
+        os.posix_fadvise(fd, 0, 0, advice)
+
 
 def hash_content(content: str, length: int = 16) -> str:
     """Hash string content using SHA256.
@@ -51,6 +69,73 @@ def hash_file(path: Path, length: int = 16) -> str:
     return sha256.hexdigest()[:length]
 
 
+def read_and_hash(
+    path: Path, max_bytes: int | None = None, length: int = 16
+) -> tuple[bytes, str]:
+    """Read file bytes and hash them in the same pass using BLAKE2b.
+
+    The digest is updated chunk by chunk as the file is read, so the data
+    is traversed once instead of being read, decoded, re-encoded and hashed.
+    Where supported, the kernel is told the read is sequential and the
+    pages are dropped afterwards, since the file is only read once.
+
+    Args:
+        path: Path to file.
+        max_bytes: Maximum number of bytes to read (None reads everything).
+        length: Length of hash to return (max 128).
+
+    Returns:
+        Tuple of (bytes read, hex digest of those bytes).
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        IOError: If file cannot be read.
+    """
+    digest = hashlib.blake2b(digest_size=(length + 1) // 2)
+    buf = bytearray()
+    remaining = max_bytes
+    with open(path, "rb") as f:
+        if _HAS_FADVISE:
+            _advise(f.fileno(), os.POSIX_FADV_SEQUENTIAL)
+        while remaining is None or remaining > 0:
+            size = _READ_CHUNK_SIZE
+            if remaining is not None:
+                size = min(size, remaining)
+            chunk = f.read(size)
+            if not chunk:
+                break
+            digest.update(chunk)
+            buf += chunk
+            if remaining is not None:
+                remaining -= len(chunk)
+        if _HAS_FADVISE:
+            _advise(f.fileno(), os.POSIX_FADV_DONTNEED)
+    return bytes(buf), digest.hexdigest()[:length]
+
+
+def read_bytes(path: Path, max_bytes: int | None = None) -> bytes:
+    """Read file bytes once, with the same page-cache advice as read_and_hash.
+
+    Args:
+        path: Path to file.
+        max_bytes: Maximum number of bytes to read (None reads everything).
+
+    Returns:
+        The bytes read.
+
+    Raises:
+        FileNotFoundError: If file doesn't exist.
+        IOError: If file cannot be read.
+    """
+    with open(path, "rb") as f:
+        if _HAS_FADVISE:
+            _advise(f.fileno(), os.POSIX_FADV_SEQUENTIAL)
+        data = f.read(-1 if max_bytes is None else max_bytes)
+        if _HAS_FADVISE:
+            _advise(f.fileno(), os.POSIX_FADV_DONTNEED)
+    return data
+
+
 def hash_file_metadata(path: Path, length: int = 16) -> str:
     """Hash file metadata (path, size, mtime) for cache invalidation.
 
@@ -13,6 +13,7 @@ from llm_box.cache import (
     generate_cache_key,
     generate_file_key,
     generate_prompt_key,
+    generate_stat_key,
     get_default_cache_path,
     parse_cache_key,
 )
@@ -163,6 +164,19 @@ class TestCacheKeyGeneration:
         key = generate_file_key("cat", "ollama", "llama3", test_file)
         assert key.startswith("cat:ollama:llama3:")
 
+    def test_generate_stat_key(self, temp_dir: Path) -> None:
+        """Test stat-fingerprint key changes when the file is rewritten."""
+        test_file = temp_dir / "code.py"
+        test_file.write_text("def foo(): pass")
+
+        key1 = generate_stat_key("tldr", "ollama", "llama3", test_file)
+        assert key1.startswith("tldr:ollama:llama3:")
+        assert key1 == generate_stat_key("tldr", "ollama", "llama3", test_file)
+
+        test_file.write_text("def foo(): return 1")
+        key2 = generate_stat_key("tldr", "ollama", "llama3", test_file)
+        assert key1 != key2
+
     def test_parse_cache_key(self) -> None:
         """Test parsing a cache key."""
         key = "cat:ollama:llama3:abc123def456"
@@ -228,6 +242,29 @@ class TestDuckDBCache:
         assert retrieved.key == "test:key"
         assert retrieved.response == "Test response"
 
+    def test_set_many(self, memory_cache: DuckDBCache) -> None:
+        """Test storing several entries in one batch."""
+        memory_cache.set_many(
+            [
+                CacheEntry(
+                    key=f"test:key{i}",
+                    command="tldr",
+                    provider="ollama",
+                    model="llama3",
+                    response=f"Response {i}",
+                    metadata={"index": i} if i else {},
+                )
+                for i in range(3)
+            ]
+        )
+
+        assert memory_cache.count() == 3
+        entry = memory_cache.get("test:key2")
+        assert entry is not None
+        assert entry.response == "Response 2"
+        assert entry.metadata == {"index": 2}
+        assert entry.ttl_seconds == memory_cache._default_ttl
+
     def test_get_nonexistent(self, memory_cache: DuckDBCache) -> None:
         """Test getting a nonexistent key."""
         result = memory_cache.get("nonexistent")
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock
 
 import pytest
 
-from llm_box.cache.base import Cache
+from llm_box.cache.base import Cache, CacheEntry
 from llm_box.commands.base import BaseCommand, CommandContext, CommandResult
 from llm_box.commands.registry import CommandRegistry, command
 from llm_box.config.schema import LLMBoxConfig
@@ -226,6 +226,32 @@ class TestCommandContext:
         assert new_ctx.verbose is True
         assert new_ctx.provider is command_context.provider
 
+    def test_queue_cache_write_without_batching(self, command_context: CommandContext):
+        """Test that writes go straight to the cache when not batching."""
+        entry = CacheEntry(
+            key="k", command="tldr", provider="mock", model="m", response="r"
+        )
+        command_context.queue_cache_write(entry)
+
+        command_context.cache.set_many.assert_called_once_with([entry])
+
+    def test_queue_cache_write_with_batching(self, command_context: CommandContext):
+        """Test that queued writes are flushed in a single batch."""
+        command_context.pending_writes = []
+        entries = [
+            CacheEntry(
+                key=f"k{i}", command="tldr", provider="mock", model="m", response="r"
+            )
+            for i in range(3)
+        ]
+        for entry in entries:
+            command_context.queue_cache_write(entry)
+
+        command_context.cache.set_many.assert_not_called()
+        command_context.flush_cache()
+        command_context.cache.set_many.assert_called_once_with(entries)
+        assert command_context.pending_writes == []
+
 
 # --- BaseCommand Tests ---
 
@@ -1,7 +1,13 @@
 """Tests for configuration system."""
 
+import os
+import subprocess
+import sys
 from pathlib import Path
 
+import pytest
+
+from llm_box.config import loader
 from llm_box.config.loader import load_config
 from llm_box.config.schema import LLMBoxConfig, OutputFormat, ProviderType
 
@@ -42,6 +48,16 @@ class TestLLMBoxConfig:
         assert config.providers.openai.default_model == "gpt-4"
         assert config.cache.enabled is False
 
+    def test_schema_imported_lazily(self) -> None:
+        """Test that importing the CLI does not build the config models."""
+        code = (
+            "import sys, llm_box.cli.app; print('llm_box.config.schema' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestConfigLoader:
     """Tests for configuration loader."""
@@ -69,3 +85,42 @@ class TestConfigLoader:
 
         assert not config_path.exists()
         assert config.default_provider == ProviderType.OLLAMA
+
+    def test_load_config_uses_parse_cache(
+        self,
+        config_file: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that the default config is cached and invalidated on change."""
+        cache_path = temp_dir / "config.cache.pkl"
+        monkeypatch.setattr(loader, "DEFAULT_CONFIG_CACHE", cache_path)
+        monkeypatch.setenv("LLMBOX_CONFIG", str(config_file))
+
+        config = load_config()
+        assert cache_path.exists()
+        assert config.cache.default_ttl_seconds == 3600
+
+        # A cache hit returns the same values
+        assert load_config().cache.default_ttl_seconds == 3600
+
+        # Editing the file invalidates the cache
+        config_file.write_text("[cache]\ndefault_ttl_seconds = 60\n")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert load_config().cache.default_ttl_seconds == 60
+
+    def test_load_config_ignores_corrupt_cache(
+        self,
+        config_file: Path,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that a corrupt cache file falls back to parsing the TOML."""
+        cache_path = temp_dir / "config.cache.pkl"
+        cache_path.write_bytes(b"not a pickle")
+        monkeypatch.setattr(loader, "DEFAULT_CONFIG_CACHE", cache_path)
+        monkeypatch.setenv("LLMBOX_CONFIG", str(config_file))
+
+        config = load_config()
+        assert config.cache.default_ttl_seconds == 3600
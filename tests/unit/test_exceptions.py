@@ -1,9 +1,15 @@
 """Tests for exception hierarchy."""
 
+import builtins
+
+import pytest
+
 from llm_box.exceptions import (
     CacheError,
+    CommandError,
     ConfigError,
     ConfigValidationError,
+    FileOrDirNotFoundError,
     LLMBoxError,
     ProviderAuthError,
     ProviderError,
@@ -117,3 +123,13 @@ class TestExceptionHierarchy:
         ]
         for error in errors:
             assert isinstance(error, LLMBoxError)
+
+    def test_file_not_found_does_not_shadow_builtin(self) -> None:
+        """Test the command not-found error keeps the builtin name free."""
+        assert issubclass(FileOrDirNotFoundError, CommandError)
+        assert not issubclass(FileOrDirNotFoundError, builtins.FileNotFoundError)
+
+    def test_subclass_shadowing_builtin_rejected(self) -> None:
+        """Test that defining an error named after a builtin fails."""
+        with pytest.raises(TypeError):
+            type("KeyError", (LLMBoxError,), {})
@@ -0,0 +1,31 @@
+"""Tests for file utilities."""
+
+from pathlib import Path
+
+from llm_box.utils.files import classify_file
+
+
+class TestClassifyFile:
+    """Tests for classify_file."""
+
+    def test_simple_extension(self) -> None:
+        """Test a plain single extension."""
+        assert classify_file(Path("main.py")) == ("Python", False)
+        assert classify_file(Path("README.MD")) == ("Markdown", False)
+
+    def test_compound_extension(self) -> None:
+        """Test that compound extensions win over their last component."""
+        assert classify_file(Path("types.d.ts")) == ("TypeScript declaration", False)
+        assert classify_file(Path("app.min.js")) == ("minified JavaScript", False)
+        assert classify_file(Path("my.app.ts")) == ("TypeScript", False)
+
+    def test_unreadable_extension(self) -> None:
+        """Test binary/unreadable extensions, including compound ones."""
+        assert classify_file(Path("logo.png")) == (None, True)
+        assert classify_file(Path("release.tar.gz")) == (None, True)
+
+    def test_unknown_and_hidden(self) -> None:
+        """Test files without a known extension."""
+        assert classify_file(Path("Makefile")) == (None, False)
+        assert classify_file(Path(".bashrc")) == (None, False)
+        assert classify_file(Path("data.unknownext")) == (None, False)
@@ -8,6 +8,8 @@ from llm_box.utils.hashing import (
     hash_file_metadata,
     hash_for_cache,
     hash_prompt,
+    read_and_hash,
+    read_bytes,
 )
 
 
@@ -68,6 +70,40 @@ class TestHashFile:
         assert hash1 != hash2
 
 
+class TestReadAndHash:
+    """Tests for fused read + hash."""
+
+    def test_read_and_hash(self, temp_dir: Path) -> None:
+        """Test that the bytes read are returned with their hash."""
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes(b"Test content")
+
+        data, digest = read_and_hash(file_path)
+        assert data == b"Test content"
+        assert len(digest) == 16
+        assert read_and_hash(file_path)[1] == digest
+
+    def test_read_and_hash_max_bytes(self, temp_dir: Path) -> None:
+        """Test that only max_bytes are read and hashed."""
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes(b"x" * 200_000)
+
+        data, digest = read_and_hash(file_path, max_bytes=70_000)
+        assert len(data) == 70_000
+
+        prefix_path = temp_dir / "prefix.txt"
+        prefix_path.write_bytes(b"x" * 70_000)
+        assert read_and_hash(prefix_path)[1] == digest
+
+    def test_read_bytes(self, temp_dir: Path) -> None:
+        """Test reading a whole file or a prefix of it."""
+        file_path = temp_dir / "test.txt"
+        file_path.write_bytes(b"Test content")
+
+        assert read_bytes(file_path) == b"Test content"
+        assert read_bytes(file_path, max_bytes=4) == b"Test"
+
+
 class TestHashFileMetadata:
     """Tests for file metadata hashing."""
 
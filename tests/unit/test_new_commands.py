@@ -156,6 +156,145 @@ class TestTldrCommand:
 
         temp_file.unlink()
 
+    def test_execute_no_cache_skips_hash(
+        self, command_context: CommandContext, temp_file: Path
+    ) -> None:
+        """Test that no content hash is computed when caching is disabled."""
+        cmd = TldrCommand()
+        result = cmd.execute(command_context, file=str(temp_file))
+        assert result.success
+        assert result.metadata["content_hash"] is None
+        temp_file.unlink()
+
+    def test_execute_truncates_large_file(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test that only the prompt-sized prefix of a large file is sent."""
+        big_file = temp_dir / "big.txt"
+        big_file.write_text("a" * 20_000 + "TAIL_MARKER")
+
+        cmd = TldrCommand()
+        result = cmd.execute(command_context, file=str(big_file))
+        assert result.success
+
+        prompt = command_context.provider.call_history[-1]["prompt"]
+        assert "content truncated" in prompt
+        assert "TAIL_MARKER" not in prompt
+
+    def test_execute_truncates_multibyte_content_by_characters(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test that truncation counts characters, not bytes."""
+        cjk_file = temp_dir / "cjk.txt"
+        cjk_file.write_text("\u6f22" * 30_000, encoding="utf-8")
+
+        cmd = TldrCommand()
+        result = cmd.execute(command_context, file=str(cjk_file))
+        assert result.success
+
+        prompt = command_context.provider.call_history[-1]["prompt"]
+        assert "\u6f22" * 8000 in prompt
+        assert "\u6f22" * 8001 not in prompt
+        assert "content truncated" in prompt
+
+    def test_execute_non_utf8_file(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test that undecodable bytes are replaced rather than failing."""
+        latin1_file = temp_dir / "latin1.txt"
+        latin1_file.write_bytes(b"caf\xe9 menu\n")
+
+        cmd = TldrCommand()
+        result = cmd.execute(command_context, file=str(latin1_file))
+        assert result.success
+
+        prompt = command_context.provider.call_history[-1]["prompt"]
+        assert "caf\ufffd menu" in prompt
+
+    def test_prompt_static_prefix(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test that prompts for different files share the same prefix."""
+        cmd = TldrCommand()
+        for name in ("main.py", "README.md"):
+            assert cmd.execute(command_context, file=str(temp_dir / name)).success
+
+        first, second = (c["prompt"] for c in command_context.provider.call_history)
+        prefix = first.split("File type:")[0]
+        assert second.startswith(prefix)
+        assert "main.py" not in prefix
+
+    def test_execute_cached_by_stat(
+        self, command_context: CommandContext, temp_file: Path
+    ) -> None:
+        """Test that an unchanged file is served from the stat-fingerprint key."""
+        cmd = TldrCommand()
+        ctx = CommandContext(
+            provider=command_context.provider,
+            cache=command_context.cache,
+            formatter=command_context.formatter,
+            config=command_context.config,
+            use_cache=True,
+        )
+
+        first = cmd.execute(ctx, file=str(temp_file))
+        assert first.success
+        assert not first.cached
+
+        second = cmd.execute(ctx, file=str(temp_file))
+        assert second.cached
+        assert second.data == first.data
+        assert second.metadata["content_hash"] == first.metadata["content_hash"]
+        temp_file.unlink()
+
+    def test_execute_eager_formats(
+        self, mock_formatter: MagicMock, temp_file: Path
+    ) -> None:
+        """Test that one LLM call caches every summary format."""
+        from llm_box.cache import DuckDBCache
+
+        provider = MockProvider(
+            responses={
+                "JSON object": '{"oneline": "One line.", "paragraph": "A paragraph.", '
+                '"bullets": ["First", "Second"]}'
+            }
+        )
+        config = LLMBoxConfig()
+        config.tldr.eager_formats = True
+        ctx = CommandContext(
+            provider=provider,
+            cache=DuckDBCache(db_path=None),
+            formatter=mock_formatter,
+            config=config,
+            use_cache=True,
+        )
+
+        cmd = TldrCommand()
+        result = cmd.execute(ctx, file=str(temp_file), format="bullets")
+        assert result.data == "- First\n- Second"
+        assert provider.call_count == 1
+
+        paragraph = cmd.execute(ctx, file=str(temp_file), format="paragraph")
+        oneline = cmd.execute(ctx, file=str(temp_file), format="oneline")
+        assert paragraph.cached and paragraph.data == "A paragraph."
+        assert oneline.cached and oneline.data == "One line."
+        assert provider.call_count == 1
+        temp_file.unlink()
+
+    def test_execute_eager_formats_invalid_json(
+        self, command_context: CommandContext, temp_file: Path
+    ) -> None:
+        """Test fallback to a single-format call when the response isn't JSON."""
+        command_context.config.tldr.eager_formats = True
+        command_context.use_cache = True
+
+        cmd = TldrCommand()
+        result = cmd.execute(command_context, file=str(temp_file), format="oneline")
+        assert result.success
+        assert result.data
+        assert command_context.provider.call_count == 2
+        temp_file.unlink()
+
 
 class TestWhyCommand:
     """Tests for WhyCommand."""
@@ -191,6 +330,21 @@ class TestWhyCommand:
         assert result.data is not None
         temp_file.unlink()
 
+    def test_execute_previews_multibyte_content_by_characters(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test that the file preview counts characters, not bytes."""
+        cjk_file = temp_dir / "cjk.txt"
+        cjk_file.write_text("\u6f22" * 5000, encoding="utf-8")
+
+        cmd = WhyCommand()
+        result = cmd.execute(command_context, path=str(cjk_file))
+        assert result.success
+
+        prompt = command_context.provider.call_history[-1]["prompt"]
+        assert "\u6f22" * 3000 in prompt
+        assert "\u6f22" * 3001 not in prompt
+
     def test_execute_directory_success(
         self, command_context: CommandContext, temp_dir: Path
     ) -> None:
@@ -200,6 +354,23 @@ class TestWhyCommand:
         assert result.success
         assert result.data is not None
 
+    def test_execute_directory_project_files(
+        self, command_context: CommandContext, temp_dir: Path
+    ) -> None:
+        """Test README and package file detection for a directory."""
+        (temp_dir / "Makefile").write_text("all:\n")
+        (temp_dir / "pyproject.toml").write_text("[project]\n")
+
+        cmd = WhyCommand()
+        result = cmd.execute(command_context, path=str(temp_dir))
+        assert result.success
+        assert result.metadata["has_readme"] is True
+        assert result.metadata["package_files"] == ["pyproject.toml", "Makefile"]
+        assert result.metadata["file_count"] == 5
+
+        prompt = command_context.provider.call_history[-1]["prompt"]
+        assert "A test project for unit tests." in prompt
+
     def test_execute_with_deep_option(
         self, command_context: CommandContext, temp_file: Path
     ) -> None:
@@ -1,7 +1,10 @@
 """Unit tests for output formatters."""
 
 import json
+import subprocess
+import sys
 from io import StringIO
+from pathlib import Path
 
 import pytest
 
@@ -14,6 +17,7 @@ from llm_box.output import (
     RichFormatter,
     get_formatter,
 )
+from llm_box.output.rich_fmt import _scan_markdown_cached
 
 
 class TestOutputData:
@@ -51,6 +55,13 @@ class TestOutputData:
         assert data.title == "Error"
         assert data.content == ""
 
+    def test_default_metadata_is_mutable(self) -> None:
+        """Test that each instance gets its own writable metadata dict."""
+        first = OutputData(content="a")
+        second = OutputData.from_error("b")
+        first.metadata["key"] = "value"
+        assert second.metadata == {}
+
     def test_from_content(self) -> None:
         """Test creating content output data."""
         data = OutputData.from_content(
@@ -170,6 +181,17 @@ class TestPlainFormatter:
         assert "Alice" in result
         assert "Bob" in result
 
+    def test_format_table_alignment(self, formatter: PlainFormatter) -> None:
+        """Test that columns are padded to their widest cell."""
+        rows = [{"name": "Alice", "age": 30}, {"name": "Bob"}]
+        result = formatter.format_table(rows)
+        assert result.split("\n") == [
+            "name   age",
+            "-----  ---",
+            "Alice  30 ",
+            "Bob       ",
+        ]
+
     def test_format_code(self, formatter: PlainFormatter) -> None:
         """Test format_code method."""
         code = "def hello():\n    print('Hello')"
@@ -185,6 +207,18 @@ class TestPlainFormatter:
         formatter.print(data)
         assert "Test output" in stream.getvalue()
 
+    def test_print_matches_format(self) -> None:
+        """Test that print writes exactly format() plus a newline."""
+        for data in [
+            OutputData(content="Test output"),
+            OutputData(content="Body", title="Title"),
+            OutputData(content=["a", "b"]),
+        ]:
+            stream = StringIO()
+            formatter = PlainFormatter(stream=stream)
+            formatter.print(data)
+            assert stream.getvalue() == formatter.format(data) + "\n"
+
 
 class TestJSONFormatter:
     """Tests for JSONFormatter."""
@@ -290,6 +324,18 @@ class TestJSONLinesFormatter:
         assert json.loads(lines[0])["name"] == "Alice"
         assert json.loads(lines[1])["name"] == "Bob"
 
+    def test_format_table_with_title(self, formatter: JSONLinesFormatter) -> None:
+        """Test that a title is added to each row without mutating it."""
+        rows = [{"name": "Alice"}]
+        result = formatter.format_table(rows, title="People")
+        assert json.loads(result) == {"name": "Alice", "_title": "People"}
+        assert rows == [{"name": "Alice"}]
+
+    def test_to_json_edge_values(self, formatter: JSONLinesFormatter) -> None:
+        """Test non-string keys, large ints and unknown types encode."""
+        line = formatter._to_json({1: "one", "big": 2**70, "path": Path("a")})
+        assert json.loads(line) == {"1": "one", "big": 2**70, "path": "a"}
+
 
 class TestRichFormatter:
     """Tests for RichFormatter."""
@@ -309,6 +355,24 @@ class TestRichFormatter:
         result = formatter.format(data)
         assert "Hello, world!" in result
 
+    def test_format_does_not_build_output_console(self) -> None:
+        """Test that format methods only use the string render console."""
+        formatter = RichFormatter()
+        formatter.format(OutputData(content="# Title"))
+        formatter.format_list(["a"])
+        formatter.format_table([{"a": 1}])
+        formatter.format_code("x = 1", language="python")
+        assert formatter._console is None
+
+    def test_format_plain_text_verbatim(self) -> None:
+        """Test that short plain text is returned as-is and long text wraps."""
+        formatter = RichFormatter(width=20)
+        assert formatter.format(OutputData(content="line one\nline two  ")) == (
+            "line one\nline two"
+        )
+        wrapped = formatter.format(OutputData(content="word " * 10))
+        assert len(wrapped.splitlines()) > 1
+
     def test_format_error(self, formatter: RichFormatter) -> None:
         """Test formatting error."""
         data = OutputData.from_error("Something went wrong")
@@ -330,6 +394,29 @@ class TestRichFormatter:
         assert "key" in result
         assert "value" in result
 
+    def test_print_renders_directly(self) -> None:
+        """Test that print does not re-parse rendered text as markup."""
+        stream = StringIO()
+        formatter = RichFormatter(stream=stream, width=60)
+        formatter.print(OutputData(content="[bold]x[/bold] plain", title="T"))
+        assert "[bold]x[/bold] plain" in stream.getvalue()
+
+    def test_print_writes_once(self) -> None:
+        """Test that print hands all renderables to the stream in one write."""
+
+        class CountingStream(StringIO):
+            writes = 0
+
+            def write(self, s: str) -> int:
+                self.writes += 1
+                return super().write(s)
+
+        stream = CountingStream()
+        formatter = RichFormatter(stream=stream, width=60, verbose=True)
+        formatter.print(OutputData(content="body", metadata={"model": "m"}))
+        assert stream.writes == 1
+        assert "body" in stream.getvalue()
+
     def test_format_list(self, formatter: RichFormatter) -> None:
         """Test format_list method."""
         result = formatter.format_list(["apple", "banana"])
@@ -360,6 +447,25 @@ class TestRichFormatter:
         assert formatter._looks_like_markdown("**bold**")
         assert not formatter._looks_like_markdown("plain text")
 
+    def test_markdown_line_markers_need_line_start(
+        self, formatter: RichFormatter
+    ) -> None:
+        """Test that header/list markers only count at the start of a line."""
+        assert formatter._looks_like_markdown("intro\n1. first step")
+        assert formatter._looks_like_markdown("#### Deep header")
+        assert not formatter._looks_like_markdown("a - b > c # d")
+        assert not formatter._looks_like_markdown("line\n" * 40 + "- late item")
+
+    def test_markdown_detection_memoized(self, formatter: RichFormatter) -> None:
+        """Test that short texts are memoized and long texts are not."""
+        _scan_markdown_cached.cache_clear()
+        formatter._looks_like_markdown("# Header")
+        formatter._looks_like_markdown("# Header")
+        assert _scan_markdown_cached.cache_info().hits == 1
+
+        formatter._looks_like_markdown("x" * 10_000)
+        assert _scan_markdown_cached.cache_info().currsize == 1
+
 
 class TestGetFormatter:
     """Tests for get_formatter factory function."""
@@ -390,6 +496,9 @@ class TestGetFormatter:
         formatter = get_formatter("rich")
         assert isinstance(formatter, RichFormatter)
 
+        formatter = get_formatter("JSON")
+        assert isinstance(formatter, JSONFormatter)
+
     def test_get_formatter_with_verbose(self) -> None:
         """Test getting formatter with verbose option."""
         formatter = get_formatter(OutputFormat.PLAIN, verbose=True)
@@ -400,6 +509,18 @@ class TestGetFormatter:
         with pytest.raises(ValueError):
             get_formatter("invalid")
 
+    def test_rich_imported_lazily(self) -> None:
+        """Test that plain output does not import the rich formatter."""
+        code = (
+            "import sys; from llm_box.output import get_formatter; "
+            "get_formatter('plain'); get_formatter('json'); "
+            "print('llm_box.output.rich_fmt' in sys.modules)"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "False"
+
 
 class TestOutputFormatEnum:
     """Tests for OutputFormat enum."""
@@ -1,18 +1,41 @@
 """Unit tests for LLM providers."""
 
+import hashlib
+import sys
+import types
+from collections.abc import Iterator
+from typing import Any
+
 import pytest
 
-from llm_box.exceptions import ProviderNotAvailableError
+from llm_box.exceptions import (
+    ProviderAuthError,
+    ProviderError,
+    ProviderNotAvailableError,
+    ProviderRateLimitError,
+    ProviderTimeoutError,
+)
 from llm_box.providers import (
     EmbeddingResponse,
     FallbackProvider,
     LLMResponse,
     ProviderRegistry,
     ProviderType,
+    ainvoke_with_fallback,
     embed_with_fallback,
     invoke_with_fallback,
 )
-from llm_box.providers.mock import MockProvider
+from llm_box.providers.anthropic import AnthropicProvider, _build_chat_model
+from llm_box.providers.base import (
+    LLMBoxProvider,
+    aembed_documents_in_batches,
+    embed_documents_in_batches,
+)
+from llm_box.providers.fallback import _CIRCUIT_FAILURE_THRESHOLD, _CircuitState
+from llm_box.providers.mock import MockProvider, create_mock_provider
+from llm_box.providers.ollama import OllamaProvider
+from llm_box.providers.openai import OpenAIProvider, _resolve_langchain_openai
+from llm_box.providers.registry import _MAX_CACHED_INSTANCES
 
 
 class TestProviderType:
@@ -64,6 +87,13 @@ class TestLLMResponse:
         assert response.finish_reason == "stop"
         assert response.metadata["usage"]["prompt_tokens"] == 50
 
+    def test_response_has_no_instance_dict(self) -> None:
+        """Test that responses use slots rather than a per-instance __dict__."""
+        response = LLMResponse(content="x", model="m", provider=ProviderType.MOCK)
+        assert not hasattr(response, "__dict__")
+        with pytest.raises(AttributeError):
+            response.extra = 1  # type: ignore[attr-defined]
+
 
 class TestEmbeddingResponse:
     """Tests for EmbeddingResponse dataclass."""
@@ -83,6 +113,54 @@ class TestEmbeddingResponse:
         assert response.tokens_used is None
 
 
+class TestEmbedBatching:
+    """Tests for the batched embedding helpers."""
+
+    @staticmethod
+    def fake_embed(batch: list[str]) -> list[list[float]]:
+        return [[float(len(text))] for text in batch]
+
+    def test_embed_in_batches_keeps_order(self) -> None:
+        """Test that batches are split by size and rejoined in order."""
+        batches: list[list[str]] = []
+
+        def embed(batch: list[str]) -> list[list[float]]:
+            batches.append(batch)
+            return self.fake_embed(batch)
+
+        texts = ["a" * n for n in range(1, 8)]
+        vectors = embed_documents_in_batches(embed, texts, batch_size=3)
+
+        assert vectors == [[float(n)] for n in range(1, 8)]
+        assert sorted(len(b) for b in batches) == [1, 3, 3]
+
+    def test_embed_single_batch_passes_texts_through(self) -> None:
+        """Test that small inputs are sent as one request."""
+        calls: list[list[str]] = []
+
+        def embed(batch: list[str]) -> list[list[float]]:
+            calls.append(batch)
+            return self.fake_embed(batch)
+
+        texts = ["a", "bb"]
+        assert embed_documents_in_batches(embed, texts, batch_size=10) == [
+            [1.0],
+            [2.0],
+        ]
+        assert calls == [texts]
+
+    @pytest.mark.asyncio
+    async def test_aembed_in_batches_keeps_order(self) -> None:
+        """Test that async batches are gathered in input order."""
+
+        async def aembed(batch: list[str]) -> list[list[float]]:
+            return self.fake_embed(batch)
+
+        texts = ["a" * n for n in range(1, 6)]
+        vectors = await aembed_documents_in_batches(aembed, texts, batch_size=2)
+        assert vectors == [[float(n)] for n in range(1, 6)]
+
+
 class TestMockProvider:
     """Tests for MockProvider."""
 
@@ -99,6 +177,23 @@ class TestMockProvider:
         provider = MockProvider(model="custom-model")
         assert provider.model_name == "custom-model"
 
+    def test_record_calls_disabled(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test that call history can be turned off directly or via env."""
+        provider = MockProvider(record_calls=False)
+        provider.invoke("Hello")
+        provider.embed(["text"])
+        assert provider.call_count == 0
+
+        monkeypatch.setenv("LLMBOX_MOCK_NO_HISTORY", "1")
+        provider = create_mock_provider()
+        provider.invoke("Hello")
+        assert provider.call_count == 0
+
+        monkeypatch.setenv("LLMBOX_MOCK_NO_HISTORY", "0")
+        provider = create_mock_provider()
+        provider.invoke("Hello")
+        assert provider.call_count == 1
+
     def test_invoke_returns_deterministic_response(self) -> None:
         """Test that invoke returns deterministic responses."""
         provider = MockProvider()
@@ -127,6 +222,15 @@ class TestMockProvider:
         response = provider.invoke("What's the weather like?")
         assert response.content == "It's sunny today."
 
+    def test_set_responses_replaces_cached_results(self) -> None:
+        """Test that replacing responses is not hidden by the response cache."""
+        provider = MockProvider(responses={"hello": "first"})
+        assert provider.invoke("hello").content == "first"
+        assert provider.invoke("hello").content == "first"
+
+        provider.set_responses({"hello": "second"})
+        assert provider.invoke("hello").content == "second"
+
     def test_invoke_response_fields(self) -> None:
         """Test that invoke returns properly formatted response."""
         provider = MockProvider(model="test-model")
@@ -138,6 +242,14 @@ class TestMockProvider:
         assert response.tokens_used is not None
         assert response.finish_reason == "stop"
 
+    def test_tokens_used_counts_words(self) -> None:
+        """Test that cached responses keep whitespace-split token counts."""
+        provider = MockProvider(responses={"count": "two  words"})
+        prompt = "count\nthese\t words"
+
+        for _ in range(2):
+            assert provider.invoke(prompt).tokens_used == 5
+
     def test_call_history_tracking(self) -> None:
         """Test that calls are tracked in history."""
         provider = MockProvider()
@@ -184,6 +296,13 @@ class TestMockProvider:
         response2 = provider.embed(["same text"])
         assert response1.embeddings == response2.embeddings
 
+    def test_embed_values_follow_hash_bytes(self) -> None:
+        """Test that each lane is its (repeated) SHA-256 byte scaled to [-1, 1]."""
+        provider = MockProvider(embedding_dimensions=40)
+        digest = hashlib.sha256(b"text").digest()
+        expected = [(b - 128) / 128.0 for b in (digest * 2)[:40]]
+        assert provider.embed(["text"]).embeddings[0] == expected
+
     def test_embed_different_texts_different_embeddings(self) -> None:
         """Test that different texts get different embeddings."""
         provider = MockProvider()
@@ -215,6 +334,26 @@ class TestMockProvider:
         assert provider.call_count == 1
         assert provider.call_history[0]["method"] == "astream"
 
+    @pytest.mark.asyncio
+    async def test_default_astream_chunks_response(self) -> None:
+        """Test the base astream yields the ainvoke response in pieces."""
+        content = "x" * 1200
+        provider = MockProvider(responses={"": content})
+        chunks = [c async for c in LLMBoxProvider.astream(provider, "Stream")]
+
+        assert [len(c) for c in chunks] == [512, 512, 176]
+        assert "".join(chunks) == content
+        assert provider.call_history[0]["method"] == "ainvoke"
+
+    @pytest.mark.asyncio
+    async def test_aembed_matches_embed(self) -> None:
+        """Test that async embedding returns the same vectors as embed."""
+        provider = MockProvider()
+        response = await provider.aembed(["text one", "text two"])
+        assert (
+            response.embeddings == provider.embed(["text one", "text two"]).embeddings
+        )
+
     def test_health_check(self) -> None:
         """Test health check always returns True for mock."""
         provider = MockProvider()
@@ -307,6 +446,34 @@ class TestProviderRegistry:
         response = provider.embed(["test"])
         assert response.dimensions == 256
 
+    def test_cache_key_handles_unhashable_kwargs(self) -> None:
+        """Test that unhashable kwargs are cached by value and kept distinct."""
+        key = ProviderRegistry._build_cache_key(
+            ProviderType.MOCK, "test", responses={"hi": "there"}
+        )
+        assert key == ProviderRegistry._build_cache_key(
+            ProviderType.MOCK, "test", responses={"hi": "there"}
+        )
+        assert key != ProviderRegistry._build_cache_key(
+            ProviderType.MOCK, "test", responses=repr({"hi": "there"})
+        )
+
+        provider1 = ProviderRegistry.get(ProviderType.MOCK, responses={"hi": "a"})
+        provider2 = ProviderRegistry.get(ProviderType.MOCK, responses={"hi": "a"})
+        assert provider1 is provider2
+
+    def test_cache_evicts_least_recently_used(self) -> None:
+        """Test that the instance cache is bounded and keeps recent providers."""
+        first = ProviderRegistry.get(ProviderType.MOCK, model="model-0")
+        for i in range(1, _MAX_CACHED_INSTANCES + 1):
+            # Reusing the first provider keeps it from being evicted
+            assert ProviderRegistry.get(ProviderType.MOCK, model="model-0") is first
+            ProviderRegistry.get(ProviderType.MOCK, model=f"model-{i}")
+
+        assert ProviderRegistry.get_cached_count() == _MAX_CACHED_INSTANCES
+        assert ProviderRegistry.get(ProviderType.MOCK, model="model-0") is first
+        assert ProviderRegistry.get_cached_count() == _MAX_CACHED_INSTANCES
+
 
 class TestFallbackLogic:
     """Tests for multi-provider fallback."""
@@ -373,6 +540,73 @@ class TestFallbackProvider:
         response = fallback.invoke("hello")
         assert response.content == "Hi from primary"
 
+    def test_fallback_circuit_skips_failing_provider(self) -> None:
+        """Test that repeated failures open the primary's circuit."""
+        primary = MockProvider()
+        calls: list[str] = []
+
+        def fail(prompt: str, **kwargs: Any) -> LLMResponse:
+            calls.append(prompt)
+            raise ProviderTimeoutError("timed out")
+
+        primary.invoke = fail  # type: ignore[method-assign]
+        fallback = FallbackProvider([primary, MockProvider(responses={"": "ok"})])
+
+        for _ in range(_CIRCUIT_FAILURE_THRESHOLD + 3):
+            assert fallback.invoke("hello").content == "ok"
+        assert len(calls) == _CIRCUIT_FAILURE_THRESHOLD
+
+    def test_fallback_circuit_auth_error_and_probe(self) -> None:
+        """Test that auth errors trip at once and cooldown allows a probe."""
+        primary = MockProvider(responses={"": "primary"})
+        original_invoke = primary.invoke
+
+        def fail(prompt: str, **kwargs: Any) -> LLMResponse:
+            raise ProviderAuthError("bad key")
+
+        primary.invoke = fail  # type: ignore[method-assign]
+        fallback = FallbackProvider([primary, MockProvider(responses={"": "ok"})])
+        fallback.invoke("hello")
+        circuit = fallback._circuits[id(primary)]
+        assert circuit.state == "open"
+
+        # After the cooldown a successful probe closes the circuit again
+        primary.invoke = original_invoke  # type: ignore[method-assign]
+        circuit.opened_at -= circuit.cooldown
+        assert fallback.invoke("hello").content == "primary"
+        assert circuit.state == "closed"
+
+    def test_circuit_half_open_allows_single_probe(self) -> None:
+        """Test that only one caller probes a half-open circuit."""
+        circuit = _CircuitState()
+        circuit.record_failure(ProviderAuthError("bad key"))
+        circuit.opened_at -= circuit.cooldown
+
+        assert circuit.allow() is True
+        assert circuit.state == "half_open"
+        assert circuit.allow() is False
+
+        # A probe that never reports back is retried after another cooldown
+        circuit.opened_at -= circuit.cooldown
+        assert circuit.allow() is True
+        circuit.record_success()
+        assert circuit.allow() is True
+
+    def test_fallback_all_circuits_open_raises(self) -> None:
+        """Test that skipped providers are reported in the error."""
+        primary = MockProvider()
+        fallback = FallbackProvider([primary])
+        fallback._circuits[id(primary)].record_failure(ProviderAuthError("x"))
+
+        with pytest.raises(ProviderError, match="circuit open") as first:
+            fallback.invoke("hello")
+        assert primary.call_count == 0
+
+        # Each error gets its own cause rather than a shared instance
+        with pytest.raises(ProviderError) as second:
+            fallback.invoke("hello")
+        assert first.value.causes[0][1] is not second.value.causes[0][1]
+
     @pytest.mark.asyncio
     async def test_fallback_ainvoke(self) -> None:
         """Test async invoke through fallback provider."""
@@ -382,6 +616,51 @@ class TestFallbackProvider:
         response = await fallback.ainvoke("async test")
         assert "Async response" in response.content or "hash:" in response.content
 
+    @pytest.mark.asyncio
+    async def test_fallback_ainvoke_hedges_slow_provider(self) -> None:
+        """Test that a slow primary is raced against the next provider."""
+        slow = MockProvider(responses={"": "slow"}, latency_ms=2000)
+        fast = MockProvider(responses={"": "fast"})
+        fallback = FallbackProvider([slow, fast], hedge_delay=0.01)
+
+        response = await fallback.ainvoke("hello")
+        assert response.content == "fast"
+        assert slow.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_fallback_ainvoke_does_not_hedge_by_default(self) -> None:
+        """Test that a slow primary is not raced unless hedging is enabled."""
+        slow = MockProvider(responses={"": "slow"}, latency_ms=50)
+        fast = MockProvider(responses={"": "fast"})
+        fallback = FallbackProvider([slow, fast])
+        assert fallback._hedge_delay is None
+
+        response = await fallback.ainvoke("hello")
+        assert response.content == "slow"
+        assert fast.call_count == 0
+
+    @pytest.mark.asyncio
+    async def test_fallback_ainvoke_failure_moves_on(self) -> None:
+        """Test that a failed provider hands over without waiting."""
+        primary = MockProvider()
+
+        async def fail(prompt: str, **kwargs: Any) -> LLMResponse:
+            raise ProviderTimeoutError("timed out")
+
+        primary.ainvoke = fail  # type: ignore[method-assign]
+        secondary = MockProvider(responses={"": "ok"})
+
+        response = await ainvoke_with_fallback(
+            [primary, secondary], "hello", hedge_delay=None
+        )
+        assert response.content == "ok"
+
+        with pytest.raises(ProviderError, match="timed out") as exc_info:
+            await ainvoke_with_fallback([primary], "hello")
+        [(name, cause)] = exc_info.value.causes
+        assert name == "mock"
+        assert isinstance(cause, ProviderTimeoutError)
+
     def test_fallback_supports_streaming_is_false(self) -> None:
         """Test that fallback provider doesn't support streaming."""
         provider = MockProvider()
@@ -405,6 +684,21 @@ class TestFallbackProvider:
         assert len(response.embeddings) == 1
         assert len(response.embeddings[0]) == 32
 
+    def test_fallback_embed_skips_providers_without_embeddings(self) -> None:
+        """Test that only embedding-capable providers are tried for embed."""
+        chat_only = AnthropicProvider(api_key="key")
+        embedder = MockProvider()
+
+        def fail(texts: list[str], **kwargs: Any) -> EmbeddingResponse:
+            raise ProviderError("down")
+
+        embedder.embed = fail  # type: ignore[method-assign]
+
+        with pytest.raises(ProviderError) as exc_info:
+            FallbackProvider([chat_only, embedder]).embed(["text"])
+        assert [name for name, _ in exc_info.value.causes] == ["mock"]
+        assert FallbackProvider([chat_only]).supports_embeddings is False
+
     def test_fallback_repr(self) -> None:
         """Test string representation of fallback provider."""
         provider1 = MockProvider()
@@ -414,3 +708,179 @@ class TestFallbackProvider:
         repr_str = repr(fallback)
         assert "FallbackProvider" in repr_str
         assert "mock" in repr_str
+
+
+class TestOpenAIProvider:
+    """Tests for OpenAIProvider without langchain-openai installed."""
+
+    def test_missing_langchain_openai_raises_provider_error(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test that a missing integration is reported once and cached."""
+        monkeypatch.setitem(sys.modules, "langchain_openai", None)
+        _resolve_langchain_openai.cache_clear()
+        try:
+            provider = OpenAIProvider(api_key="key")
+            for _ in range(2):
+                with pytest.raises(ProviderError, match="langchain-openai"):
+                    provider._get_chat_model()
+            assert _resolve_langchain_openai.cache_info().misses == 1
+        finally:
+            _resolve_langchain_openai.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Invalid API key provided", ProviderAuthError),
+            ("timeout while authentication", ProviderAuthError),
+            ("Error code: 429", ProviderRateLimitError),
+            ("Read Timeout", ProviderTimeoutError),
+            ("boom", ProviderError),
+        ],
+    )
+    def test_handle_error_classification(
+        self, message: str, expected: type[Exception]
+    ) -> None:
+        """Test that errors map to provider errors in priority order."""
+        provider = OpenAIProvider(api_key="key")
+        with pytest.raises(expected) as exc_info:
+            provider._handle_error(RuntimeError(message))
+        assert type(exc_info.value) is expected
+
+
+class TestOllamaProvider:
+    """Tests for OllamaProvider error handling."""
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Connection refused", ProviderNotAvailableError),
+            ("timeout after connection reset", ProviderNotAvailableError),
+            ("read TIMEOUT", ProviderTimeoutError),
+            ("boom", ProviderError),
+        ],
+    )
+    def test_handle_error_classification(
+        self, message: str, expected: type[Exception]
+    ) -> None:
+        """Test that errors map to provider errors in priority order."""
+        provider = OllamaProvider()
+        with pytest.raises(expected) as exc_info:
+            provider._handle_error(RuntimeError(message))
+        assert type(exc_info.value) is expected
+
+
+class TestAnthropicProvider:
+    """Tests for AnthropicProvider (with a stubbed langchain_anthropic)."""
+
+    @pytest.fixture(autouse=True)
+    def fake_langchain_anthropic(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> Iterator[None]:
+        """Install a stand-in langchain_anthropic module."""
+
+        class ChatAnthropic:
+            def __init__(self, **kwargs: Any) -> None:
+                self.kwargs = kwargs
+
+            def invoke(self, prompt: str, **kwargs: Any) -> Any:
+                return types.SimpleNamespace(
+                    content=f"echo: {prompt}",
+                    usage_metadata={"total_tokens": 7},
+                    response_metadata=None,
+                )
+
+            async def astream(self, prompt: str, **kwargs: Any) -> Any:
+                for piece in ("", "echo", "", ": ", prompt, ""):
+                    yield types.SimpleNamespace(content=piece)
+
+        monkeypatch.setitem(
+            sys.modules,
+            "langchain_anthropic",
+            types.SimpleNamespace(ChatAnthropic=ChatAnthropic),
+        )
+        _build_chat_model.cache_clear()
+        yield
+        _build_chat_model.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_astream_skips_empty_chunks(self) -> None:
+        """Test that empty content chunks are not yielded."""
+        provider = AnthropicProvider(api_key="key")
+        chunks = [c async for c in provider.astream("hi")]
+        assert chunks == ["echo", ": ", "hi"]
+
+    def test_chat_model_shared_for_equal_config(self) -> None:
+        """Test that equally configured providers share one client."""
+        first = AnthropicProvider(api_key="key", temperature=0.2)
+        second = AnthropicProvider(api_key="key", temperature=0.2)
+        other = AnthropicProvider(api_key="key", temperature=0.5)
+
+        assert first._get_chat_model() is second._get_chat_model()
+        assert first._get_chat_model() is not other._get_chat_model()
+        assert first._get_chat_model().kwargs["temperature"] == 0.2
+
+    def test_chat_model_unhashable_options(self) -> None:
+        """Test that unhashable extra options still build a client."""
+        provider = AnthropicProvider(api_key="key", model_kwargs={"top_k": 5})
+        chat = provider._get_chat_model()
+        assert chat.kwargs["model_kwargs"] == {"top_k": 5}
+
+    def test_invoke_reads_response_metadata(self) -> None:
+        """Test token usage and missing response metadata are handled."""
+        response = AnthropicProvider(api_key="key").invoke("hi")
+        assert response.content == "echo: hi"
+        assert response.tokens_used == 7
+        assert response.finish_reason is None
+
+    def test_health_check_lists_models(self) -> None:
+        """Test that the health check lists models instead of prompting."""
+        provider = AnthropicProvider(api_key="key")
+        chat = provider._get_chat_model()
+        calls: list[dict[str, Any]] = []
+        chat._client = types.SimpleNamespace(
+            models=types.SimpleNamespace(list=lambda **kw: calls.append(kw))
+        )
+        chat.invoke = None  # a prompt would fail the check
+
+        assert provider.health_check() is True
+        assert calls == [{"limit": 1}]
+
+    def test_health_check_falls_back_to_invoke(self) -> None:
+        """Test that a chat model without a client is probed with a prompt."""
+        assert AnthropicProvider(api_key="key").health_check() is True
+
+    @pytest.mark.asyncio
+    async def test_aembed_uses_fallback(self) -> None:
+        """Test that async embeddings are delegated to the fallback provider."""
+        fallback = MockProvider(embedding_dimensions=8)
+        provider = AnthropicProvider(api_key="key", embeddings_fallback=fallback)
+        response = await provider.aembed(["text"])
+        assert response.dimensions == 8
+        assert response.embeddings == fallback.embed(["text"]).embeddings
+
+    @pytest.mark.asyncio
+    async def test_aembed_without_fallback(self) -> None:
+        """Test that async embeddings need a fallback provider."""
+        with pytest.raises(NotImplementedError):
+            await AnthropicProvider(api_key="key").aembed(["text"])
+
+    @pytest.mark.parametrize(
+        ("message", "expected"),
+        [
+            ("Authentication failed", ProviderAuthError),
+            ("key is invalid", ProviderAuthError),
+            ("Timeout after rate limit", ProviderRateLimitError),
+            ("HTTP 429", ProviderRateLimitError),
+            ("Request timeout", ProviderTimeoutError),
+            ("boom", ProviderError),
+        ],
+    )
+    def test_handle_error_classification(
+        self, message: str, expected: type[Exception]
+    ) -> None:
+        """Test that errors map to provider errors in priority order."""
+        provider = AnthropicProvider(api_key="key")
+        with pytest.raises(expected) as exc_info:
+            provider._handle_error(RuntimeError(message))
+        assert type(exc_info.value) is expected
@@ -1,8 +1,14 @@
 """Tests for search functionality."""
 
+import os
 import tempfile
 from pathlib import Path
+from typing import Any
+from unittest.mock import patch
 
+import pytest
+
+from llm_box.providers.mock import MockProvider
 from llm_box.search import (
     FileIndexer,
     FileInfo,
@@ -13,6 +19,7 @@ from llm_box.search import (
     SemanticSearch,
     TextChunk,
 )
+from llm_box.search.semantic import unit_vector
 
 
 class TestFileIndexer:
@@ -250,6 +257,22 @@ class TestSemanticSearch:
         result = search.embed_query("test query")
         assert result is None
 
+    def test_embed_query_cached(self) -> None:
+        """Test that repeated queries reuse the cached embedding."""
+        provider = MockProvider()
+        search = SemanticSearch(provider=provider)
+
+        first = search.embed_query("test query")
+        assert search.embed_query("test query") == first
+        assert provider.call_count == 1
+
+        # A new provider starts with an empty cache
+        other = MockProvider(embedding_dimensions=64)
+        search.set_provider(other)
+        result = search.embed_query("test query")
+        assert result is not None and len(result) == 64
+        assert other.call_count == 1
+
     def test_search_with_embedding(self) -> None:
         """Test search with pre-computed embedding."""
         search = SemanticSearch(min_score=0.5)
@@ -278,6 +301,33 @@ class TestSemanticSearch:
         assert len(results) >= 1
         assert results[0].file_path == "/path/a.py"
 
+    def test_search_with_normalized_embeddings(self) -> None:
+        """Test that unit-length chunk embeddings score like cosine similarity."""
+        search = SemanticSearch(min_score=0.0)
+        query_embedding = [3.0, 4.0]
+        raw = [[1.0, 1.0], [0.0, 2.0], [5.0, 0.0]]
+        chunks = [
+            {"file_path": f"/path/{i}.py", "filename": f"{i}.py", "embedding": vec}
+            for i, vec in enumerate(raw)
+        ]
+        unit_chunks = [
+            {**chunk, "embedding": unit_vector(chunk["embedding"])} for chunk in chunks
+        ]
+
+        expected = search.search_with_embedding(query_embedding, chunks)
+        results = search.search_with_embedding(
+            query_embedding, unit_chunks, normalized=True
+        )
+
+        assert [r.file_path for r in results] == [r.file_path for r in expected]
+        for result, reference in zip(results, expected, strict=True):
+            assert abs(result.similarity_score - reference.similarity_score) < 1e-9
+
+    def test_unit_vector_zero(self) -> None:
+        """Test that zero and empty vectors cannot be normalized."""
+        assert unit_vector([0.0, 0.0]) is None
+        assert unit_vector([]) is None
+
 
 class TestSearchEngine:
     """Tests for SearchEngine class."""
@@ -351,6 +401,320 @@ class TestSearchEngine:
 
             engine.close()
 
+    def test_index_directory_batches_embeddings(self) -> None:
+        """Test that chunks from many files share one embedding call."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(5):
+                Path(tmpdir, f"module_{i}.py").write_text(f"value = {i}")
+
+            provider = MockProvider(embedding_dimensions=8)
+            engine = SearchEngine(db_path=None, provider=provider)
+            stats = engine.index_directory(Path(tmpdir))
+
+            embed_calls = [c for c in provider.call_history if c["method"] == "embed"]
+            assert len(embed_calls) == 1
+            assert stats.total_chunks == 5
+            assert engine.get_index_stats()["total_chunks"] == 5
+
+            # Each row holds its own chunk's text and embedding
+            rows = (
+                engine._get_connection()
+                .execute(
+                    "SELECT chunk_text, embedding FROM embeddings ORDER BY chunk_text"
+                )
+                .fetchall()
+            )
+            assert [text for text, _ in rows] == [f"value = {i}" for i in range(5)]
+            for text, embedding in rows:
+                expected = provider.embed([text]).embeddings[0]
+                assert all(
+                    abs(a - b) < 1e-6 for a, b in zip(embedding, expected, strict=True)
+                )
+
+            # Re-embedding replaces a file's chunks instead of adding to them
+            engine.index_directory(Path(tmpdir), force_reindex=True)
+            assert engine.get_index_stats()["total_chunks"] == 5
+
+            engine.close()
+
+    def test_index_directory_updates_changed_files(self) -> None:
+        """Test that changed files are rewritten within the batch transaction."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+            Path(tmpdir, "b.py").write_text("b = 1")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            engine.index_directory(Path(tmpdir))
+            Path(tmpdir, "a.py").write_text("a = 2")
+            stats = engine.index_directory(Path(tmpdir))
+
+            assert stats.files_updated == 1
+            assert stats.files_unchanged == 1
+            assert engine.get_index_stats()["total_chunks"] == 2
+
+            engine.close()
+
+    def test_index_directory_failed_file_keeps_batch(self) -> None:
+        """Test that one failing file doesn't undo the rest of its batch."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(6):
+                Path(tmpdir, f"f{i}.py").write_text(f"x = {i}")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            original_index_file = engine._index_file
+
+            def index_file(conn: Any, file_info: FileInfo, *args: Any) -> Any:
+                if file_info.filename == "f3.py":
+                    conn.execute("SELECT * FROM no_such_table")
+                return original_index_file(conn, file_info, *args)
+
+            engine._index_file = index_file  # type: ignore[method-assign]
+            stats = engine.index_directory(Path(tmpdir))
+
+            assert stats.errors == 1
+            assert stats.error_details[0][0].endswith("f3.py")
+            assert stats.files_indexed == 5
+            assert stats.total_chunks == 5
+            index_stats = engine.get_index_stats()
+            assert index_stats["total_files"] == 5
+            assert index_stats["total_chunks"] == 5
+
+            engine.close()
+
+    def test_reindex_unchanged_files_in_one_query(self) -> None:
+        """Test that unchanged files are recognized without per-file queries."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(5):
+                Path(tmpdir, f"f{i}.py").write_text(f"x = {i}")
+
+            engine = SearchEngine(db_path=None)
+            engine.index_directory(Path(tmpdir), generate_embeddings=False)
+
+            conn = engine._get_connection()
+            statements: list[str] = []
+
+            class CountingConnection:
+                def execute(self, sql: str, *args: Any) -> Any:
+                    statements.append(sql)
+                    return conn.execute(sql, *args)
+
+                def __getattr__(self, name: str) -> Any:
+                    return getattr(conn, name)
+
+            engine._conn = CountingConnection()  # type: ignore[assignment]
+            stats = engine.index_directory(Path(tmpdir), generate_embeddings=False)
+            engine._conn = conn
+
+            assert stats.files_unchanged == 5
+            assert len(statements) == 1
+
+            engine.close()
+
+    def test_reindex_skips_reading_unchanged_files(self) -> None:
+        """Test that files with the indexed size and mtime are not read."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+            Path(tmpdir, "b.py").write_text("b = 1")
+
+            engine = SearchEngine(db_path=None)
+            engine.index_directory(Path(tmpdir), generate_embeddings=False)
+
+            # Same size, new mtime: read and hashed again, but unchanged
+            os.utime(Path(tmpdir, "b.py"), (0, 0))
+            with patch.object(
+                engine.indexer,
+                "_read_file_content",
+                wraps=engine.indexer._read_file_content,
+            ) as read:
+                stats = engine.index_directory(Path(tmpdir), generate_embeddings=False)
+            assert read.call_count == 1
+            assert stats.files_unchanged == 2
+
+            # Forced re-indexing reads every file
+            stats = engine.index_directory(
+                Path(tmpdir), force_reindex=True, generate_embeddings=False
+            )
+            assert stats.files_updated == 2
+
+            engine.close()
+
+    def test_index_directory_failed_embedding_batch(self) -> None:
+        """Test that files whose embeddings fail to store are retried later."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+            Path(tmpdir, "b.py").write_text("b = 1")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            original_write = engine._write_embeddings
+
+            def fail(*args: Any, **kwargs: Any) -> int:
+                raise RuntimeError("disk full")
+
+            engine._write_embeddings = fail  # type: ignore[method-assign]
+            stats = engine.index_directory(Path(tmpdir))
+
+            assert stats.errors == 2
+            assert stats.total_chunks == 0
+            assert engine.get_index_stats()["total_files"] == 2
+
+            # The files are indexed again, embeddings included, next time
+            engine._write_embeddings = original_write  # type: ignore[method-assign]
+            stats = engine.index_directory(Path(tmpdir))
+            assert stats.files_updated == 2
+            assert stats.total_chunks == 2
+
+            engine.close()
+
+    def test_index_directory_embedding_provider_failure(self) -> None:
+        """Test that files are retried when the provider returns no embeddings."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+            Path(tmpdir, "b.py").write_text("b = 1")
+
+            provider = MockProvider()
+            engine = SearchEngine(db_path=None, provider=provider)
+            with patch.object(
+                provider, "embed", side_effect=RuntimeError("429 rate limit")
+            ):
+                stats = engine.index_directory(Path(tmpdir))
+
+            assert stats.errors == 2
+            assert stats.total_chunks == 0
+
+            stats = engine.index_directory(Path(tmpdir))
+            assert stats.errors == 0
+            assert stats.files_updated == 2
+            assert engine.get_index_stats()["total_chunks"] == 2
+
+            engine.close()
+
+    def test_index_directory_interrupted_between_batches(self) -> None:
+        """Test that an interrupt while awaiting embeddings propagates as is."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+            Path(tmpdir, "b.py").write_text("b = 1")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+
+            def interrupt(*args: Any) -> None:
+                raise KeyboardInterrupt
+
+            engine._store_batch = interrupt  # type: ignore[method-assign]
+            with (
+                patch("llm_box.search.engine._EMBED_BATCH_SIZE", 1),
+                patch("llm_box.search.engine._EMBED_MAX_IN_FLIGHT", 1),
+                pytest.raises(KeyboardInterrupt),
+            ):
+                engine.index_directory(Path(tmpdir))
+
+            engine.close()
+
+    def test_search_semantic_mode(self) -> None:
+        """Test semantic search over cached chunks, refreshed on reindex."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "alpha.py").write_text("alpha = 1")
+            Path(tmpdir, "notes.md").write_text("beta = 2")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            engine.index_directory(Path(tmpdir))
+
+            response = engine.search("alpha = 1", mode=SearchMode.SEMANTIC)
+            assert response.results[0].filename == "alpha.py"
+            assert abs(response.results[0].score - 1.0) < 1e-6
+
+            # Cached embeddings are compact float32 arrays
+            chunks = engine._get_indexed_chunks(engine._get_connection())
+            assert all(chunk["embedding"].typecode == "f" for chunk in chunks)
+
+            response = engine.search(
+                "alpha = 1", mode=SearchMode.SEMANTIC, extensions=[".md"]
+            )
+            assert all(r.filename == "notes.md" for r in response.results)
+
+            Path(tmpdir, "gamma.py").write_text("gamma = 3")
+            engine.index_directory(Path(tmpdir))
+            response = engine.search("gamma = 3", mode=SearchMode.SEMANTIC)
+            assert response.results[0].filename == "gamma.py"
+
+            engine.close()
+
+    def test_chunk_cache_loads_in_batches(self) -> None:
+        """Test that every chunk is loaded when rows arrive in several batches."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for i in range(5):
+                Path(tmpdir, f"module_{i}.py").write_text(f"value = {i}")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            engine.index_directory(Path(tmpdir))
+
+            with patch("llm_box.search.engine._CHUNK_FETCH_SIZE", 2):
+                chunks = engine._get_indexed_chunks(engine._get_connection())
+            assert sorted(c["chunk_text"] for c in chunks) == [
+                f"value = {i}" for i in range(5)
+            ]
+
+            engine.close()
+
+    def test_indexed_files_cached_until_index_changes(self) -> None:
+        """Test that file listings are reused until the index is written."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+
+            engine = SearchEngine(db_path=None)
+            engine.index_directory(Path(tmpdir), generate_embeddings=False)
+            conn = engine._get_connection()
+
+            files = engine._get_indexed_files(conn, tmpdir, [".py"])
+            assert engine._get_indexed_files(conn, tmpdir, [".py"]) is files
+            assert engine._get_indexed_files(conn, tmpdir) is not files
+
+            Path(tmpdir, "b.py").write_text("b = 1")
+            engine.index_directory(Path(tmpdir), generate_embeddings=False)
+            files = engine._get_indexed_files(conn, tmpdir, [".py"])
+            assert sorted(f["filename"] for f in files) == ["a.py", "b.py"]
+
+            engine.clear_index()
+            assert engine._get_indexed_files(conn, tmpdir, [".py"]) == []
+
+            engine.close()
+
+    def test_search_path_resolved_once(self) -> None:
+        """Test that search path filters are resolved once per index state."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            Path(tmpdir, "a.py").write_text("a = 1")
+
+            engine = SearchEngine(db_path=None)
+            engine.index_directory(Path(tmpdir), generate_embeddings=False)
+            relative = os.path.relpath(tmpdir)
+
+            with patch.object(Path, "resolve", autospec=True) as resolve:
+                resolve.side_effect = lambda p: Path(os.path.realpath(p))
+                engine.search("a", path=relative, mode=SearchMode.FUZZY)
+                response = engine.search("a", path=relative, mode=SearchMode.FUZZY)
+            assert resolve.call_count == 1
+            assert response.results[0].filename == "a.py"
+
+            engine.close()
+
+    def test_search_combined_mode_top_k(self) -> None:
+        """Test that combined search returns the best fused scores in order."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("config.py", "config_loader.py", "configure.py", "main.py"):
+                Path(tmpdir, name).write_text(f"# {name}")
+
+            engine = SearchEngine(db_path=None, provider=MockProvider())
+            engine.index_directory(Path(tmpdir))
+
+            response = engine.search("# config.py", mode=SearchMode.COMBINED, top_k=2)
+
+            assert len(response.results) == 2
+            assert response.results[0].filename == "config.py"
+            scores = [r.score for r in response.results]
+            assert scores == sorted(scores, reverse=True)
+            assert all(r.match_type == "combined" for r in response.results)
+
+            engine.close()
+
     def test_search_fuzzy_mode(self) -> None:
         """Test fuzzy search mode."""
         with tempfile.TemporaryDirectory() as tmpdir:
@@ -371,6 +735,8 @@ class TestSearchEngine:
             # Should find config.py
             if response.results:
                 assert any("config" in r.filename for r in response.results)
+                # File metadata is joined onto each hit
+                assert all(r.language == "python" for r in response.results)
 
             engine.close()
 